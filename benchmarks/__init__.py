@@ -0,0 +1 @@
+"""Benchmarks for the OVO Energy API client."""
@@ -0,0 +1,318 @@
+"""Benchmark client workloads against a local fake OVO Energy API.
+
+Measures throughput, request latency percentiles and peak memory for a
+single account, a date range and many accounts, and writes a JSON report
+that can be compared across releases.
+
+Run with `python -m benchmarks.client_workloads --output report.json`.
+"""
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime, timedelta
+from importlib.metadata import PackageNotFoundError, version
+import json
+import platform
+import sys
+from time import perf_counter
+import tracemalloc
+from typing import Any
+
+from ovoenergy import OVOEnergy
+from ovoenergy.decoders import get_decoder
+from ovoenergy.fleet import OVOEnergyFleet
+from ovoenergy.metrics import OVOMetrics
+from ovoenergy.models import OVOHalfHourUsage
+from ovoenergy.retry import OVOTokenBucket
+
+from .fake_api import FakeOVOApi, FakeOVOSession
+
+START = date(2024, 1, 1)
+PASSWORD = "benchmark"
+
+# Set up a workload, returning the coroutine function to measure, which
+# returns the number of usage rows it fetched
+Workload = Callable[
+    [FakeOVOSession, OVOMetrics, argparse.Namespace],
+    Awaitable[Callable[[], Awaitable[int]]],
+]
+
+
+class _LatencyRecorder(OVOMetrics):
+    """Record the duration of every request attempt."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.durations: list[float] = []
+
+    def request(
+        self,
+        endpoint: str,
+        method: str,
+        status: int | None,
+        duration: float,
+        bytes_received: int,
+    ) -> None:
+        """Record one HTTP attempt."""
+        self.durations.append(duration)
+
+
+def _rows(usage: OVOHalfHourUsage) -> int:
+    """Return the number of half hour rows for both fuels."""
+    return len(usage.electricity or []) + len(usage.gas or [])
+
+
+def _percentile(values: list[float], percentile: float) -> float:
+    """Return a nearest rank percentile of sorted values."""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, round(percentile / 100 * len(values)) - 1))
+    return values[index]
+
+
+def _rate_limiters(args: argparse.Namespace) -> dict[str, OVOTokenBucket] | None:
+    """Return no rate limiters, unless the client defaults were asked for."""
+    return None if args.rate_limits else {}
+
+
+async def _client(
+    session: FakeOVOSession,
+    metrics: OVOMetrics,
+    args: argparse.Namespace,
+) -> OVOEnergy:
+    """Return a logged in client."""
+    client = OVOEnergy(
+        client_session=session,  # type: ignore[arg-type]
+        rate_limiters=_rate_limiters(args),
+        metrics=metrics,
+    )
+    await client.authenticate("single", PASSWORD)
+    await client.bootstrap_accounts()
+    return client
+
+
+async def _single(
+    session: FakeOVOSession,
+    metrics: OVOMetrics,
+    args: argparse.Namespace,
+) -> Callable[[], Awaitable[int]]:
+    """Fetch one day of half hourly usage at a time, one after another."""
+    client = await _client(session, metrics, args)
+
+    async def run() -> int:
+        rows = 0
+        for day in range(args.iterations):
+            usage = await client.get_half_hourly_usage(
+                (START + timedelta(days=day)).isoformat()
+            )
+            rows += _rows(usage)
+        return rows
+
+    return run
+
+
+async def _range(
+    session: FakeOVOSession,
+    metrics: OVOMetrics,
+    args: argparse.Namespace,
+) -> Callable[[], Awaitable[int]]:
+    """Fetch a range of days of half hourly usage concurrently."""
+    client = await _client(session, metrics, args)
+
+    async def run() -> int:
+        return _rows(
+            await client.get_half_hourly_usage_range(
+                START, START + timedelta(days=args.days - 1), args.concurrency
+            )
+        )
+
+    return run
+
+
+async def _multi(
+    session: FakeOVOSession,
+    metrics: OVOMetrics,
+    args: argparse.Namespace,
+) -> Callable[[], Awaitable[int]]:
+    """Log in to many accounts and fetch a day of half hourly usage for each."""
+
+    async def run() -> int:
+        fleet = OVOEnergyFleet(
+            session,  # type: ignore[arg-type]
+            concurrency=args.concurrency,
+            rate_limiters=_rate_limiters(args),
+            metrics=metrics,
+        )
+        for account in range(args.accounts):
+            fleet.add(f"account-{account}", PASSWORD)
+
+        rows = 0
+        async for result in fleet.gather(
+            lambda client: client.get_half_hourly_usage(START.isoformat())
+        ):
+            if result.error is not None:
+                raise result.error
+            rows += _rows(result.result)
+        return rows
+
+    return run
+
+
+WORKLOADS: dict[str, Workload] = {
+    "single": _single,
+    "range": _range,
+    "multi": _multi,
+}
+
+
+async def _measure(
+    api: FakeOVOApi,
+    workload: Workload,
+    args: argparse.Namespace,
+) -> dict[str, Any]:
+    """Run a workload once for timing, then again under tracemalloc."""
+    recorder = _LatencyRecorder()
+    session = api.session()
+    try:
+        run = await workload(session, recorder, args)
+        recorder.durations.clear()
+        started = perf_counter()
+        rows = await run()
+        elapsed = perf_counter() - started
+    finally:
+        await session.close()
+
+    # Tracing allocations slows everything down, so memory gets its own pass
+    session = api.session()
+    try:
+        run = await workload(session, OVOMetrics(), args)
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        await run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        await session.close()
+
+    durations = sorted(recorder.durations)
+    return {
+        "requests": len(durations),
+        "rows": rows,
+        "seconds": round(elapsed, 6),
+        "requests_per_second": round(len(durations) / elapsed, 2),
+        "rows_per_second": round(rows / elapsed, 2),
+        "latency_ms": {
+            "p50": round(_percentile(durations, 50) * 1000, 3),
+            "p99": round(_percentile(durations, 99) * 1000, 3),
+            "max": round(durations[-1] * 1000 if durations else 0.0, 3),
+        },
+        "peak_memory_bytes": peak - baseline,
+    }
+
+
+def _package_version() -> str:
+    """Return the installed package version, if it is installed."""
+    try:
+        return version("ovoenergy")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+async def benchmark(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the selected workloads and return the report."""
+    api = FakeOVOApi(latency=args.latency / 1000, payload_days=args.payload_days)
+    await api.start()
+    try:
+        results = {
+            name: await _measure(api, WORKLOADS[name], args) for name in args.workloads
+        }
+    finally:
+        await api.close()
+
+    return {
+        "created": datetime.now(UTC).isoformat(),
+        "ovoenergy": _package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "decoder": get_decoder().name,
+        "parameters": {
+            "latency_ms": args.latency,
+            "payload_days": args.payload_days,
+            "iterations": args.iterations,
+            "days": args.days,
+            "accounts": args.accounts,
+            "concurrency": args.concurrency,
+            "rate_limits": args.rate_limits,
+        },
+        "workloads": results,
+    }
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--latency", type=float, default=20.0, help="Server latency in ms"
+    )
+    parser.add_argument(
+        "--payload-days",
+        type=int,
+        default=1,
+        help="Days of half hourly rows in each usage response",
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=50, help="Requests in the single workload"
+    )
+    parser.add_argument(
+        "--days", type=int, default=365, help="Days in the range workload"
+    )
+    parser.add_argument(
+        "--accounts", type=int, default=100, help="Logins in the multi workload"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="Maximum requests in flight"
+    )
+    parser.add_argument(
+        "--rate-limits",
+        action="store_true",
+        help="Apply the client's default rate limits, which cap throughput",
+    )
+    parser.add_argument(
+        "--workloads",
+        nargs="+",
+        choices=list(WORKLOADS),
+        default=list(WORKLOADS),
+        help="Workloads to run",
+    )
+    parser.add_argument(
+        "--output", help="File to write the JSON report to (default: stdout)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmark."""
+    args = _parse_args(argv)
+    report = asyncio.run(benchmark(args))
+
+    for name, result in report["workloads"].items():
+        print(
+            f"{name}: {result['requests']} requests in {result['seconds']:.2f}s, "
+            f"{result['requests_per_second']:.0f} req/s, "
+            f"p50 {result['latency_ms']['p50']:.1f} ms, "
+            f"p99 {result['latency_ms']['p99']:.1f} ms, "
+            f"peak {result['peak_memory_bytes'] / 1e6:.1f} MB",
+            file=sys.stderr,
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, indent=2)
+            output.write("\n")
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
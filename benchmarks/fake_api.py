@@ -0,0 +1,291 @@
+"""A local aiohttp server mimicking the OVO Energy API, for benchmarks.
+
+Requests to the real API hosts are rewritten to the local server with
+`FakeOVOApi.session`, keeping the original host as the first path segment
+so endpoints are recognised exactly as the client names them.
+"""
+
+import asyncio
+from calendar import monthrange
+from collections.abc import Callable
+from datetime import UTC, date, datetime, timedelta
+import json
+from typing import Any
+import uuid
+import zlib
+
+import aiohttp
+from aiohttp import web
+import jwt
+
+from ovoenergy.metrics import endpoint_name
+
+from .json_decoders import half_hourly_payload
+
+_TOKEN_KEY = "benchmark-secret-key-of-at-least-32-bytes"
+
+_DAILY_ROW = {
+    "consumption": 10.24,
+    "meterReadings": {"start": "12345", "end": "67890"},
+    "hasHalfHourData": True,
+    "cost": {"amount": "2.94", "currencyUnit": "GBP"},
+    "rates": {"anytime": 0.25, "standing": 0.45},
+}
+
+_FOOTPRINT = {
+    "from": "2024-01-01T00:00:00Z",
+    "to": "2024-12-31T23:59:59.999000Z",
+    "carbonReductionProductIds": [],
+    "carbonFootprint": {
+        "carbonKg": 2200.1234,
+        "carbonSavedKg": 0.0,
+        "kWh": 1578.3246,
+        "breakdown": {
+            "electricity": {"carbonKg": 200.1, "carbonSavedKg": 230.0, "kWh": 6564.9},
+            "gas": {"carbonKg": 2000.1, "carbonSavedKg": 340.0, "kWh": 10664.7},
+        },
+    },
+}
+
+_INTENSITY = {
+    "forecast": [
+        {
+            "from": f"{hour}:00",
+            "intensity": 80 + hour,
+            "level": "low",
+            "colour": "#0A9928",
+            "colourV2": "#0D8426",
+        }
+        for hour in range(24)
+    ],
+    "current": "low",
+    "greentime": None,
+}
+
+
+def account_for(username: str) -> int:
+    """Return the fake account number for a login."""
+    return 100_000_000 + zlib.crc32(username.encode()) % 900_000_000
+
+
+def _daily_payload(month: str) -> bytes:
+    """Return a daily usage body with a row per day of a month."""
+    year, month_number = (int(part) for part in month.split("-")[:2])
+    first = datetime(year, month_number, 1, tzinfo=UTC)
+    rows = [
+        {
+            **_DAILY_ROW,
+            "interval": {
+                "start": (first + timedelta(days=day)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "end": (first + timedelta(days=day + 1)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            },
+        }
+        for day in range(monthrange(year, month_number)[1])
+    ]
+    return json.dumps({"electricity": {"data": rows}, "gas": {"data": rows}}).encode()
+
+
+def _bootstrap_payload(customer_id: str, account_id: int) -> dict[str, Any]:
+    """Return a bootstrap response for one account with both fuels."""
+    return {
+        "data": {
+            "customer_nextV1": {
+                "id": customer_id,
+                "customerAccountRelationships": {
+                    "edges": [
+                        {
+                            "node": {
+                                "account": {
+                                    "id": account_id,
+                                    "accountNo": str(account_id),
+                                    "accountSupplyPoints": [
+                                        {
+                                            "startDate": "2024-01-01T00:00:00Z",
+                                            "supplyPoint": {
+                                                "sprn": f"{account_id}{fuel_type[0]}",
+                                                "fuelType": fuel_type,
+                                                "address": {
+                                                    "addressLines": ["ADDR"],
+                                                    "postCode": "SW1A 1AA",
+                                                },
+                                                "meterTechnicalDetails": [
+                                                    {
+                                                        "meterSerialNumber": "123",
+                                                        "mode": "credit",
+                                                        "type": "AB123",
+                                                        "status": "active",
+                                                    }
+                                                ],
+                                            },
+                                        }
+                                        for fuel_type in ("electricity", "gas")
+                                    ],
+                                }
+                            }
+                        }
+                    ]
+                },
+            }
+        }
+    }
+
+
+class FakeOVOApi:
+    """Serve fake OVO Energy API responses from a local port.
+
+    Every response is delayed by `latency` seconds, and half hourly usage
+    responses carry `payload_days` days of 48 rows per fuel. Bodies are
+    built once and reused, so the server adds as little as possible to
+    what is measured on the client.
+    """
+
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,
+        payload_days: int = 1,
+    ) -> None:
+        """Initialize."""
+        self.latency = latency
+        self.requests = 0
+        self._half_hourly_body = half_hourly_payload(payload_days)
+        self._daily_bodies: dict[str, bytes] = {}
+        self._footprint_body = json.dumps(_FOOTPRINT).encode()
+        self._intensity_body = json.dumps(_INTENSITY).encode()
+        self._customers: dict[str, int] = {}
+        self._handlers: dict[str, Callable[[web.Request], Any]] = {
+            "auth_login": self._login,
+            "auth_token": self._token,
+            "bootstrap": self._bootstrap,
+            "usage_daily": self._daily,
+            "usage_half_hourly": self._half_hourly,
+            "carbon_footprint": self._footprint,
+            "carbon_intensity": self._intensity,
+        }
+        self._runner: web.AppRunner | None = None
+        self._base_url = ""
+
+    async def start(self) -> str:
+        """Start serving on a free local port, returning its base URL."""
+        app = web.Application()
+        app.router.add_route("*", "/{host}/{path:.*}", self._dispatch)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self._base_url = f"http://127.0.0.1:{port}"
+        return self._base_url
+
+    async def close(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def session(self, **kwargs: Any) -> "FakeOVOSession":
+        """Return a client session whose requests go to this server."""
+        return FakeOVOSession(
+            self._base_url,
+            aiohttp.ClientSession(cookie_jar=aiohttp.DummyCookieJar(), **kwargs),
+        )
+
+    async def _dispatch(self, request: web.Request) -> web.StreamResponse:
+        """Route a request by the endpoint its original URL belongs to."""
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        url = f"https://{request.match_info['host']}/{request.match_info['path']}"
+        if (handler := self._handlers.get(endpoint_name(url))) is None:
+            raise web.HTTPNotFound
+        return await handler(request)
+
+    @staticmethod
+    def _json(body: bytes) -> web.Response:
+        """Return a prebuilt JSON body."""
+        return web.Response(body=body, content_type="application/json")
+
+    async def _login(self, request: web.Request) -> web.Response:
+        """Log in, setting a session cookie naming the user."""
+        username = (await request.json())["username"]
+        response = web.json_response({"code": "Success"})
+        response.set_cookie("session", username)
+        return response
+
+    async def _token(self, request: web.Request) -> web.Response:
+        """Issue a token for the user named by the session cookie."""
+        if (username := request.cookies.get("session")) is None:
+            raise web.HTTPUnauthorized
+
+        customer_id = str(uuid.uuid5(uuid.NAMESPACE_OID, username))
+        account_id = account_for(username)
+        self._customers[customer_id] = account_id
+        now = datetime.now(UTC)
+        token = jwt.encode(
+            {
+                "sub": customer_id,
+                "permissions": [f"account::{account_id}"],
+                "iat": now,
+                "exp": now + timedelta(hours=1),
+            },
+            _TOKEN_KEY,
+            algorithm="HS256",
+        )
+        return web.json_response(
+            {
+                "accessToken": {"value": token},
+                "expiresIn": 60,
+                "refreshExpiresIn": 0,
+            }
+        )
+
+    async def _bootstrap(self, request: web.Request) -> web.Response:
+        """Return the account of the customer in the query variables."""
+        customer_id = (await request.json())["variables"]["customerId"]
+        if (account_id := self._customers.get(customer_id)) is None:
+            raise web.HTTPUnauthorized
+        return web.json_response(_bootstrap_payload(customer_id, account_id))
+
+    async def _daily(self, request: web.Request) -> web.Response:
+        """Return a month of daily usage."""
+        month = request.query.get("date", date.today().strftime("%Y-%m"))
+        if (body := self._daily_bodies.get(month)) is None:
+            body = self._daily_bodies[month] = _daily_payload(month)
+        return self._json(body)
+
+    async def _half_hourly(self, _request: web.Request) -> web.Response:
+        """Return half hourly usage."""
+        return self._json(self._half_hourly_body)
+
+    async def _footprint(self, _request: web.Request) -> web.Response:
+        """Return the carbon footprint."""
+        return self._json(self._footprint_body)
+
+    async def _intensity(self, _request: web.Request) -> web.Response:
+        """Return the carbon intensity forecast."""
+        return self._json(self._intensity_body)
+
+
+class FakeOVOSession:
+    """Client session sending requests for the real API to a FakeOVOApi.
+
+    Only `request` and `close` are provided, as that is all the client uses.
+    """
+
+    def __init__(self, base_url: str, session: aiohttp.ClientSession) -> None:
+        """Initialize."""
+        self._base_url = base_url
+        self._session = session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request to the fake server instead of the real host."""
+        return self._session.request(
+            method,
+            f"{self._base_url}/{url.removeprefix('https://')}",
+            **kwargs,
+        )
+
+    async def close(self) -> None:
+        """Close the underlying session."""
+        await self._session.close()
@@ -0,0 +1,83 @@
+"""Benchmark the JSON decoders on a synthetic year of half hourly usage.
+
+Run with `python -m benchmarks.json_decoders`.
+"""
+
+from datetime import UTC, datetime, timedelta
+from functools import partial
+import json
+import timeit
+
+from ovoenergy.decoders import DecoderName, get_decoder
+
+DAYS = 365
+SLOTS_PER_DAY = 48
+REPEAT = 5
+
+
+def _timestamp(value: datetime) -> str:
+    """Format a timestamp the way the API does."""
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def half_hourly_payload(days: int = DAYS) -> bytes:
+    """Return a half hourly usage body with 48 rows per day for each fuel."""
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    rows = [
+        {
+            "consumption": round(0.1 + (slot % 7) * 0.05, 3),
+            "interval": {
+                "start": _timestamp(start + timedelta(minutes=30 * slot)),
+                "end": _timestamp(start + timedelta(minutes=30 * (slot + 1))),
+            },
+            "unit": "kWh",
+        }
+        for slot in range(days * SLOTS_PER_DAY)
+    ]
+    return json.dumps(
+        {
+            "electricity": {"data": rows},
+            "gas": {"data": rows},
+        }
+    ).encode()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    body = half_hourly_payload()
+    names: list[DecoderName] = ["json", "orjson", "msgspec"]
+
+    print(f"{DAYS}x{SLOTS_PER_DAY} rows per fuel, {len(body) / 1e6:.1f} MB body")
+    for name in names:
+        try:
+            decoder = get_decoder(name)
+        except ImportError:
+            print(f"  {name}: not installed")
+            continue
+
+        loads = min(
+            timeit.repeat(partial(decoder.loads, body), number=1, repeat=REPEAT)
+        )
+        models = min(
+            timeit.repeat(
+                partial(decoder.decode_half_hourly_usage, body),
+                number=1,
+                repeat=REPEAT,
+            )
+        )
+        series = min(
+            timeit.repeat(
+                partial(decoder.decode_half_hourly_series, body),
+                number=1,
+                repeat=REPEAT,
+            )
+        )
+        print(
+            f"  {name}: loads {loads * 1000:.1f} ms, "
+            f"to models {models * 1000:.1f} ms, "
+            f"to series {series * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark per-row memory of the slotted usage models.
+
+Run with `python -m benchmarks.models_memory`.
+"""
+
+from dataclasses import fields, make_dataclass
+from datetime import UTC, datetime, timedelta
+import tracemalloc
+from typing import Any
+
+from ovoenergy.models import (
+    OVOCost,
+    OVODailyElectricity,
+    OVOHalfHour,
+    OVOInterval,
+    OVOMeterReadings,
+    OVORates,
+)
+
+ROWS = 100_000
+
+
+def _unslotted(cls: type) -> type:
+    """Return a plain dataclass with the same fields as a slotted model."""
+    return make_dataclass(
+        f"{cls.__name__}Unslotted",
+        [(field.name, field.type) for field in fields(cls)],
+    )
+
+
+def _half_hours(classes: dict[type, type], rows: int) -> list[Any]:
+    """Build half hour rows using the given model classes."""
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    return [
+        classes[OVOHalfHour](
+            consumption=0.5,
+            interval=classes[OVOInterval](
+                start=start + timedelta(minutes=30 * row),
+                end=start + timedelta(minutes=30 * (row + 1)),
+            ),
+            unit="kWh",
+        )
+        for row in range(rows)
+    ]
+
+
+def _daily_electricity(classes: dict[type, type], rows: int) -> list[Any]:
+    """Build daily electricity rows using the given model classes."""
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    return [
+        classes[OVODailyElectricity](
+            consumption=10.24,
+            interval=classes[OVOInterval](
+                start=start + timedelta(days=row),
+                end=start + timedelta(days=row + 1),
+            ),
+            meter_readings=classes[OVOMeterReadings](start=12345.0, end=67890.0),
+            has_half_hour_data=True,
+            cost=classes[OVOCost](amount=2.94, currency_unit="GBP"),
+            rates=classes[OVORates](anytime=0.25, standing=0.45),
+        )
+        for row in range(rows)
+    ]
+
+
+def _measure(build: Any, classes: dict[type, type]) -> float:
+    """Return the bytes allocated per row while building rows."""
+    tracemalloc.start()
+    rows = build(classes, ROWS)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del rows
+    return size / ROWS
+
+
+def main() -> None:
+    """Run the benchmark."""
+    models = (
+        OVOCost,
+        OVODailyElectricity,
+        OVOHalfHour,
+        OVOInterval,
+        OVOMeterReadings,
+        OVORates,
+    )
+    slotted = {model: model for model in models}
+    unslotted = {model: _unslotted(model) for model in models}
+
+    print(f"Bytes per row over {ROWS} rows:")
+    for name, build in (
+        ("OVOHalfHour", _half_hours),
+        ("OVODailyElectricity", _daily_electricity),
+    ):
+        with_dict = _measure(build, unslotted)
+        with_slots = _measure(build, slotted)
+        print(
+            f"  {name}: {with_dict:.0f} with __dict__, {with_slots:.0f} slotted "
+            f"({1 - with_slots / with_dict:.0%} saved)"
+        )
+
+
+if __name__ == "__main__":
+    main()
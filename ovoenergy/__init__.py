@@ -1,57 +1,182 @@
 """Get energy data from OVO's API."""
 
-import contextlib
-from datetime import datetime, timedelta
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from datetime import UTC, date as dt_date, datetime, time, timedelta
+from functools import partial
+import hashlib
 from http.cookies import SimpleCookie
+import importlib
 import logging
-from typing import Literal
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 from uuid import UUID
 
-import aiohttp
-import jwt
-
+from .cache import (
+    CONDITIONAL_CACHE_TTL,
+    DEFAULT_CACHE_TTLS,
+    DEFAULT_CONDITIONAL_CACHE_SIZE,
+    CacheEndpoint,
+    OVOCacheBackend,
+    OVOMemoryCache,
+)
 from .const import (
     AUTH_LOGIN_URL,
     AUTH_TOKEN_URL,
     BOOTSTRAP_GRAPHQL_URL,
-    BOOTSTRAP_QUERY,
     CARBON_FOOTPRINT_URL,
     CARBON_INTENSITY_URL,
+    PLANS_URL,
     USAGE_DAILY_URL,
     USAGE_HALF_HOURLY_URL,
 )
+from .decoders import (
+    OVODecoder,
+    get_decoder,
+    parse_carbon_intensity,
+    parse_daily_electricity,
+    parse_daily_gas,
+    parse_footprint,
+    parse_half_hour,
+    parse_plans,
+)
 from .exceptions import (
     OVOEnergyAPIInvalidResponse,
     OVOEnergyAPINoCookies,
     OVOEnergyAPINotAuthorized,
     OVOEnergyAPINotFound,
+    OVOEnergyAPIRateLimited,
+    OVOEnergyAPIServerError,
     OVOEnergyNoAccount,
     OVOEnergyNoCustomer,
 )
+from .graphql import (
+    BOOTSTRAP_FIELDS,
+    SUPPLY_POINT_FIELDS,
+    BootstrapField,
+    build_bootstrap_query,
+    persisted_query_error,
+    persisted_query_extensions,
+)
+from .metrics import OVOMetrics, endpoint_name
 from .models import (
-    OVOCost,
     OVODailyElectricity,
     OVODailyGas,
     OVODailyUsage,
     OVOHalfHour,
     OVOHalfHourUsage,
-    OVOInterval,
-    OVOMeterReadings,
-    OVORates,
 )
 from .models.accounts import Account, BootstrapAccounts, Supply, SupplyPointInfo
-from .models.carbon_intensity import OVOCarbonIntensity, OVOCarbonIntensityForecast
-from .models.footprint import (
-    OVOCarbonFootprint,
-    OVOFootprint,
-    OVOFootprintBreakdown,
-    OVOFootprintElectricity,
-    OVOFootprintGas,
-)
+from .models.carbon_intensity import OVOCarbonIntensity
+from .models.columnar import OVOHalfHourSeriesUsage
+from .models.credentials import OVOCredentials
+from .models.footprint import OVOFootprint
 from .models.oauth import OAuth
+from .models.plan import OVOPlans
+from .models.response import OVOConditionalEntry, OVOResponse
+from .retry import OVORetryPolicy, OVOTokenBucket, create_rate_limiters
+from .streaming import DEFAULT_CHUNK_SIZE, OVOUsageRowParser, UsageFuel
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from .credentials import OVOCredentialCache
+    from .models.backfill import OVOHalfHourGap
+    from .store import OVOUsageStore
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_TOKEN_REFRESH_WINDOW = timedelta(minutes=5)
+DEFAULT_USAGE_CONCURRENCY = 8
+DEFAULT_SYNC_REVISION_WINDOW = timedelta(days=3)
+
+_T = TypeVar("_T")
+
+# Submodules not needed by the client itself, imported on first access
+_LAZY_SUBMODULES = frozenset(
+    {
+        "aggregation",
+        "batch",
+        "credentials",
+        "export",
+        "fleet",
+        "poller",
+        "store",
+        "tariff",
+    },
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazy submodules on first access."""
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _iter_days(start: dt_date, end: dt_date) -> Iterator[dt_date]:
+    """Iterate over each day from start to end (inclusive)."""
+    if end < start:
+        raise ValueError("End date must not be before start date")
+
+    day = start
+    while day <= end:
+        yield day
+        day += timedelta(days=1)
+
+
+def _iter_months(start: dt_date, end: dt_date) -> Iterator[dt_date]:
+    """Iterate over the first day of each month from start to end (inclusive)."""
+    if end < start:
+        raise ValueError("End date must not be before start date")
+
+    month = start.replace(day=1)
+    while month <= end:
+        yield month
+        month = (month + timedelta(days=32)).replace(day=1)
+
+
+def _needs_sync(
+    fetched_at: datetime | None,
+    period_end: dt_date,
+    revision_window: timedelta,
+) -> bool:
+    """Return True if a period was never fetched or may have been revised since."""
+    return fetched_at is None or fetched_at < (
+        datetime.combine(period_end, time(), UTC) + revision_window
+    )
+
+
+def _merge_usage(parts: list[list[_T] | None]) -> list[_T] | None:
+    """Merge usage lists, keeping None if no part returned any data."""
+    merged: list[_T] | None = None
+    for part in parts:
+        if part is None:
+            continue
+        if merged is None:
+            merged = []
+        merged.extend(part)
+    return merged
+
+
+_DailyT = TypeVar("_DailyT", OVODailyElectricity, OVODailyGas)
+
+
+def _within_days(
+    rows: list[_DailyT] | None,
+    start: dt_date,
+    end: dt_date,
+) -> list[_DailyT] | None:
+    """Keep daily rows from start to end (inclusive), and rows with no interval."""
+    if rows is None:
+        return None
+    return [
+        row
+        for row in rows
+        if row.interval is None or start <= row.interval.start.date() <= end
+    ]
+
 
 class OVOEnergy:
     """Class for OVOEnergy."""
@@ -60,10 +185,43 @@ class OVOEnergy:
 
     def __init__(
         self,
-        client_session: aiohttp.ClientSession,
+        client_session: "aiohttp.ClientSession",
+        *,
+        token_refresh_window: timedelta = DEFAULT_TOKEN_REFRESH_WINDOW,
+        decoder: OVODecoder | None = None,
+        cache: OVOCacheBackend | None = None,
+        cache_ttls: dict[CacheEndpoint, timedelta] | None = None,
+        conditional_cache_size: int = DEFAULT_CONDITIONAL_CACHE_SIZE,
+        retry_policy: OVORetryPolicy | None = None,
+        rate_limiters: dict[str, OVOTokenBucket] | None = None,
+        credential_cache: "OVOCredentialCache | None" = None,
+        metrics: OVOMetrics | None = None,
+        persisted_queries: bool = False,
     ) -> None:
         """Initilalize."""
         self._client_session = client_session
+        self._metrics = metrics if metrics is not None else OVOMetrics()
+        self._persisted_queries = persisted_queries
+        self._credential_cache = credential_cache
+        self._retry_policy = (
+            retry_policy if retry_policy is not None else OVORetryPolicy()
+        )
+        self._rate_limiters = (
+            rate_limiters if rate_limiters is not None else create_rate_limiters()
+        )
+        # Response caching is opt-in: cached models are shared and may be up
+        # to their TTL stale, which callers must choose to accept
+        self._cache = cache
+        # Variants cached by this client, so invalidation can find them
+        self._cache_variants: dict[CacheEndpoint, set[tuple[str, ...]]] = {}
+        self._cache_ttls = {**DEFAULT_CACHE_TTLS, **(cache_ttls or {})}
+        # Per URL, and never shared, so validators cannot evict responses
+        self._conditional_cache: OVOMemoryCache | None = (
+            OVOMemoryCache(conditional_cache_size) if conditional_cache_size else None
+        )
+        self._decoder = decoder if decoder is not None else get_decoder()
+        self._token_refresh_window = token_refresh_window
+        self._token_refresh_task: asyncio.Task[OAuth | Literal[False]] | None = None
 
         self._customer_id: UUID | None = None
         self._bootstrap_accounts: BootstrapAccounts | None = None
@@ -93,6 +251,35 @@ class OVOEnergy:
         """Return account ids."""
         return self._account_ids
 
+    def _account_id(self, account_id: int | None) -> int | None:
+        """Return an explicit account id, or the default account id."""
+        return account_id if account_id is not None else self.account_id
+
+    def _all_account_ids(self) -> list[int]:
+        """Return every account id, from the bootstrap if it has been run."""
+        if self._bootstrap_accounts is not None:
+            account_ids = [
+                account.account_id for account in self._bootstrap_accounts.accounts
+            ]
+        else:
+            account_ids = self.account_ids or []
+        if not account_ids:
+            raise OVOEnergyNoAccount("No account ids set")
+        return account_ids
+
+    async def _gather_accounts(
+        self,
+        fetch: Callable[[int], Awaitable[_T]],
+        concurrency: int,
+    ) -> dict[int, _T]:
+        """Run a fetch for every account concurrently, keyed by account id."""
+        account_ids = self._all_account_ids()
+        results = await self._gather_limited(
+            [partial(fetch, account_id) for account_id in account_ids],
+            concurrency,
+        )
+        return dict(zip(account_ids, results, strict=True))
+
     @property
     def customer_id(self) -> UUID | None:
         """Return customer id."""
@@ -111,20 +298,140 @@ class OVOEnergy:
         """Return True if OAuth token has expired."""
         return self.oauth is None or self.oauth.expires_at < datetime.now()
 
+    @property
+    def oauth_expiring(self) -> bool:
+        """Return True if OAuth token is within the proactive refresh window."""
+        return (
+            self.oauth is None
+            or self.oauth.expires_at - self._token_refresh_window < datetime.now()
+        )
+
     @property
     def username(self) -> str | None:
         """Return username."""
         return self._username
 
+    @property
+    def credentials(self) -> OVOCredentials | None:
+        """Return the current session credentials, if authenticated."""
+        if self._username is None or self._cookies is None or self._oauth is None:
+            return None
+
+        return OVOCredentials(
+            username=self._username,
+            cookies=self._cookies,
+            oauth=self._oauth,
+            customer_id=self._customer_id,
+            account_ids=self._account_ids,
+        )
+
+    def restore_credentials(self, credentials: OVOCredentials) -> None:
+        """Restore session credentials saved from a previous session."""
+        self._username = credentials.username
+        self._cookies = credentials.cookies
+        self._oauth = credentials.oauth
+        self._customer_id = credentials.customer_id
+        self._account_ids = credentials.account_ids
+
+    def _cache_key(
+        self,
+        endpoint: CacheEndpoint,
+        account_id: int | None = None,
+        variant: tuple[str, ...] = (),
+    ) -> tuple[str | int | None, ...]:
+        """Return the cache key for an endpoint for this customer/account.
+
+        A variant tells apart responses to differently shaped requests.
+        """
+        if endpoint == "bootstrap_accounts":
+            return (endpoint, str(self.customer_id), *variant)
+        if endpoint in ("footprint", "plans"):
+            return (endpoint, self._account_id(account_id), str(self.customer_id))
+        # Carbon intensity is the same for everyone
+        return (endpoint, *variant)
+
+    def _cache_get(
+        self,
+        endpoint: CacheEndpoint,
+        account_id: int | None = None,
+        *,
+        variant: tuple[str, ...] = (),
+    ) -> Any | None:
+        """Return a cached response model for an endpoint, if any."""
+        if self._cache is None:
+            return None
+        return self._cache.get(self._cache_key(endpoint, account_id, variant))
+
+    def _cache_set(
+        self,
+        endpoint: CacheEndpoint,
+        value: Any,
+        account_id: int | None = None,
+        *,
+        variant: tuple[str, ...] = (),
+    ) -> None:
+        """Cache a response model for an endpoint, if caching is enabled."""
+        if self._cache is None:
+            return
+        if (ttl := self._cache_ttls[endpoint]) > timedelta(0):
+            if variant:
+                self._cache_variants.setdefault(endpoint, set()).add(variant)
+            self._cache.set(self._cache_key(endpoint, account_id, variant), value, ttl)
+
+    def invalidate_cache(
+        self,
+        endpoint: CacheEndpoint | None = None,
+        *,
+        account_id: int | None = None,
+    ) -> None:
+        """Invalidate cached responses for this customer/account.
+
+        If no endpoint is given, every cached endpoint is invalidated, along
+        with the validators kept for conditional requests. Every variant of an
+        endpoint this client has cached is invalidated with it.
+        """
+        if endpoint is None and self._conditional_cache is not None:
+            self._conditional_cache.clear()
+        if self._cache is None:
+            return
+        for cache_endpoint in (endpoint,) if endpoint else DEFAULT_CACHE_TTLS:
+            for variant in ((), *self._cache_variants.get(cache_endpoint, ())):
+                self._cache.delete(self._cache_key(cache_endpoint, account_id, variant))
+
     async def _request(
         self,
         url: str,
         method: Literal["GET"] | Literal["POST"],
         with_cookies: bool = True,
         with_authorization: bool = True,
+        headers: dict[str, str] | None = None,
         **kwargs,
-    ):
-        """Request."""
+    ) -> OVOResponse:
+        """Request.
+
+        The response body is read and the connection released before
+        returning, so callers never hold on to pooled connections.
+        """
+        await self._check_authorization(with_cookies, with_authorization)
+
+        response = await self._request_with_retries(
+            url,
+            method,
+            with_cookies,
+            with_authorization,
+            headers=headers,
+            **kwargs,
+        )
+        self._raise_for_status(response.status, with_authorization)
+
+        return response
+
+    async def _check_authorization(
+        self,
+        with_cookies: bool,
+        with_authorization: bool,
+    ) -> None:
+        """Check credentials are set, refreshing the token if it has expired."""
         if with_cookies and self._cookies is None:
             raise OVOEnergyAPINoCookies("No cookies set")
         if with_authorization and self._oauth is None:
@@ -133,41 +440,354 @@ class OVOEnergy:
         if with_authorization and self.oauth_expired:
             _LOGGER.debug("OAuth token expired, refreshing: %s", self.oauth)
 
-            if not await self.get_token() or self.oauth is None:
+            if not await self.refresh_token() or self.oauth is None:
                 raise OVOEnergyAPINotAuthorized("No OAuth token set after refresh")
 
             _LOGGER.debug("OAuth token refreshed: %s", self.oauth)
+        elif with_authorization and self.oauth_expiring:
+            # Token is still valid, so renew it in the background and carry on
+            # with the current one rather than blocking this request.
+            _LOGGER.debug("OAuth token expiring soon, refreshing in background")
+            self._start_token_refresh()
+
+    @staticmethod
+    def _raise_for_status(status: int, with_authorization: bool) -> None:
+        """Raise the exception for an error status."""
+        if with_authorization and status in [401, 403]:
+            raise OVOEnergyAPINotAuthorized(f"Not authorized: {status}")
+
+        if status == 404:
+            raise OVOEnergyAPINotFound(f"Endpoint not found: {status}")
+
+        if status == 429:
+            raise OVOEnergyAPIRateLimited(f"Rate limited: {status}")
+
+        if status >= 500:
+            raise OVOEnergyAPIServerError(f"Server error: {status}")
+
+    def _decode(self, response: OVOResponse, decode: Callable[[bytes], _T]) -> _T:
+        """Decode a response body, timing it separately from the request."""
+        started = perf_counter()
+        try:
+            return decode(response.body)
+        finally:
+            self._metrics.parse(response.endpoint, perf_counter() - started)
+
+    async def _get_conditional(self, url: str, decode: Callable[[bytes], _T]) -> _T:
+        """Get a URL, reusing the last parsed model if it has not changed.
+
+        The ETag and Last-Modified validators of the last response are sent
+        back, and a 304 returns its model without a body. Servers that send
+        no validators return the full body, which is only parsed if its hash
+        differs from last time. Like cached responses, the kept model is
+        shared between callers and must be treated as read-only.
+        """
+        entry: OVOConditionalEntry | None = (
+            self._conditional_cache.get(url)
+            if self._conditional_cache is not None
+            else None
+        )
+        headers: dict[str, str] = {}
+        if entry is not None:
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        response = await self._request(url, "GET", headers=headers or None)
+
+        if response.status == 304:
+            if entry is None:
+                raise OVOEnergyAPIInvalidResponse(
+                    "Not modified response to an unconditional request"
+                )
+            _LOGGER.debug("%s not modified", url)
+        else:
+            body_hash = hashlib.blake2b(response.body, digest_size=16).digest()
+            if entry is None or entry.body_hash != body_hash:
+                entry = OVOConditionalEntry(
+                    etag=None,
+                    last_modified=None,
+                    body_hash=body_hash,
+                    value=self._decode(response, decode),
+                )
+            entry.etag = response.headers.get("ETag")
+            entry.last_modified = response.headers.get("Last-Modified")
+
+        if self._conditional_cache is not None:
+            # Stored again even if unchanged, to keep it from expiring
+            self._conditional_cache.set(url, entry, CONDITIONAL_CACHE_TTL)
+        return entry.value
+
+    def _rate_limiter(self, url: str) -> OVOTokenBucket | None:
+        """Return the rate limiter for the base URL of a request, if any."""
+        for base_url, rate_limiter in self._rate_limiters.items():
+            if url.startswith(base_url):
+                return rate_limiter
+        return None
+
+    async def _request_with_retries(
+        self,
+        url: str,
+        method: Literal["GET"] | Literal["POST"],
+        with_cookies: bool,
+        with_authorization: bool,
+        headers: dict[str, str] | None = None,
+        **kwargs,
+    ) -> OVOResponse:
+        """Send a request, retrying connection errors, 429s and 5xx responses."""
+        # Deferred so importing the package does not load aiohttp; it is
+        # already loaded by whoever created the session.
+        # pylint: disable-next=import-outside-toplevel
+        from aiohttp import ClientConnectionError, ClientPayloadError  # noqa: PLC0415
+
+        rate_limiter = self._rate_limiter(url)
+        endpoint = endpoint_name(url)
+        attempt = 0
+        while True:
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+
+            started = perf_counter()
+            try:
+                async with self._client_session.request(
+                    method,
+                    url,
+                    cookies=self._cookies if with_cookies else None,
+                    headers=self._request_headers(with_authorization, headers),
+                    **kwargs,
+                ) as response:
+                    delay = (
+                        self._status_retry_delay(
+                            url,
+                            attempt,
+                            response.status,
+                            response.headers.get("Retry-After"),
+                            rate_limiter,
+                        )
+                        if response.status in self._retry_policy.retry_statuses
+                        and attempt < self._retry_policy.retries
+                        else None
+                    )
+                    if delay is None:
+                        body = await response.read()
+                        self._metrics.request(
+                            endpoint,
+                            method,
+                            response.status,
+                            perf_counter() - started,
+                            len(body),
+                        )
+                        return OVOResponse(
+                            status=response.status,
+                            headers=response.headers.copy(),
+                            cookies=response.cookies,
+                            body=body,
+                            endpoint=endpoint,
+                        )
 
-        response = await self._client_session.request(
-            method,
+                    self._metrics.request(
+                        endpoint, method, response.status, perf_counter() - started, 0
+                    )
+            except (
+                ClientConnectionError,
+                ClientPayloadError,
+                TimeoutError,
+            ) as exception:
+                self._metrics.request(
+                    endpoint, method, None, perf_counter() - started, 0
+                )
+                if attempt >= self._retry_policy.retries:
+                    raise
+                delay = self._error_retry_delay(url, attempt, exception)
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _request_headers(
+        self,
+        with_authorization: bool,
+        headers: dict[str, str] | None,
+    ) -> dict[str, str] | None:
+        """Return the authorization header merged with any extra headers."""
+        if (authorization := self._authorization_headers(with_authorization)) is None:
+            return headers
+        return {**authorization, **headers} if headers else authorization
+
+    def _authorization_headers(self, with_authorization: bool) -> dict[str, str] | None:
+        """Return the bearer token header, if the request is authorized."""
+        if not with_authorization or not self.oauth:
+            return None
+        return {"Authorization": f"Bearer {self.oauth.access_token}"}
+
+    def _error_retry_delay(self, url: str, attempt: int, exception: Exception) -> float:
+        """Return the delay before retrying a request that failed to complete."""
+        self._metrics.retry(endpoint_name(url), type(exception).__name__)
+        delay = self._retry_policy.delay(attempt)
+        _LOGGER.debug(
+            "Request to %s failed (%s), retrying in %.2fs",
             url,
-            cookies=self._cookies if with_cookies else None,
-            headers=(
-                {
-                    "Authorization": f"Bearer {self.oauth.access_token}",
-                }
-                if with_authorization and self.oauth
-                else None
-            ),
-            **kwargs,
+            exception,
+            delay,
+        )
+        return delay
+
+    def _status_retry_delay(
+        self,
+        url: str,
+        attempt: int,
+        status: int,
+        retry_after: str | None,
+        rate_limiter: OVOTokenBucket | None,
+    ) -> float | None:
+        """Return the delay before retrying a request with a retryable status.
+
+        Returns None if the server asked for a longer wait than the retry
+        policy allows, so the response is raised without retrying early.
+        """
+        if (delay := self._retry_policy.delay(attempt, retry_after)) is None:
+            # Not paused either, so the next request is not held up for longer
+            # than this one was allowed to wait
+            _LOGGER.debug(
+                "Request to %s returned %s with Retry-After %s, not retrying",
+                url,
+                status,
+                retry_after,
+            )
+            return None
+
+        if status == 429 and rate_limiter is not None:
+            # Hold back every request to this API, not just this one
+            rate_limiter.pause(delay)
+        self._metrics.retry(endpoint_name(url), str(status))
+        _LOGGER.debug(
+            "Request to %s returned %s, retrying in %.2fs",
+            url,
+            status,
+            delay,
         )
-        with contextlib.suppress(aiohttp.ClientResponseError):
-            response.raise_for_status()
+        return delay
 
-        if with_authorization and response.status in [401, 403]:
-            raise OVOEnergyAPINotAuthorized(f"Not authorized: {response.status}")
+    async def _request_stream(
+        self,
+        url: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream the body of an authorized GET request in chunks.
+
+        Connection errors and retryable statuses are retried until the body
+        starts. Errors after that are raised, as chunks already yielded
+        cannot be taken back.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from aiohttp import ClientConnectionError  # noqa: PLC0415
+
+        await self._check_authorization(True, True)
+
+        rate_limiter = self._rate_limiter(url)
+        endpoint = endpoint_name(url)
+        attempt = 0
+        streaming = False
+        while True:
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+
+            started = perf_counter()
+            try:
+                async with self._client_session.request(
+                    "GET",
+                    url,
+                    cookies=self._cookies,
+                    headers=self._authorization_headers(True),
+                ) as response:
+                    status = response.status
+                    delay = (
+                        self._status_retry_delay(
+                            url,
+                            attempt,
+                            status,
+                            response.headers.get("Retry-After"),
+                            rate_limiter,
+                        )
+                        if status in self._retry_policy.retry_statuses
+                        and attempt < self._retry_policy.retries
+                        else None
+                    )
+                    if delay is None:
+                        streaming = True
+                        received = 0
+                        try:
+                            self._raise_for_status(status, True)
+                            async for chunk in response.content.iter_chunked(
+                                chunk_size
+                            ):
+                                received += len(chunk)
+                                yield chunk
+                        finally:
+                            self._metrics.request(
+                                endpoint,
+                                "GET",
+                                status,
+                                perf_counter() - started,
+                                received,
+                            )
+                        return
 
-        if response.status == 404:
-            raise OVOEnergyAPINotFound(f"Endpoint not found: {response.status}")
+                    self._metrics.request(
+                        endpoint, "GET", status, perf_counter() - started, 0
+                    )
+            except (ClientConnectionError, TimeoutError) as exception:
+                if streaming:
+                    raise
+                self._metrics.request(
+                    endpoint, "GET", None, perf_counter() - started, 0
+                )
+                if attempt >= self._retry_policy.retries:
+                    raise
+                delay = self._error_retry_delay(url, attempt, exception)
 
-        return response
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _restore_cached_credentials(self, username: str) -> bool:
+        """Restore credentials from the credential cache, if still usable."""
+        if (
+            self._credential_cache is None
+            or (credentials := self._credential_cache.load(username)) is None
+        ):
+            return False
+
+        self.restore_credentials(credentials)
+        if not self.oauth_expiring:
+            _LOGGER.debug("Restored OAuth token from credential cache")
+            return True
+
+        # The token has lapsed, but the session cookies may still be good for
+        # a new one without logging in again.
+        try:
+            if await self.get_token():
+                _LOGGER.debug("Refreshed OAuth token from cached cookies")
+                return True
+        except OVOEnergyAPINotAuthorized as exception:
+            _LOGGER.debug("Cached cookies rejected: %s", exception)
+
+        self._cookies = None
+        self._oauth = None
+        return False
 
     async def authenticate(
         self,
         username: str,
         password: str,
     ) -> bool:
-        """Authenticate."""
+        """Authenticate.
+
+        With a credential cache, a still valid session from a previous run
+        is restored instead of logging in again.
+        """
+        if await self._restore_cached_credentials(username):
+            return True
+
         response = await self._request(
             AUTH_LOGIN_URL,
             "POST",
@@ -182,7 +802,7 @@ class OVOEnergy:
         if response.status != 200:
             return False
 
-        json_response = await response.json()
+        json_response = self._decode(response, self._decoder.loads)
 
         if "code" in json_response and json_response["code"] == "Unknown":
             return False
@@ -195,6 +815,35 @@ class OVOEnergy:
 
         return True
 
+    def _start_token_refresh(self) -> asyncio.Task[OAuth | Literal[False]]:
+        """Start a token refresh, or return the one already in flight."""
+        if self._token_refresh_task is None or self._token_refresh_task.done():
+            self._token_refresh_task = asyncio.create_task(self._timed_get_token())
+            self._token_refresh_task.add_done_callback(self._token_refresh_done)
+        return self._token_refresh_task
+
+    async def _timed_get_token(self) -> OAuth | Literal[False]:
+        """Get a token, reporting the refresh to the metrics hooks."""
+        started = perf_counter()
+        success = False
+        try:
+            success = bool(oauth := await self.get_token())
+            return oauth
+        finally:
+            self._metrics.token_refresh(success, perf_counter() - started)
+
+    @staticmethod
+    def _token_refresh_done(task: asyncio.Task[OAuth | Literal[False]]) -> None:
+        """Log failed token refreshes that nobody awaited."""
+        if not task.cancelled() and (exception := task.exception()) is not None:
+            _LOGGER.debug("OAuth token refresh failed: %s", exception)
+
+    async def refresh_token(self) -> OAuth | Literal[False]:
+        """Refresh the token, sharing a single refresh between concurrent callers."""
+        # Shield the shared task so one cancelled caller does not cancel the
+        # refresh for everyone else waiting on it.
+        return await asyncio.shield(self._start_token_refresh())
+
     async def get_token(self) -> OAuth | Literal[False]:
         """Get token."""
         response = await self._request(
@@ -205,7 +854,7 @@ class OVOEnergy:
         if response.status != 200:
             return False
 
-        json_response = await response.json()
+        json_response = self._decode(response, self._decoder.loads)
 
         self._oauth = OAuth(
             access_token=json_response["accessToken"]["value"],
@@ -215,7 +864,10 @@ class OVOEnergy:
             expires_at=datetime.now() + timedelta(minutes=json_response["expiresIn"]),
         )
 
-        # Read JWT token
+        # Read JWT token, importing PyJWT only now as it is slow to load
+        # pylint: disable-next=import-outside-toplevel
+        import jwt  # noqa: PLC0415
+
         decoded_token = jwt.decode(
             self._oauth.access_token, options={"verify_signature": False}
         )
@@ -239,22 +891,77 @@ class OVOEnergy:
         else:
             self._account_ids = None
 
+        if (
+            self._credential_cache is not None
+            and (credentials := self.credentials) is not None
+        ):
+            try:
+                self._credential_cache.save(credentials)
+            except OSError as exception:
+                _LOGGER.warning("Could not write credential cache: %s", exception)
+
         return self._oauth
 
-    async def bootstrap_accounts(self) -> BootstrapAccounts:
-        """Bootstrap accounts."""
+    async def _graphql(
+        self,
+        operation_name: str,
+        query: str,
+        variables: dict[str, Any],
+    ) -> Any:
+        """Send a GraphQL query, by its hash if persisted queries are enabled.
+
+        The full query is only sent if the server does not know the hash yet,
+        which also registers it, or does not support persisted queries.
+        """
+        payload: dict[str, Any] = {
+            "operationName": operation_name,
+            "variables": variables,
+        }
+        if self._persisted_queries:
+            extensions = persisted_query_extensions(query)
+            response = await self._request(
+                BOOTSTRAP_GRAPHQL_URL,
+                "POST",
+                json={**payload, "extensions": extensions},
+            )
+            json_response = self._decode(response, self._decoder.loads)
+            if (error := persisted_query_error(json_response)) is None:
+                return json_response
+            if error == "not_supported":
+                _LOGGER.debug("Persisted queries not supported, sending full queries")
+                self._persisted_queries = False
+            else:
+                payload["extensions"] = extensions
+
         response = await self._request(
             BOOTSTRAP_GRAPHQL_URL,
             "POST",
-            json={
-                "operationName": "Bootstrap",
-                "query": BOOTSTRAP_QUERY,
-                "variables": {
-                    "customerId": self.customer_id,
-                },
-            },
+            json={**payload, "query": query},
+        )
+        return self._decode(response, self._decoder.loads)
+
+    async def bootstrap_accounts(
+        self,
+        fields: Iterable[BootstrapField] | None = None,
+    ) -> BootstrapAccounts:
+        """Bootstrap accounts.
+
+        Pass the supply fields that are needed to request only those, see
+        BOOTSTRAP_FIELDS. Account ids are always requested, and supplies are
+        left empty if no fields are.
+        """
+        query = build_bootstrap_query(fields)
+        selected = frozenset(BOOTSTRAP_FIELDS if fields is None else fields)
+        variant = () if fields is None else tuple(sorted(selected))
+        if (
+            cached := self._cache_get("bootstrap_accounts", variant=variant)
+        ) is not None:
+            self._bootstrap_accounts = cached
+            return cached
+
+        json_response = await self._graphql(
+            "Bootstrap", query, {"customerId": self.customer_id}
         )
-        json_response = await response.json()
 
         if "data" not in json_response:
             raise OVOEnergyAPIInvalidResponse("Missing 'data' key in response")
@@ -304,28 +1011,32 @@ class OVOEnergy:
                 )
                 continue
 
-            if "accountSupplyPoints" not in edge["node"]["account"]:
+            if "accountSupplyPoints" not in edge["node"]["account"] and selected:
                 _LOGGER.warning(
                     "Missing 'data.customer_nextV1.customerAccountRelationships.edges[X].node.account.accountSupplyPoints' key in response"
                 )
                 continue
 
             supplies: list[Supply] = []
-            for supply in edge["node"]["account"]["accountSupplyPoints"]:
-                if "supplyPoint" not in supply:
+            for supply in edge["node"]["account"].get("accountSupplyPoints", []):
+                if "supplyPoint" in supply:
+                    supply_point = supply["supplyPoint"]
+                elif selected & SUPPLY_POINT_FIELDS:
                     _LOGGER.warning(
                         "Missing 'data.customer_nextV1.customerAccountRelationships.edges[X].node.account.accountSupplyPoints[X].supplyPoint' key in response"
                     )
                     continue
+                else:
+                    supply_point = {}
 
-                if "meterTechnicalDetails" not in supply["supplyPoint"]:
+                if "meterTechnicalDetails" not in supply_point and "meter" in selected:
                     _LOGGER.warning(
                         "Missing 'data.customer_nextV1.customerAccountRelationships.edges[X].node.account.accountSupplyPoints[X].supplyPoint.meterTechnicalDetails' key in response"
                     )
                     continue
 
                 active_meter_technical_details = None
-                for meter_detail in supply["supplyPoint"]["meterTechnicalDetails"]:
+                for meter_detail in supply_point.get("meterTechnicalDetails", []):
                     if "status" not in meter_detail:
                         _LOGGER.warning(
                             "Missing 'data.customer_nextV1.customerAccountRelationships.edges[X].node.account.accountSupplyPoints[X].supplyPoint.meterTechnicalDetails[X].status' key in response"
@@ -337,17 +1048,18 @@ class OVOEnergy:
                         break
 
                 supply_point_address_lines: list[str] = []
-                if "address" not in supply["supplyPoint"]:
-                    _LOGGER.warning(
-                        "Missing 'data.customer_nextV1.customerAccountRelationships.edges[X].node.account.accountSupplyPoints[X].supplyPoint.address' key in response. Allowing empty address."
-                    )
+                if "address" not in supply_point:
+                    if "address" in selected:
+                        _LOGGER.warning(
+                            "Missing 'data.customer_nextV1.customerAccountRelationships.edges[X].node.account.accountSupplyPoints[X].supplyPoint.address' key in response. Allowing empty address."
+                        )
                 else:
-                    supply_point_address_lines = supply["supplyPoint"]["address"].get(
+                    supply_point_address_lines = supply_point["address"].get(
                         "addressLines", []
                     )
-                    if "postCode" in supply["supplyPoint"]["address"]:
+                    if "postCode" in supply_point["address"]:
                         supply_point_address_lines.append(
-                            supply["supplyPoint"]["address"].get("postCode")
+                            supply_point["address"].get("postCode")
                         )
 
                 supplies.append(
@@ -355,10 +1067,11 @@ class OVOEnergy:
                         mpxn=active_meter_technical_details["meterSerialNumber"]
                         if active_meter_technical_details
                         else None,
-                        fuel=supply["supplyPoint"].get("fuelType", None),
-                        is_onboarding=supply["supplyPoint"].get("isOnboarding", None),
-                        start=supply["supplyPoint"].get("startDate", None),
-                        is_payg=supply["supplyPoint"].get("isPayg", None),
+                        fuel=supply_point.get("fuelType", None),
+                        is_onboarding=supply_point.get("isOnboarding", None),
+                        # Requested on the account supply point, not the supply point
+                        start=supply.get("startDate", supply_point.get("startDate")),
+                        is_payg=supply_point.get("isPayg", None),
                         supply_point_info=SupplyPointInfo(
                             meter_type=active_meter_technical_details["type"]
                             if active_meter_technical_details
@@ -379,7 +1092,9 @@ class OVOEnergy:
                     account_id=edge["node"]["account"]["id"],
                     is_payg=None,  # No longer supplied
                     is_blocked=None,  # No longer supplied
-                    supplies=supplies,
+                    supplies=supplies
+                    if "accountSupplyPoints" in edge["node"]["account"]
+                    else None,
                 )
             )
 
@@ -392,241 +1107,554 @@ class OVOEnergy:
             is_first_login=False,  # We no longer get this, so assume false
             accounts=accounts,
         )
+        self._cache_set("bootstrap_accounts", self._bootstrap_accounts, variant=variant)
 
         return self._bootstrap_accounts
 
     async def get_daily_usage(
         self,
         date: str,
+        *,
+        account_id: int | None = None,
     ) -> OVODailyUsage:
         """Get daily usage data."""
-        ovo_usage = OVODailyUsage(
-            electricity=None,
-            gas=None,
+        return await self._get_conditional(
+            f"{USAGE_DAILY_URL}/{self._account_id(account_id)}?date={date}",
+            self._decoder.decode_daily_usage,
         )
 
+    async def get_daily_usage_all_accounts(
+        self,
+        date: str,
+        concurrency: int = DEFAULT_USAGE_CONCURRENCY,
+    ) -> dict[int, OVODailyUsage]:
+        """Get daily usage data for every account, keyed by account id."""
+        return await self._gather_accounts(
+            lambda account_id: self.get_daily_usage(date, account_id=account_id),
+            concurrency,
+        )
+
+    async def get_half_hourly_usage(
+        self,
+        date: str,
+        *,
+        account_id: int | None = None,
+    ) -> OVOHalfHourUsage:
+        """Get half hourly usage data."""
         response = await self._request(
-            f"{USAGE_DAILY_URL}/{self.account_id}?date={date}",
+            f"{USAGE_HALF_HOURLY_URL}/{self._account_id(account_id)}?date={date}",
             "GET",
         )
-        json_response = await response.json()
-
-        if "electricity" in json_response:
-            electricity = json_response["electricity"]
-            if electricity and "data" in electricity:
-                ovo_usage.electricity = []
-                for usage in electricity["data"]:
-                    if usage is not None:
-                        ovo_usage.electricity.append(
-                            OVODailyElectricity(
-                                consumption=usage.get("consumption", None),
-                                interval=(
-                                    OVOInterval(
-                                        start=datetime.fromisoformat(
-                                            usage["interval"]["start"]
-                                        ),
-                                        end=datetime.fromisoformat(
-                                            usage["interval"]["end"]
-                                        ),
-                                    )
-                                    if "interval" in usage
-                                    else None
-                                ),
-                                meter_readings=(
-                                    OVOMeterReadings(
-                                        start=usage["meterReadings"]["start"],
-                                        end=usage["meterReadings"]["end"],
-                                    )
-                                    if "meterReadings" in usage
-                                    else None
-                                ),
-                                has_half_hour_data=usage.get("hasHalfHourData", None),
-                                cost=(
-                                    OVOCost(
-                                        amount=usage["cost"]["amount"],
-                                        currency_unit=usage["cost"]["currencyUnit"],
-                                    )
-                                    if "cost" in usage
-                                    else None
-                                ),
-                                rates=OVORates(
-                                    anytime=usage["rates"].get("anytime", None),
-                                    standing=usage["rates"].get("standing", None),
-                                )
-                                if "rates" in usage
-                                else None,
-                            )
-                        )
 
-        if "gas" in json_response:
-            gas = json_response["gas"]
-            if gas and "data" in gas:
-                ovo_usage.gas = []
-                for usage in gas["data"]:
-                    if usage is not None:
-                        ovo_usage.gas.append(
-                            OVODailyGas(
-                                consumption=usage.get("consumption", None),
-                                volume=usage.get("volume", None),
-                                interval=(
-                                    OVOInterval(
-                                        start=datetime.fromisoformat(
-                                            usage["interval"]["start"]
-                                        ),
-                                        end=datetime.fromisoformat(
-                                            usage["interval"]["end"]
-                                        ),
-                                    )
-                                    if "interval" in usage
-                                    else None
-                                ),
-                                meter_readings=(
-                                    OVOMeterReadings(
-                                        start=usage["meterReadings"]["start"],
-                                        end=usage["meterReadings"]["end"],
-                                    )
-                                    if "meterReadings" in usage
-                                    else None
-                                ),
-                                has_half_hour_data=usage.get("hasHalfHourData", None),
-                                cost=OVOCost(
-                                    amount=usage["cost"]["amount"],
-                                    currency_unit=usage["cost"]["currencyUnit"],
-                                )
-                                if "cost" in usage
-                                else None,
-                                rates=OVORates(
-                                    anytime=usage["rates"].get("anytime", None),
-                                    standing=usage["rates"].get("standing", None),
-                                )
-                                if "rates" in usage
-                                else None,
-                            )
-                        )
+        return self._decode(response, self._decoder.decode_half_hourly_usage)
 
-        return ovo_usage
+    async def get_half_hourly_usage_all_accounts(
+        self,
+        date: str,
+        concurrency: int = DEFAULT_USAGE_CONCURRENCY,
+    ) -> dict[int, OVOHalfHourUsage]:
+        """Get half hourly usage data for every account, keyed by account id."""
+        return await self._gather_accounts(
+            lambda account_id: self.get_half_hourly_usage(date, account_id=account_id),
+            concurrency,
+        )
 
-    async def get_half_hourly_usage(
+    async def get_half_hourly_series(
+        self,
+        date: str,
+        *,
+        account_id: int | None = None,
+    ) -> OVOHalfHourSeriesUsage:
+        """Get half hourly usage data as columnar series."""
+        response = await self._request(
+            f"{USAGE_HALF_HOURLY_URL}/{self._account_id(account_id)}?date={date}",
+            "GET",
+        )
+
+        return self._decode(response, self._decoder.decode_half_hourly_series)
+
+    async def _stream_rows(
+        self,
+        url: str,
+        parse_row: Callable[[str, dict[str, Any]], _T],
+        chunk_size: int,
+    ) -> AsyncIterator[tuple[UsageFuel, _T]]:
+        """Parse usage rows from a response as its body streams in."""
+        parser = OVOUsageRowParser()
+        parse_time = 0.0
+        try:
+            async for chunk in self._request_stream(url, chunk_size):
+                started = perf_counter()
+                rows = [
+                    (fuel, parse_row(fuel, row)) for fuel, row in parser.feed(chunk)
+                ]
+                parse_time += perf_counter() - started
+                for row in rows:
+                    yield row
+
+            started = perf_counter()
+            rows = [(fuel, parse_row(fuel, row)) for fuel, row in parser.close()]
+            parse_time += perf_counter() - started
+            for row in rows:
+                yield row
+        finally:
+            self._metrics.parse(endpoint_name(url), parse_time)
+
+    def stream_daily_usage(
         self,
         date: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        *,
+        account_id: int | None = None,
+    ) -> AsyncIterator[tuple[UsageFuel, OVODailyElectricity | OVODailyGas]]:
+        """Stream daily usage rows as (fuel, row) pairs while they download.
+
+        Rows are parsed as each chunk of the body arrives instead of after
+        the whole body is read, so memory stays bounded for large responses.
+        """
+        intervals = self._decoder.intervals
+        return self._stream_rows(
+            f"{USAGE_DAILY_URL}/{self._account_id(account_id)}?date={date}",
+            lambda fuel, row: (
+                parse_daily_electricity(row, intervals)
+                if fuel == "electricity"
+                else parse_daily_gas(row, intervals)
+            ),
+            chunk_size,
+        )
+
+    def stream_half_hourly_usage(
+        self,
+        date: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        *,
+        account_id: int | None = None,
+    ) -> AsyncIterator[tuple[UsageFuel, OVOHalfHour]]:
+        """Stream half hourly usage rows as (fuel, row) pairs while they download."""
+        intervals = self._decoder.intervals
+        return self._stream_rows(
+            f"{USAGE_HALF_HOURLY_URL}/{self._account_id(account_id)}?date={date}",
+            lambda _, row: parse_half_hour(row, intervals),
+            chunk_size,
+        )
+
+    async def _gather_limited(
+        self,
+        calls: list[Callable[[], Awaitable[_T]]],
+        concurrency: int,
+    ) -> list[_T]:
+        """Run calls in order, with at most `concurrency` in flight at once."""
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _limited(call: Callable[[], Awaitable[_T]]) -> _T:
+            async with semaphore:
+                return await call()
+
+        return await asyncio.gather(*(_limited(call) for call in calls))
+
+    async def _iter_limited(
+        self,
+        calls: Iterable[Callable[[], Awaitable[_T]]],
+        concurrency: int,
+    ) -> AsyncIterator[_T]:
+        """Run calls with at most `concurrency` in flight, yielding in order."""
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+
+        pending: deque[asyncio.Task[_T]] = deque()
+        try:
+            for call in calls:
+                pending.append(asyncio.ensure_future(call()))
+                if len(pending) >= concurrency:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _dated(
+        self,
+        period: dt_date,
+        call: Callable[[], Awaitable[_T]],
+    ) -> tuple[dt_date, _T]:
+        """Await a call, pairing its result with the period it was for."""
+        return (period, await call())
+
+    async def iter_daily_usage(
+        self,
+        start: dt_date,
+        end: dt_date,
+        concurrency: int = DEFAULT_USAGE_CONCURRENCY,
+        *,
+        account_id: int | None = None,
+    ) -> AsyncIterator[tuple[dt_date, OVODailyUsage]]:
+        """Yield daily usage for each month from start to end as it arrives.
+
+        Months are yielded in order, with at most `concurrency` requests
+        in flight, so memory stays flat however long the range is.
+        """
+        async for result in self._iter_limited(
+            (
+                partial(
+                    self._dated,
+                    month,
+                    partial(
+                        self.get_daily_usage,
+                        month.strftime("%Y-%m"),
+                        account_id=account_id,
+                    ),
+                )
+                for month in _iter_months(start, end)
+            ),
+            concurrency,
+        ):
+            yield result
+
+    async def iter_half_hourly_usage(
+        self,
+        start: dt_date,
+        end: dt_date,
+        concurrency: int = DEFAULT_USAGE_CONCURRENCY,
+        *,
+        account_id: int | None = None,
+    ) -> AsyncIterator[tuple[dt_date, OVOHalfHourUsage]]:
+        """Yield half hourly usage for each day from start to end as it arrives.
+
+        Days are yielded in order, with at most `concurrency` requests in
+        flight, so memory stays flat however long the range is.
+        """
+        async for result in self._iter_limited(
+            (
+                partial(
+                    self._dated,
+                    day,
+                    partial(
+                        self.get_half_hourly_usage,
+                        day.isoformat(),
+                        account_id=account_id,
+                    ),
+                )
+                for day in _iter_days(start, end)
+            ),
+            concurrency,
+        ):
+            yield result
+
+    async def get_daily_usage_range(
+        self,
+        start: dt_date,
+        end: dt_date,
+        concurrency: int = DEFAULT_USAGE_CONCURRENCY,
+        *,
+        account_id: int | None = None,
+    ) -> OVODailyUsage:
+        """Get daily usage data for each day from start to end (inclusive).
+
+        Whole months are fetched, then trimmed to the days asked for.
+        """
+        results = await self._gather_limited(
+            [
+                partial(
+                    self.get_daily_usage,
+                    month.strftime("%Y-%m"),
+                    account_id=account_id,
+                )
+                for month in _iter_months(start, end)
+            ],
+            concurrency,
+        )
+
+        return OVODailyUsage(
+            electricity=_within_days(
+                _merge_usage([result.electricity for result in results]), start, end
+            ),
+            gas=_within_days(
+                _merge_usage([result.gas for result in results]), start, end
+            ),
+        )
+
+    async def get_half_hourly_usage_range(
+        self,
+        start: dt_date,
+        end: dt_date,
+        concurrency: int = DEFAULT_USAGE_CONCURRENCY,
+        *,
+        account_id: int | None = None,
     ) -> OVOHalfHourUsage:
-        """Get half hourly usage data."""
-        ovo_usage = OVOHalfHourUsage(
+        """Get half hourly usage data for each day from start to end (inclusive)."""
+        results = await self._gather_limited(
+            [
+                partial(
+                    self.get_half_hourly_usage,
+                    day.isoformat(),
+                    account_id=account_id,
+                )
+                for day in _iter_days(start, end)
+            ],
+            concurrency,
+        )
+
+        return OVOHalfHourUsage(
+            electricity=_merge_usage([result.electricity for result in results]),
+            gas=_merge_usage([result.gas for result in results]),
+        )
+
+    async def get_half_hourly_series_range(
+        self,
+        start: dt_date,
+        end: dt_date,
+        concurrency: int = DEFAULT_USAGE_CONCURRENCY,
+        *,
+        account_id: int | None = None,
+    ) -> OVOHalfHourSeriesUsage:
+        """Get half hourly usage data as columnar series for a range of days."""
+        results = await self._gather_limited(
+            [
+                partial(
+                    self.get_half_hourly_series, day.isoformat(), account_id=account_id
+                )
+                for day in _iter_days(start, end)
+            ],
+            concurrency,
+        )
+
+        ovo_usage = OVOHalfHourSeriesUsage(
             electricity=None,
             gas=None,
         )
+        for result in results:
+            for fuel in ("electricity", "gas"):
+                if (series := getattr(result, fuel)) is None:
+                    continue
+                if (merged := getattr(ovo_usage, fuel)) is None:
+                    setattr(ovo_usage, fuel, series)
+                else:
+                    merged.extend(series)
 
-        response = await self._request(
-            f"{USAGE_HALF_HOURLY_URL}/{self.account_id}?date={date}",
-            "GET",
+        return ovo_usage
+
+    async def _sync_daily_month(
+        self,
+        store: "OVOUsageStore",
+        account_id: int,
+        month: dt_date,
+    ) -> None:
+        """Fetch a month of daily usage into the store."""
+        period = month.strftime("%Y-%m")
+        fetched_at = datetime.now(UTC)
+        store.write_daily_usage(
+            account_id, await self.get_daily_usage(period, account_id=account_id)
         )
-        json_response = await response.json()
-
-        if "electricity" in json_response:
-            electricity = json_response["electricity"]
-            if electricity and "data" in electricity:
-                ovo_usage.electricity = []
-                for usage in electricity["data"]:
-                    if usage is not None:
-                        ovo_usage.electricity.append(
-                            OVOHalfHour(
-                                consumption=usage["consumption"],
-                                interval=OVOInterval(
-                                    start=datetime.fromisoformat(
-                                        usage["interval"]["start"]
-                                    ),
-                                    end=datetime.fromisoformat(
-                                        usage["interval"]["end"]
-                                    ),
-                                ),
-                                unit=usage["unit"],
-                            )
-                        )
-        if "gas" in json_response:
-            gas = json_response["gas"]
-            if gas and "data" in gas:
-                ovo_usage.gas = []
-                for usage in gas["data"]:
-                    if usage is not None:
-                        ovo_usage.gas.append(
-                            OVOHalfHour(
-                                consumption=usage["consumption"],
-                                interval=OVOInterval(
-                                    start=datetime.fromisoformat(
-                                        usage["interval"]["start"]
-                                    ),
-                                    end=datetime.fromisoformat(
-                                        usage["interval"]["end"]
-                                    ),
-                                ),
-                                unit=usage["unit"],
-                            )
-                        )
+        store.mark_fetched(account_id, "daily", period, fetched_at)
 
-        return ovo_usage
+    async def _sync_half_hourly_day(
+        self,
+        store: "OVOUsageStore",
+        account_id: int,
+        day: dt_date,
+    ) -> None:
+        """Fetch a day of half hourly usage into the store."""
+        period = day.isoformat()
+        fetched_at = datetime.now(UTC)
+        store.write_half_hourly_usage(
+            account_id,
+            day,
+            await self.get_half_hourly_usage(period, account_id=account_id),
+        )
+        store.mark_fetched(account_id, "half_hourly", period, fetched_at)
 
-    async def get_footprint(self) -> OVOFootprint:
+    async def sync(
+        self,
+        store: "OVOUsageStore",
+        start: dt_date,
+        end: dt_date,
+        revision_window: timedelta = DEFAULT_SYNC_REVISION_WINDOW,
+        concurrency: int = DEFAULT_USAGE_CONCURRENCY,
+        *,
+        account_id: int | None = None,
+    ) -> None:
+        """Sync daily and half hourly usage from start to end into a store.
+
+        Only periods that have not been fetched yet, or were last fetched
+        within `revision_window` of the period ending, are requested again.
+        """
+        if (account_id := self._account_id(account_id)) is None:
+            raise OVOEnergyNoAccount("No account id set")
+
+        daily_fetched = store.get_fetched(account_id, "daily")
+        half_hourly_fetched = store.get_fetched(account_id, "half_hourly")
+
+        calls: list[Callable[[], Awaitable[None]]] = [
+            partial(self._sync_daily_month, store, account_id, month)
+            for month in _iter_months(start, end)
+            if _needs_sync(
+                daily_fetched.get(month.strftime("%Y-%m")),
+                (month + timedelta(days=32)).replace(day=1),
+                revision_window,
+            )
+        ]
+        calls.extend(
+            partial(self._sync_half_hourly_day, store, account_id, day)
+            for day in _iter_days(start, end)
+            if _needs_sync(
+                half_hourly_fetched.get(day.isoformat()),
+                day + timedelta(days=1),
+                revision_window,
+            )
+        )
+
+        _LOGGER.debug("Syncing %s periods for account %s", len(calls), account_id)
+
+        await self._gather_limited(calls, concurrency)
+
+    async def _backfill_half_hourly(
+        self,
+        store: "OVOUsageStore",
+        account_ids: list[int],
+        start: dt_date,
+        end: dt_date,
+        *,
+        concurrency: int,
+        limit: int | None,
+    ) -> list["OVOHalfHourGap"]:
+        """Fetch the days with half hourly gaps, most important first."""
+        gaps = store.get_half_hourly_gaps(account_ids, start, end)
+        # One request fills both fuels for a day
+        fetches = list(dict.fromkeys((gap.account_id, gap.day) for gap in gaps))
+        if limit is not None:
+            fetches = fetches[:limit]
+
+        _LOGGER.debug(
+            "Backfilling %s days for %s half hourly gaps", len(fetches), len(gaps)
+        )
+
+        # Calls acquire the semaphore in order, so they start by priority
+        await self._gather_limited(
+            [
+                partial(self._sync_half_hourly_day, store, account_id, day)
+                for account_id, day in fetches
+            ],
+            concurrency,
+        )
+        return store.get_half_hourly_gaps(account_ids, start, end)
+
+    async def backfill_half_hourly(
+        self,
+        store: "OVOUsageStore",
+        start: dt_date,
+        end: dt_date,
+        concurrency: int = DEFAULT_USAGE_CONCURRENCY,
+        *,
+        limit: int | None = None,
+        account_id: int | None = None,
+    ) -> list["OVOHalfHourGap"]:
+        """Fetch half hourly usage missing from a store, from start to end.
+
+        Only days whose stored daily usage says half hourly data exists, but
+        which are missing half hours in the store, are requested, newest
+        first and at most `limit` of them. Run `sync` first so daily usage is
+        stored. Returns the gaps still missing afterwards, which are usually
+        data the API does not have yet.
+        """
+        if (account_id := self._account_id(account_id)) is None:
+            raise OVOEnergyNoAccount("No account id set")
+
+        return await self._backfill_half_hourly(
+            store, [account_id], start, end, concurrency=concurrency, limit=limit
+        )
+
+    async def backfill_half_hourly_all_accounts(
+        self,
+        store: "OVOUsageStore",
+        start: dt_date,
+        end: dt_date,
+        concurrency: int = DEFAULT_USAGE_CONCURRENCY,
+        *,
+        limit: int | None = None,
+    ) -> list["OVOHalfHourGap"]:
+        """Fetch half hourly usage missing from a store for every account.
+
+        Gaps are prioritised across all accounts together.
+        """
+        return await self._backfill_half_hourly(
+            store,
+            self._all_account_ids(),
+            start,
+            end,
+            concurrency=concurrency,
+            limit=limit,
+        )
+
+    async def get_footprint(
+        self,
+        *,
+        account_id: int | None = None,
+    ) -> OVOFootprint:
         """Get footprint."""
+        if (cached := self._cache_get("footprint", account_id)) is not None:
+            return cached
+
+        footprint = await self._get_conditional(
+            f"{CARBON_FOOTPRINT_URL}/{self._account_id(account_id)}/footprint",
+            lambda body: parse_footprint(self._decoder.loads(body)),
+        )
+        self._cache_set("footprint", footprint, account_id)
+
+        return footprint
+
+    async def get_footprint_all_accounts(
+        self,
+        concurrency: int = DEFAULT_USAGE_CONCURRENCY,
+    ) -> dict[int, OVOFootprint]:
+        """Get footprint for every account, keyed by account id."""
+        return await self._gather_accounts(
+            lambda account_id: self.get_footprint(account_id=account_id),
+            concurrency,
+        )
+
+    async def get_plans(
+        self,
+        *,
+        account_id: int | None = None,
+    ) -> OVOPlans:
+        """Get plans, with their unit rates and standing charges."""
+        if (cached := self._cache_get("plans", account_id)) is not None:
+            return cached
+
         response = await self._request(
-            f"{CARBON_FOOTPRINT_URL}/{self.account_id}/footprint",
+            f"{PLANS_URL}/{self._account_id(account_id)}",
             "GET",
         )
-        json_response = await response.json()
-
-        return OVOFootprint(
-            from_=json_response["from"],
-            to=json_response["to"],
-            carbon_reduction_product_ids=json_response["carbonReductionProductIds"],
-            carbon_footprint=OVOCarbonFootprint(
-                carbon_kg=json_response["carbonFootprint"]["carbonKg"],
-                carbon_saved_kg=json_response["carbonFootprint"]["carbonSavedKg"],
-                k_wh=json_response["carbonFootprint"]["kWh"],
-                breakdown=OVOFootprintBreakdown(
-                    electricity=OVOFootprintElectricity(
-                        carbon_kg=json_response["carbonFootprint"]["breakdown"][
-                            "electricity"
-                        ]["carbonKg"],
-                        carbon_saved_kg=json_response["carbonFootprint"]["breakdown"][
-                            "electricity"
-                        ]["carbonSavedKg"],
-                        k_wh=json_response["carbonFootprint"]["breakdown"][
-                            "electricity"
-                        ]["kWh"],
-                    ),
-                    gas=OVOFootprintGas(
-                        carbon_kg=json_response["carbonFootprint"]["breakdown"]["gas"][
-                            "carbonKg"
-                        ],
-                        carbon_saved_kg=json_response["carbonFootprint"]["breakdown"][
-                            "gas"
-                        ]["carbonSavedKg"],
-                        k_wh=json_response["carbonFootprint"]["breakdown"]["gas"][
-                            "kWh"
-                        ],
-                    ),
-                ),
-            ),
+        plans = self._decode(
+            response, lambda body: parse_plans(self._decoder.loads(body))
+        )
+        self._cache_set("plans", plans, account_id)
+
+        return plans
+
+    async def get_plans_all_accounts(
+        self,
+        concurrency: int = DEFAULT_USAGE_CONCURRENCY,
+    ) -> dict[int, OVOPlans]:
+        """Get plans for every account, keyed by account id."""
+        return await self._gather_accounts(
+            lambda account_id: self.get_plans(account_id=account_id),
+            concurrency,
         )
 
-    async def get_carbon_intensity(self):
+    async def get_carbon_intensity(self) -> OVOCarbonIntensity:
         """Get carbon intensity."""
-        response = await self._request(
+        if (cached := self._cache_get("carbon_intensity")) is not None:
+            return cached
+
+        carbon_intensity = await self._get_conditional(
             CARBON_INTENSITY_URL,
-            "GET",
+            lambda body: parse_carbon_intensity(self._decoder.loads(body)),
         )
-        json_response = await response.json()
+        self._cache_set("carbon_intensity", carbon_intensity)
 
-        return OVOCarbonIntensity(
-            forecast=[
-                OVOCarbonIntensityForecast(
-                    time_from=forecast["from"],
-                    intensity=forecast["intensity"],
-                    level=forecast["level"],
-                    colour=forecast["colour"],
-                    colour_v2=forecast["colourV2"],
-                )
-                for forecast in json_response["forecast"]
-            ],
-            current=json_response["current"],
-            greentime=json_response["greentime"],
-        )
+        return carbon_intensity
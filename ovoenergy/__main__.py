@@ -1,15 +1,32 @@
 """Main."""
 
 import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import asdict
-from datetime import datetime, timedelta
+from datetime import date as dt_date, datetime, timedelta
+from enum import StrEnum
+from functools import cache
+import json
 import os
 from pathlib import Path
+import sys
+from typing import TYPE_CHECKING, TextIO
 
-import aiohttp
 import typer
 
-from . import OVOEnergy
+from . import DEFAULT_USAGE_CONCURRENCY, OVOEnergy
+from .batch import DEFAULT_BATCH_CONCURRENCY, parse_batch, run_batch
+from .export import (
+    DAILY_FIELDS,
+    HALF_HOURLY_FIELDS,
+    OVORowWriter,
+    daily_rows,
+    half_hourly_rows,
+)
+
+if TYPE_CHECKING:
+    import aiohttp
 
 
 def _load_env_file(env_path: str = ".env") -> None:
@@ -42,18 +59,67 @@ def _load_env_file(env_path: str = ".env") -> None:
                     os.environ[key] = value
 
 
-# Load environment variables from .env file
-_load_env_file()
+@contextmanager
+def _open_stream(path: str, mode: str = "r") -> Iterator[TextIO]:
+    """Open a text file, or stdin/stdout when the path is "-"."""
+    if path == "-":
+        yield sys.stdout if "w" in mode else sys.stdin
+        return
+
+    # newline="" lets the csv module write its own line endings
+    with open(path, mode, encoding="utf-8", newline="") as stream:
+        yield stream
+
+
+class ExportInterval(StrEnum):
+    """Export interval."""
+
+    DAILY = "daily"
+    HALF_HOURLY = "halfhourly"
+
+
+class ExportFormatOption(StrEnum):
+    """Export format."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class ExportFuelOption(StrEnum):
+    """Export fuel."""
+
+    ELECTRICITY = "electricity"
+    GAS = "gas"
+
 
 app = typer.Typer()
-loop = asyncio.new_event_loop()
-asyncio.set_event_loop(loop)
+
+
+@cache
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop for commands, creating it on first use."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    return loop
+
+
+@app.callback()
+def main() -> None:
+    """Get energy data from OVO Energy."""
+    # Load environment variables from .env file, only once a command runs
+    _load_env_file()
 
 
 async def _setup_client(
     account: int | None = None,
-) -> tuple[OVOEnergy, aiohttp.ClientSession]:
+) -> tuple[OVOEnergy, "aiohttp.ClientSession"]:
     """Set up OVO Energy client."""
+    # Deferred so that --help and argument errors do not pay for loading these
+    # pylint: disable=import-outside-toplevel
+    import aiohttp  # noqa: PLC0415
+
+    from .credentials import OVOCredentialCache  # noqa: PLC0415
+
     # Get credentials from environment variables
     username = os.getenv("OVO_USERNAME")
     password = os.getenv("OVO_PASSWORD")
@@ -65,9 +131,21 @@ async def _setup_client(
         )
         raise typer.Abort()
 
+    # Reuse the session from a previous run if a credential cache is set
+    credential_cache_path = os.getenv("OVO_CREDENTIAL_CACHE")
+    credential_cache = (
+        OVOCredentialCache(
+            credential_cache_path,
+            key=os.getenv("OVO_CREDENTIAL_KEY") or None,
+        )
+        if credential_cache_path
+        else None
+    )
+
     client_session = aiohttp.ClientSession()
     client = OVOEnergy(
         client_session=client_session,
+        credential_cache=credential_cache,
     )
 
     if not await client.authenticate(username, password):
@@ -96,14 +174,14 @@ def daily(
         # Get this month
         date = datetime.now().strftime("%Y-%m")
 
-    [client, client_session] = loop.run_until_complete(_setup_client(account))
-    ovo_usage = loop.run_until_complete(client.get_daily_usage(date))
+    [client, client_session] = _get_loop().run_until_complete(_setup_client(account))
+    ovo_usage = _get_loop().run_until_complete(client.get_daily_usage(date))
 
     typer.secho(
         asdict(ovo_usage) if ovo_usage is not None else '{"message": "No data"}',
         fg=typer.colors.GREEN,
     )
-    loop.run_until_complete(client_session.close())
+    _get_loop().run_until_complete(client_session.close())
 
 
 @app.command(name="halfhourly", short_help="Get half hourly usage from OVO Energy")
@@ -120,14 +198,14 @@ def half_hourly(
         # Get yesterday's date
         date = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
 
-    [client, client_session] = loop.run_until_complete(_setup_client(account))
-    ovo_usage = loop.run_until_complete(client.get_half_hourly_usage(date))
+    [client, client_session] = _get_loop().run_until_complete(_setup_client(account))
+    ovo_usage = _get_loop().run_until_complete(client.get_half_hourly_usage(date))
 
     typer.secho(
         asdict(ovo_usage) if ovo_usage is not None else '{"message": "No data"}',
         fg=typer.colors.GREEN,
     )
-    loop.run_until_complete(client_session.close())
+    _get_loop().run_until_complete(client_session.close())
 
 
 @app.command(name="carbon-footprint", short_help="Get carbon footprint from OVO Energy")
@@ -137,8 +215,8 @@ def carbon_footprint(
     ),
 ) -> None:
     """Get carbon footprint from OVO Energy."""
-    [client, client_session] = loop.run_until_complete(_setup_client(account))
-    ovo_footprint = loop.run_until_complete(client.get_footprint())
+    [client, client_session] = _get_loop().run_until_complete(_setup_client(account))
+    ovo_footprint = _get_loop().run_until_complete(client.get_footprint())
 
     typer.secho(
         (
@@ -148,7 +226,7 @@ def carbon_footprint(
         ),
         fg=typer.colors.GREEN,
     )
-    loop.run_until_complete(client_session.close())
+    _get_loop().run_until_complete(client_session.close())
 
 
 @app.command(name="carbon-intensity", short_help="Get carbon intensity from OVO Energy")
@@ -158,8 +236,8 @@ def carbon_intensity(
     ),
 ) -> None:
     """Get carbon intensity from OVO Energy."""
-    [client, client_session] = loop.run_until_complete(_setup_client(account))
-    ovo_carbon_intensity = loop.run_until_complete(client.get_carbon_intensity())
+    [client, client_session] = _get_loop().run_until_complete(_setup_client(account))
+    ovo_carbon_intensity = _get_loop().run_until_complete(client.get_carbon_intensity())
 
     typer.secho(
         (
@@ -169,7 +247,153 @@ def carbon_intensity(
         ),
         fg=typer.colors.GREEN,
     )
-    loop.run_until_complete(client_session.close())
+    _get_loop().run_until_complete(client_session.close())
+
+
+async def _export(
+    client: OVOEnergy,
+    writer: OVORowWriter,
+    *,
+    interval: ExportInterval,
+    fuel: ExportFuelOption,
+    start: dt_date,
+    end: dt_date,
+    concurrency: int,
+) -> int:
+    """Stream usage rows to a writer as each response arrives."""
+    count = 0
+    if interval == ExportInterval.DAILY:
+        async for _, daily_usage in client.iter_daily_usage(start, end, concurrency):
+            if daily_usage is not None:
+                count += writer.write(daily_rows(daily_usage, fuel, start, end))
+    else:
+        async for _, half_hourly_usage in client.iter_half_hourly_usage(
+            start, end, concurrency
+        ):
+            if half_hourly_usage is not None:
+                count += writer.write(half_hourly_rows(half_hourly_usage, fuel))
+    return count
+
+
+@app.command(name="export", short_help="Export usage history from OVO Energy")
+def export(
+    *,
+    start: datetime = typer.Option(
+        ..., formats=["%Y-%m-%d"], help="First date to export"
+    ),
+    end: datetime = typer.Option(
+        None, formats=["%Y-%m-%d"], help="Last date to export (default: yesterday)"
+    ),
+    interval: ExportInterval = typer.Option(
+        ExportInterval.HALF_HOURLY, help="Usage interval to export"
+    ),
+    fuel: ExportFuelOption = typer.Option(
+        ExportFuelOption.ELECTRICITY, help="Fuel to export"
+    ),
+    export_format: ExportFormatOption = typer.Option(
+        ExportFormatOption.NDJSON, "--format", help="Output format"
+    ),
+    output: str = typer.Option(
+        "-", help="File to write to (default: stdout)", show_default=False
+    ),
+    account: int = typer.Option(
+        None, help="OVO Energy account number (default: first account)"
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_USAGE_CONCURRENCY, min=1, help="Maximum requests in flight"
+    ),
+) -> None:
+    """Stream usage history from OVO Energy as NDJSON or CSV."""
+    start_date = start.date()
+    end_date = (
+        end.date() if end is not None else (datetime.now() - timedelta(days=1)).date()
+    )
+    if end_date < start_date:
+        raise typer.BadParameter("End date must not be before start date")
+
+    [client, client_session] = _get_loop().run_until_complete(_setup_client(account))
+    try:
+        with _open_stream(output, mode="w") as stream:
+            writer = OVORowWriter(
+                stream,
+                export_format,
+                DAILY_FIELDS
+                if interval == ExportInterval.DAILY
+                else HALF_HOURLY_FIELDS,
+            )
+            count = _get_loop().run_until_complete(
+                _export(
+                    client,
+                    writer,
+                    interval=interval,
+                    fuel=fuel,
+                    start=start_date,
+                    end=end_date,
+                    concurrency=concurrency,
+                )
+            )
+    finally:
+        _get_loop().run_until_complete(client_session.close())
+
+    typer.secho(f"Exported {count} rows", fg=typer.colors.GREEN, err=True)
+
+
+async def _batch(
+    client: OVOEnergy,
+    lines: list[str],
+    output: TextIO,
+    concurrency: int,
+) -> int:
+    """Run batch operations, writing one JSON line per result."""
+    failed = 0
+    async for result in run_batch(client, parse_batch(lines), concurrency):
+        if "error" in result:
+            failed += 1
+        output.write(json.dumps(result, default=str))
+        output.write("\n")
+        output.flush()
+    return failed
+
+
+@app.command(name="batch", short_help="Run many operations on one client")
+def batch(
+    operations: str = typer.Option(
+        "-",
+        "--input",
+        help="File of operations, one per line (default: stdin)",
+        show_default=False,
+    ),
+    output: str = typer.Option(
+        "-", help="File to write to (default: stdout)", show_default=False
+    ),
+    account: int = typer.Option(
+        None, help="OVO Energy account number (default: first account)"
+    ),
+    concurrency: int = typer.Option(
+        DEFAULT_BATCH_CONCURRENCY, min=1, help="Maximum operations in flight"
+    ),
+) -> None:
+    """Run operations such as `daily --date 2024-01` after a single login.
+
+    Each line is a command (daily, halfhourly, carbon-footprint or
+    carbon-intensity) with an optional --date. Results are written as JSON
+    lines tagged with their input line number.
+    """
+    with _open_stream(operations) as stream:
+        lines = list(stream)
+
+    [client, client_session] = _get_loop().run_until_complete(_setup_client(account))
+    try:
+        with _open_stream(output, mode="w") as stream:
+            failed = _get_loop().run_until_complete(
+                _batch(client, lines, stream, concurrency)
+            )
+    finally:
+        _get_loop().run_until_complete(client_session.close())
+
+    if failed:
+        typer.secho(f"{failed} operations failed", fg=typer.colors.RED, err=True)
+        raise typer.Exit(code=1)
 
 
 if __name__ == "__main__":
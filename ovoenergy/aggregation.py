@@ -0,0 +1,351 @@
+"""Hourly, daily, weekly and monthly rollups of half hourly usage."""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+import math
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from . import intervals
+from .models import OVOHalfHour
+from .models.aggregation import OVOUsageRollup, RollupPeriod
+from .models.columnar import OVOHalfHourSeries
+
+DEFAULT_TIMEZONE = "Europe/London"
+# How many local days before the newest slot stay open to revision
+DEFAULT_SLOT_HISTORY = timedelta(days=7)
+ROLLUP_PERIODS: tuple[RollupPeriod, ...] = ("hour", "day", "week", "month")
+
+_EPOCH_DATE = date(1970, 1, 1)
+_HOUR_SECONDS = 3600
+_DAY_SECONDS = 86400
+
+# Sum and slot count per bucket
+_Totals = dict[int, tuple[float, int]]
+
+
+class _OffsetCache:
+    """UTC offsets of a time zone, looked up once per UTC hour.
+
+    Offsets only change on hour boundaries, so every slot in the same UTC
+    hour shares one lookup however many days are aggregated.
+    """
+
+    def __init__(self, tz: tzinfo) -> None:
+        """Initialize."""
+        self._tz = tz
+        self._offsets: dict[int, int] = {}
+
+    def __call__(self, hour: int) -> int:
+        """Return the offset in seconds at the start of a UTC hour."""
+        if (offset := self._offsets.get(hour)) is None:
+            offset = int(
+                datetime.fromtimestamp(hour * _HOUR_SECONDS, self._tz)
+                .utcoffset()
+                .total_seconds()
+            )
+            self._offsets[hour] = offset
+        return offset
+
+
+def _bucket_python(
+    starts: Any,
+    values: Any,
+    counts: Any,
+    offsets: _OffsetCache,
+) -> tuple[_Totals, _Totals]:
+    """Sum values into local hour and local day buckets, one slot at a time."""
+    hours: dict[int, list[Any]] = {}
+    days: dict[int, list[Any]] = {}
+    for start, value, count in zip(starts, values, counts, strict=True):
+        local = start + offsets(start // _HOUR_SECONDS)
+        for buckets, key in (
+            (hours, start - local % _HOUR_SECONDS),
+            (days, local // _DAY_SECONDS),
+        ):
+            bucket = buckets.setdefault(key, [0.0, 0])
+            bucket[0] += value
+            bucket[1] += count
+    return (
+        {key: (total, count) for key, (total, count) in hours.items()},
+        {key: (total, count) for key, (total, count) in days.items()},
+    )
+
+
+def _bucket_numpy(
+    np: Any,
+    starts: Any,
+    values: Any,
+    counts: Any,
+    offsets: _OffsetCache,
+) -> tuple[_Totals, _Totals]:
+    """Sum values into local hour and local day buckets in vectorised passes."""
+    start_array = np.frombuffer(starts, dtype=np.int64)
+    value_array = np.frombuffer(values, dtype=np.float64)
+    count_array = np.frombuffer(counts, dtype=np.int64)
+
+    utc_hours, hour_index = np.unique(start_array // _HOUR_SECONDS, return_inverse=True)
+    hour_offsets = np.array([offsets(int(hour)) for hour in utc_hours], np.int64)
+    local = start_array + hour_offsets[hour_index]
+
+    totals: list[_Totals] = []
+    for keys in (start_array - local % _HOUR_SECONDS, local // _DAY_SECONDS):
+        unique, index = np.unique(keys, return_inverse=True)
+        sums = np.bincount(index, weights=value_array, minlength=len(unique))
+        slot_counts = np.bincount(index, weights=count_array, minlength=len(unique))
+        totals.append(
+            {
+                int(key): (float(total), int(count))
+                for key, total, count in zip(
+                    unique.tolist(), sums.tolist(), slot_counts.tolist(), strict=True
+                )
+            }
+        )
+    return (totals[0], totals[1])
+
+
+def period_start(day: date, period: RollupPeriod) -> date:
+    """Return the key of the day, ISO week or month a local date falls in."""
+    if period == "week":
+        return day - timedelta(days=day.weekday())
+    if period == "month":
+        return day.replace(day=1)
+    if period == "day":
+        return day
+    raise ValueError(f"No date key for {period} periods")
+
+
+def local_epochs(
+    starts: array,
+    tz: str | tzinfo = DEFAULT_TIMEZONE,
+) -> array:
+    """Shift UTC epoch seconds to local wall clock epoch seconds."""
+    offsets = _OffsetCache(ZoneInfo(tz) if isinstance(tz, str) else tz)
+    if (np := intervals.numpy_or_none()) is None or not starts:
+        return array("q", [start + offsets(start // _HOUR_SECONDS) for start in starts])
+
+    start_array = np.frombuffer(starts, dtype=np.int64)
+    utc_hours, hour_index = np.unique(start_array // _HOUR_SECONDS, return_inverse=True)
+    hour_offsets = np.array([offsets(int(hour)) for hour in utc_hours], np.int64)
+    return array("q", (start_array + hour_offsets[hour_index]).tobytes())
+
+
+class OVOUsageAggregator:
+    """Maintain hourly, daily, ISO week and monthly usage totals.
+
+    Periods follow the local time zone, so days are 23 or 25 hours long
+    across DST changes and the repeated autumn hour is its own bucket.
+    Totals are updated incrementally: adding a day, or a revised slot,
+    only applies the difference to the buckets it falls in. Missing
+    (NaN) consumption is not counted.
+
+    Slots are remembered, sorted by start, only for the `history` whole
+    local days before the newest one. Older days are closed: their totals
+    are kept, and later rows for them are ignored. With no history, every
+    slot is remembered.
+    """
+
+    def __init__(
+        self,
+        tz: str | tzinfo = DEFAULT_TIMEZONE,
+        history: timedelta | None = DEFAULT_SLOT_HISTORY,
+    ) -> None:
+        """Initialize."""
+        self._tz = ZoneInfo(tz) if isinstance(tz, str) else tz
+        self._offsets = _OffsetCache(self._tz)
+        self._history = history
+        self.unit: str | None = None
+        self._slot_starts = array("q")
+        self._slot_values = array("d")
+        self._closed_before = -(2**63)
+        self._totals: dict[RollupPeriod, dict[date | datetime, list[Any]]] = {
+            period: {} for period in ROLLUP_PERIODS
+        }
+
+    def __len__(self) -> int:
+        """Return the number of slots still open to revision."""
+        return len(self._slot_starts)
+
+    def _check_unit(self, unit: str | None) -> None:
+        """Set the unit from the first series, and check later ones match."""
+        if unit is None:
+            return
+        if self.unit is None:
+            self.unit = unit
+        elif unit != self.unit:
+            raise ValueError(f"Unit {unit} does not match aggregator unit {self.unit}")
+
+    def _deltas_python(self, series: OVOHalfHourSeries) -> tuple[Any, Any, Any]:
+        """Turn a series into per-slot deltas, one slot at a time."""
+        starts = array("q")
+        deltas = array("d")
+        count_deltas = array("q")
+        slot_starts = self._slot_starts
+        slot_values = self._slot_values
+        for start, consumption in zip(series.starts, series.consumption, strict=True):
+            if start < self._closed_before:
+                continue
+
+            index = bisect_left(slot_starts, start)
+            found = index < len(slot_starts) and slot_starts[index] == start
+            old = slot_values[index] if found else math.nan
+            new_valid = not math.isnan(consumption)
+            old_valid = not math.isnan(old)
+            if found and (old == consumption or (not old_valid and not new_valid)):
+                continue
+
+            if found:
+                slot_values[index] = consumption
+            else:
+                slot_starts.insert(index, start)
+                slot_values.insert(index, consumption)
+            starts.append(start)
+            deltas.append(
+                (consumption if new_valid else 0.0) - (old if old_valid else 0.0)
+            )
+            count_deltas.append(int(new_valid) - int(old_valid))
+        return starts, deltas, count_deltas
+
+    def _deltas_numpy(self, np: Any, series: OVOHalfHourSeries) -> tuple[Any, Any, Any]:
+        """Turn a series into per-slot deltas in vectorised passes."""
+        new_starts = np.frombuffer(series.starts, dtype=np.int64)
+        new_values = np.frombuffer(series.consumption, dtype=np.float64)
+
+        # Sorted by start, keeping the last row for a slot given twice
+        order = np.argsort(new_starts, kind="stable")
+        new_starts = new_starts[order]
+        new_values = new_values[order]
+        keep = np.append(new_starts[1:] != new_starts[:-1], True)
+        keep &= new_starts >= self._closed_before
+        new_starts = new_starts[keep]
+        new_values = new_values[keep]
+
+        old_starts = np.frombuffer(self._slot_starts, dtype=np.int64)
+        old_values = np.frombuffer(self._slot_values, dtype=np.float64)
+        if (
+            old_starts.size == 0
+            or new_starts.size == 0
+            or new_starts[0] > old_starts[-1]
+        ):
+            # Only slots not seen before, e.g. the next day's data
+            index = np.full(len(new_starts), len(old_starts))
+            found = np.zeros(len(new_starts), dtype=bool)
+            old = np.full(len(new_starts), np.nan)
+        else:
+            index = np.searchsorted(old_starts, new_starts)
+            clipped = np.minimum(index, len(old_starts) - 1)
+            found = old_starts[clipped] == new_starts
+            old = np.where(found, old_values[clipped], np.nan)
+
+        new_valid = ~np.isnan(new_values)
+        old_valid = ~np.isnan(old)
+        changed = ~found | ~((old == new_values) | (~old_valid & ~new_valid))
+
+        values = old_values.copy()
+        values[index[found]] = new_values[found]
+        inserted = ~found
+        self._slot_starts = array(
+            "q",
+            np.insert(old_starts, index[inserted], new_starts[inserted]).tobytes(),
+        )
+        self._slot_values = array(
+            "d", np.insert(values, index[inserted], new_values[inserted]).tobytes()
+        )
+
+        deltas = np.where(new_valid, new_values, 0.0) - np.where(old_valid, old, 0.0)
+        count_deltas = new_valid.astype(np.int64) - old_valid.astype(np.int64)
+        return new_starts[changed], deltas[changed], count_deltas[changed]
+
+    def _prune(self) -> None:
+        """Close days before the history window, forgetting their slots."""
+        if self._history is None or not self._slot_starts:
+            return
+
+        newest = self._slot_starts[-1]
+        local_day = (newest + self._offsets(newest // _HOUR_SECONDS)) // _DAY_SECONDS
+        first_open = _EPOCH_DATE + timedelta(days=local_day) - self._history
+        cutoff = int(datetime.combine(first_open, time(), self._tz).timestamp())
+        if cutoff <= self._closed_before:
+            return
+
+        self._closed_before = cutoff
+        if index := bisect_left(self._slot_starts, cutoff):
+            del self._slot_starts[:index]
+            del self._slot_values[:index]
+
+    def add(self, series: OVOHalfHourSeries) -> None:
+        """Add or replace slots, updating every rollup by the difference."""
+        self._check_unit(series.unit)
+
+        # Turn the series into per-slot deltas against what was seen before
+        np = intervals.numpy_or_none()
+        if np is not None and series:
+            starts, deltas, count_deltas = self._deltas_numpy(np, series)
+        else:
+            starts, deltas, count_deltas = self._deltas_python(series)
+
+        if len(starts) == 0:
+            return
+
+        hours, days = (
+            _bucket_numpy(np, starts, deltas, count_deltas, self._offsets)
+            if np is not None
+            else _bucket_python(starts, deltas, count_deltas, self._offsets)
+        )
+
+        for key, delta in hours.items():
+            # Keyed with a fixed offset, as datetimes sharing a ZoneInfo ignore
+            # fold when compared and would merge the repeated autumn hour
+            offset = timezone(timedelta(seconds=self._offsets(key // _HOUR_SECONDS)))
+            self._apply("hour", datetime.fromtimestamp(key, offset), delta)
+        for key, delta in days.items():
+            day = _EPOCH_DATE + timedelta(days=key)
+            for period in ("day", "week", "month"):
+                self._apply(period, period_start(day, period), delta)
+
+        self._prune()
+
+    def add_half_hours(self, half_hours: Iterable[OVOHalfHour]) -> None:
+        """Add or replace slots from half hour models."""
+        self.add(OVOHalfHourSeries.from_half_hours(half_hours))
+
+    def _apply(
+        self,
+        period: RollupPeriod,
+        key: date | datetime,
+        delta: tuple[float, int],
+    ) -> None:
+        """Apply a delta to one bucket, dropping it once it has no slots."""
+        bucket = self._totals[period].setdefault(key, [0.0, 0])
+        bucket[0] += delta[0]
+        bucket[1] += delta[1]
+        if bucket[1] == 0:
+            del self._totals[period][key]
+
+    def total(self, period: RollupPeriod, key: date | datetime) -> float:
+        """Return the total for one period, or 0 if it has no slots."""
+        bucket = self._totals[period].get(key)
+        return bucket[0] if bucket is not None else 0.0
+
+    def rollup(self, period: RollupPeriod) -> OVOUsageRollup:
+        """Return a snapshot of the totals for a period, in time order."""
+        buckets = sorted(self._totals[period].items())
+        return OVOUsageRollup(
+            period=period,
+            unit=self.unit,
+            totals={key: total for key, (total, _) in buckets},
+            counts={key: count for key, (_, count) in buckets},
+        )
+
+
+def aggregate(
+    series: OVOHalfHourSeries,
+    period: RollupPeriod,
+    tz: str | tzinfo = DEFAULT_TIMEZONE,
+) -> OVOUsageRollup:
+    """Return the totals of a series for a period."""
+    aggregator = OVOUsageAggregator(tz)
+    aggregator.add(series)
+    return aggregator.rollup(period)
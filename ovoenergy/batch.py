@@ -0,0 +1,154 @@
+"""Batch operations run on one authenticated client."""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+import shlex
+from typing import Any
+
+from . import OVOEnergy
+from .exceptions import OVOEnergyException
+
+DEFAULT_BATCH_CONCURRENCY = 8
+
+
+def _this_month() -> str:
+    """Return this month as YYYY-MM."""
+    return datetime.now().strftime("%Y-%m")
+
+
+def _yesterday() -> str:
+    """Return yesterday as YYYY-MM-DD."""
+    return (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+async def _daily(client: OVOEnergy, date: str | None) -> Any:
+    """Get daily usage."""
+    return await client.get_daily_usage(date or _this_month())
+
+
+async def _half_hourly(client: OVOEnergy, date: str | None) -> Any:
+    """Get half hourly usage."""
+    return await client.get_half_hourly_usage(date or _yesterday())
+
+
+async def _carbon_footprint(client: OVOEnergy, _: str | None) -> Any:
+    """Get carbon footprint."""
+    return await client.get_footprint()
+
+
+async def _carbon_intensity(client: OVOEnergy, _: str | None) -> Any:
+    """Get carbon intensity."""
+    return await client.get_carbon_intensity()
+
+
+BATCH_COMMANDS: dict[str, Callable[[OVOEnergy, str | None], Awaitable[Any]]] = {
+    "daily": _daily,
+    "halfhourly": _half_hourly,
+    "carbon-footprint": _carbon_footprint,
+    "carbon-intensity": _carbon_intensity,
+}
+
+
+@dataclass(slots=True)
+class OVOBatchOperation:
+    """A batch operation parsed from one input line."""
+
+    line: int
+    command: str
+    date: str | None = None
+    error: str | None = None
+
+
+def parse_batch_line(line_number: int, line: str) -> OVOBatchOperation | None:
+    """Parse a line such as `daily --date 2024-01`.
+
+    Returns None for blank lines and comments. Lines that cannot be parsed
+    are returned with an error rather than raising, so one bad line does not
+    stop the rest of the batch.
+    """
+    try:
+        tokens = shlex.split(line, comments=True)
+    except ValueError as exception:
+        return OVOBatchOperation(line_number, line.strip(), error=str(exception))
+
+    if not tokens:
+        return None
+
+    command, *args = tokens
+    if command not in BATCH_COMMANDS:
+        return OVOBatchOperation(
+            line_number, command, error=f"Unknown command: {command}"
+        )
+
+    operation = OVOBatchOperation(line_number, command)
+    while args:
+        option = args.pop(0)
+        if option.startswith("--date="):
+            operation.date = option.removeprefix("--date=")
+        elif option == "--date" and args:
+            operation.date = args.pop(0)
+        else:
+            operation.error = f"Unexpected argument: {option}"
+            break
+
+    return operation
+
+
+def parse_batch(lines: Iterable[str]) -> list[OVOBatchOperation]:
+    """Parse batch operations, one per line."""
+    return [
+        operation
+        for line_number, line in enumerate(lines, start=1)
+        if (operation := parse_batch_line(line_number, line)) is not None
+    ]
+
+
+async def _run_operation(
+    client: OVOEnergy,
+    semaphore: asyncio.Semaphore,
+    operation: OVOBatchOperation,
+) -> dict[str, Any]:
+    """Run one operation, capturing its result or error."""
+    output: dict[str, Any] = {
+        "line": operation.line,
+        "command": operation.command,
+        "date": operation.date,
+    }
+    if operation.error is not None:
+        output["error"] = operation.error
+        return output
+
+    # Deferred so the CLI does not load aiohttp until a batch actually runs
+    # pylint: disable-next=import-outside-toplevel
+    import aiohttp  # noqa: PLC0415
+
+    async with semaphore:
+        try:
+            result = await BATCH_COMMANDS[operation.command](client, operation.date)
+        except (OVOEnergyException, aiohttp.ClientError, TimeoutError) as exception:
+            output["error"] = str(exception) or type(exception).__name__
+            return output
+
+    output["result"] = asdict(result) if result is not None else None
+    return output
+
+
+async def run_batch(
+    client: OVOEnergy,
+    operations: list[OVOBatchOperation],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> AsyncIterator[dict[str, Any]]:
+    """Run operations on one client, yielding outputs as they complete.
+
+    Outputs carry the input line number, as they may complete out of order.
+    """
+    if concurrency < 1:
+        raise ValueError("Concurrency must be at least 1")
+
+    semaphore = asyncio.Semaphore(concurrency)
+    for future in asyncio.as_completed(
+        [_run_operation(client, semaphore, operation) for operation in operations]
+    ):
+        yield await future
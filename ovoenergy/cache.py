@@ -0,0 +1,95 @@
+"""Response caching for the OVO Energy API client."""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Hashable
+from datetime import timedelta
+import time
+from typing import Any, Literal
+
+CacheEndpoint = Literal[
+    "bootstrap_accounts",
+    "carbon_intensity",
+    "footprint",
+    "plans",
+]
+
+DEFAULT_CACHE_SIZE = 1024
+# Validators and models for conditional requests, kept apart from responses
+DEFAULT_CONDITIONAL_CACHE_SIZE = 256
+CONDITIONAL_CACHE_TTL = timedelta(days=1)
+DEFAULT_CACHE_TTLS: dict[CacheEndpoint, timedelta] = {
+    "bootstrap_accounts": timedelta(hours=1),
+    "carbon_intensity": timedelta(minutes=30),
+    "footprint": timedelta(hours=3),
+    "plans": timedelta(hours=12),
+}
+
+
+class OVOCacheBackend(ABC):
+    """Base class for response cache backends.
+
+    A backend can be shared between client instances. Keys include the
+    endpoint and the customer/account they were fetched for.
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Any | None:
+        """Return a cached value, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, ttl: timedelta) -> None:
+        """Cache a value for ttl."""
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        """Remove a cached value."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all cached values."""
+
+
+class OVOMemoryCache(OVOCacheBackend):
+    """In-process cache with per-entry expiry and least recently used eviction."""
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """Initialize."""
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries, including expired ones."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return a cached value, or None if missing or expired."""
+        if (entry := self._entries.get(key)) is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: timedelta) -> None:
+        """Cache a value for ttl, evicting the least recently used entries."""
+        self._entries[key] = (time.monotonic() + ttl.total_seconds(), value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a cached value."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        self._entries.clear()
@@ -0,0 +1,164 @@
+"""On-disk credential cache."""
+
+from datetime import datetime
+from http.cookies import SimpleCookie
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+from typing import Any
+
+from .models.credentials import OVOCredentials
+from .models.oauth import OAuth
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # pragma: no cover
+    Fernet = None
+    InvalidToken = None
+
+_LOGGER = logging.getLogger(__name__)
+
+CREDENTIAL_FILE_MODE = 0o600
+
+
+def generate_credential_key() -> bytes:
+    """Generate a key for encrypting the credential cache."""
+    if Fernet is None:
+        raise ImportError("cryptography is required to encrypt the credential cache")
+
+    return Fernet.generate_key()
+
+
+def _dump_cookies(cookies: SimpleCookie) -> dict[str, dict[str, str]]:
+    """Serialize cookies, keeping their attributes."""
+    return {
+        name: {
+            "value": morsel.value,
+            **{key: value for key, value in morsel.items() if value},
+        }
+        for name, morsel in cookies.items()
+    }
+
+
+def _load_cookies(data: dict[str, dict[str, str]]) -> SimpleCookie:
+    """Deserialize cookies."""
+    cookies: SimpleCookie = SimpleCookie()
+    for name, attributes in data.items():
+        cookies[name] = attributes["value"]
+        for key, value in attributes.items():
+            if key != "value":
+                cookies[name][key] = value
+    return cookies
+
+
+def dump_credentials(credentials: OVOCredentials) -> dict[str, Any]:
+    """Serialize credentials to a JSON compatible dict."""
+    return {
+        "username": credentials.username,
+        "cookies": _dump_cookies(credentials.cookies),
+        "oauth": {
+            "access_token": credentials.oauth.access_token,
+            "expires_in": credentials.oauth.expires_in,
+            "refresh_expires_in": credentials.oauth.refresh_expires_in,
+            "expires_at": credentials.oauth.expires_at.isoformat(),
+        },
+        "customer_id": (
+            str(credentials.customer_id)
+            if credentials.customer_id is not None
+            else None
+        ),
+        "account_ids": credentials.account_ids,
+    }
+
+
+def load_credentials(data: dict[str, Any]) -> OVOCredentials:
+    """Deserialize credentials from a dict."""
+    return OVOCredentials(
+        username=data["username"],
+        cookies=_load_cookies(data["cookies"]),
+        oauth=OAuth(
+            access_token=data["oauth"]["access_token"],
+            expires_in=data["oauth"]["expires_in"],
+            refresh_expires_in=data["oauth"]["refresh_expires_in"],
+            expires_at=datetime.fromisoformat(data["oauth"]["expires_at"]),
+        ),
+        customer_id=data["customer_id"],
+        account_ids=data["account_ids"],
+    )
+
+
+class OVOCredentialCache:
+    """Store session cookies and the OAuth token in a file.
+
+    The file is only readable by its owner. If a key is given, the contents
+    are encrypted with Fernet, which needs the optional cryptography package.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        key: bytes | str | None = None,
+    ) -> None:
+        """Initialize."""
+        if key is not None and Fernet is None:
+            raise ImportError(
+                "cryptography is required to encrypt the credential cache"
+            )
+
+        self.path = Path(path)
+        self._fernet = Fernet(key) if key is not None else None
+
+    def load(self, username: str) -> OVOCredentials | None:
+        """Return cached credentials for a user, or None if there are none."""
+        try:
+            data = self.path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as exception:
+            _LOGGER.debug("Could not read credential cache: %s", exception)
+            return None
+
+        if self._fernet is not None:
+            try:
+                data = self._fernet.decrypt(data)
+            except InvalidToken:
+                _LOGGER.debug("Ignoring credential cache encrypted with another key")
+                return None
+
+        try:
+            credentials = load_credentials(json.loads(data))
+        except (ValueError, KeyError, TypeError) as exception:
+            _LOGGER.debug("Ignoring invalid credential cache: %s", exception)
+            return None
+
+        if credentials.username != username:
+            return None
+
+        return credentials
+
+    def save(self, credentials: OVOCredentials) -> None:
+        """Write credentials, replacing the file atomically."""
+        data = json.dumps(dump_credentials(credentials)).encode()
+        if self._fernet is not None:
+            data = self._fernet.encrypt(data)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # mkstemp creates the file with mode 0600, so the credentials are never
+        # readable by anyone else, even before the rename.
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}."
+        )
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.chmod(temp_path, CREDENTIAL_FILE_MODE)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def clear(self) -> None:
+        """Remove cached credentials."""
+        self.path.unlink(missing_ok=True)
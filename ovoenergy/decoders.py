@@ -0,0 +1,563 @@
+"""JSON decoders for API responses."""
+
+from array import array
+import json
+import logging
+import math
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+from .intervals import DEFAULT_INTERVAL_PARSER, OVOIntervalParser
+from .models import (
+    OVOCost,
+    OVODailyElectricity,
+    OVODailyGas,
+    OVODailyUsage,
+    OVOHalfHour,
+    OVOHalfHourUsage,
+    OVOInterval,
+    OVOMeterReadings,
+    OVORates,
+)
+from .models.carbon_intensity import OVOCarbonIntensity, OVOCarbonIntensityForecast
+from .models.columnar import OVOHalfHourSeries, OVOHalfHourSeriesUsage
+from .models.footprint import (
+    OVOCarbonFootprint,
+    OVOFootprint,
+    OVOFootprintBreakdown,
+    OVOFootprintElectricity,
+    OVOFootprintGas,
+)
+from .models.plan import (
+    OVOPlanElectricity,
+    OVOPlanGas,
+    OVOPlanRate,
+    OVOPlans,
+    OVOPlanUnitRate,
+)
+
+if TYPE_CHECKING:
+    from .models.payloads import (
+        Cost,
+        DailyRow,
+        HalfHourFuel,
+        Interval,
+        MeterReadings,
+        Rates,
+    )
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+_LOGGER = logging.getLogger(__name__)
+
+DecoderName = Literal["json", "msgspec", "orjson"]
+
+_Plan = TypeVar("_Plan", OVOPlanElectricity, OVOPlanGas)
+
+
+def parse_daily_electricity(
+    usage: dict[str, Any],
+    intervals: OVOIntervalParser = DEFAULT_INTERVAL_PARSER,
+) -> OVODailyElectricity:
+    """Parse a daily electricity row."""
+    return OVODailyElectricity(
+        consumption=usage.get("consumption", None),
+        interval=(
+            intervals.parse_interval(usage["interval"]) if "interval" in usage else None
+        ),
+        meter_readings=(
+            OVOMeterReadings(
+                start=usage["meterReadings"]["start"],
+                end=usage["meterReadings"]["end"],
+            )
+            if "meterReadings" in usage
+            else None
+        ),
+        has_half_hour_data=usage.get("hasHalfHourData", None),
+        cost=(
+            OVOCost(
+                amount=usage["cost"]["amount"],
+                currency_unit=usage["cost"]["currencyUnit"],
+            )
+            if "cost" in usage
+            else None
+        ),
+        rates=OVORates(
+            anytime=usage["rates"].get("anytime", None),
+            standing=usage["rates"].get("standing", None),
+        )
+        if "rates" in usage
+        else None,
+    )
+
+
+def parse_daily_gas(
+    usage: dict[str, Any],
+    intervals: OVOIntervalParser = DEFAULT_INTERVAL_PARSER,
+) -> OVODailyGas:
+    """Parse a daily gas row."""
+    return OVODailyGas(
+        consumption=usage.get("consumption", None),
+        volume=usage.get("volume", None),
+        interval=(
+            intervals.parse_interval(usage["interval"]) if "interval" in usage else None
+        ),
+        meter_readings=(
+            OVOMeterReadings(
+                start=usage["meterReadings"]["start"],
+                end=usage["meterReadings"]["end"],
+            )
+            if "meterReadings" in usage
+            else None
+        ),
+        has_half_hour_data=usage.get("hasHalfHourData", None),
+        cost=OVOCost(
+            amount=usage["cost"]["amount"],
+            currency_unit=usage["cost"]["currencyUnit"],
+        )
+        if "cost" in usage
+        else None,
+        rates=OVORates(
+            anytime=usage["rates"].get("anytime", None),
+            standing=usage["rates"].get("standing", None),
+        )
+        if "rates" in usage
+        else None,
+    )
+
+
+def parse_half_hour(
+    usage: dict[str, Any],
+    intervals: OVOIntervalParser = DEFAULT_INTERVAL_PARSER,
+) -> OVOHalfHour:
+    """Parse a half hourly row."""
+    return OVOHalfHour(
+        consumption=usage["consumption"],
+        interval=intervals.parse_half_hour_interval(usage["interval"]),
+        unit=usage["unit"],
+    )
+
+
+def _fuel_data(json_response: dict[str, Any], fuel: str) -> list[Any] | None:
+    """Return the data rows for a fuel, or None if the fuel has no data."""
+    if fuel not in json_response:
+        return None
+    fuel_response = json_response[fuel]
+    if not fuel_response or "data" not in fuel_response:
+        return None
+    return fuel_response["data"]
+
+
+def parse_daily_usage(
+    json_response: dict[str, Any],
+    intervals: OVOIntervalParser = DEFAULT_INTERVAL_PARSER,
+) -> OVODailyUsage:
+    """Parse a daily usage response."""
+    electricity = _fuel_data(json_response, "electricity")
+    gas = _fuel_data(json_response, "gas")
+
+    return OVODailyUsage(
+        electricity=(
+            [
+                parse_daily_electricity(usage, intervals)
+                for usage in electricity
+                if usage is not None
+            ]
+            if electricity is not None
+            else None
+        ),
+        gas=(
+            [parse_daily_gas(usage, intervals) for usage in gas if usage is not None]
+            if gas is not None
+            else None
+        ),
+    )
+
+
+def parse_half_hourly_usage(
+    json_response: dict[str, Any],
+    intervals: OVOIntervalParser = DEFAULT_INTERVAL_PARSER,
+) -> OVOHalfHourUsage:
+    """Parse a half hourly usage response."""
+    electricity = _fuel_data(json_response, "electricity")
+    gas = _fuel_data(json_response, "gas")
+
+    return OVOHalfHourUsage(
+        electricity=(
+            [
+                parse_half_hour(usage, intervals)
+                for usage in electricity
+                if usage is not None
+            ]
+            if electricity is not None
+            else None
+        ),
+        gas=(
+            [parse_half_hour(usage, intervals) for usage in gas if usage is not None]
+            if gas is not None
+            else None
+        ),
+    )
+
+
+def _parse_half_hour_series(
+    data: list[Any] | None,
+    intervals: OVOIntervalParser,
+) -> OVOHalfHourSeries | None:
+    """Parse half hourly rows into a series."""
+    if data is None:
+        return None
+
+    rows = [usage for usage in data if usage is not None]
+    units = {usage["unit"] for usage in rows}
+    if len(units) > 1:
+        raise ValueError(f"Mixed units in half hourly data: {units}")
+
+    return OVOHalfHourSeries(
+        unit=units.pop() if units else None,
+        starts=intervals.to_epochs(rows),
+        consumption=array(
+            "d",
+            [
+                math.nan if usage["consumption"] is None else usage["consumption"]
+                for usage in rows
+            ],
+        ),
+    )
+
+
+def parse_half_hourly_series(
+    json_response: dict[str, Any],
+    intervals: OVOIntervalParser = DEFAULT_INTERVAL_PARSER,
+) -> OVOHalfHourSeriesUsage:
+    """Parse a half hourly usage response into columnar series."""
+    return OVOHalfHourSeriesUsage(
+        electricity=_parse_half_hour_series(
+            _fuel_data(json_response, "electricity"), intervals
+        ),
+        gas=_parse_half_hour_series(_fuel_data(json_response, "gas"), intervals),
+    )
+
+
+def _parse_plan_rate(rate: dict[str, Any]) -> OVOPlanRate:
+    """Parse a plan rate."""
+    return OVOPlanRate(
+        amount=rate["amount"],
+        currency_unit=rate["currencyUnit"],
+    )
+
+
+def parse_plan(plan: dict[str, Any], model: type[_Plan]) -> _Plan:
+    """Parse an electricity or gas plan."""
+    return model(
+        name=plan["name"],
+        exit_fee=_parse_plan_rate(plan["exitFee"]),
+        contract_start_date=plan["contractStartDate"],
+        contract_end_date=plan.get("contractEndDate"),
+        contract_type=plan["contractType"],
+        is_in_renewal=plan["isInRenewal"],
+        has_future_contracts=plan["hasFutureContracts"],
+        mpxn=plan["mpxn"],
+        msn=plan["msn"],
+        personal_projection=plan["personalProjection"],
+        standing_charge=_parse_plan_rate(plan["standingCharge"]),
+        unit_rates=[
+            OVOPlanUnitRate(
+                name=unit_rate["name"],
+                unit_rate=_parse_plan_rate(unit_rate["unitRate"]),
+            )
+            for unit_rate in plan["unitRates"]
+        ],
+    )
+
+
+def _plan_list(plans: Any) -> list[dict[str, Any]]:
+    """Return plans as a list, as a single plan may not be wrapped in one."""
+    if plans is None:
+        return []
+    return plans if isinstance(plans, list) else [plans]
+
+
+def parse_plans(json_response: dict[str, Any]) -> OVOPlans:
+    """Parse a plans response."""
+    gas = _plan_list(json_response.get("gas"))
+    return OVOPlans(
+        electricity=[
+            parse_plan(plan, OVOPlanElectricity)
+            for plan in _plan_list(json_response.get("electricity"))
+        ],
+        gas=[parse_plan(plan, OVOPlanGas) for plan in gas] if gas else None,
+    )
+
+
+def parse_footprint(json_response: dict[str, Any]) -> OVOFootprint:
+    """Parse a carbon footprint response."""
+    return OVOFootprint(
+        from_=json_response["from"],
+        to=json_response["to"],
+        carbon_reduction_product_ids=json_response["carbonReductionProductIds"],
+        carbon_footprint=OVOCarbonFootprint(
+            carbon_kg=json_response["carbonFootprint"]["carbonKg"],
+            carbon_saved_kg=json_response["carbonFootprint"]["carbonSavedKg"],
+            k_wh=json_response["carbonFootprint"]["kWh"],
+            breakdown=OVOFootprintBreakdown(
+                electricity=OVOFootprintElectricity(
+                    carbon_kg=json_response["carbonFootprint"]["breakdown"][
+                        "electricity"
+                    ]["carbonKg"],
+                    carbon_saved_kg=json_response["carbonFootprint"]["breakdown"][
+                        "electricity"
+                    ]["carbonSavedKg"],
+                    k_wh=json_response["carbonFootprint"]["breakdown"]["electricity"][
+                        "kWh"
+                    ],
+                ),
+                gas=OVOFootprintGas(
+                    carbon_kg=json_response["carbonFootprint"]["breakdown"]["gas"][
+                        "carbonKg"
+                    ],
+                    carbon_saved_kg=json_response["carbonFootprint"]["breakdown"][
+                        "gas"
+                    ]["carbonSavedKg"],
+                    k_wh=json_response["carbonFootprint"]["breakdown"]["gas"]["kWh"],
+                ),
+            ),
+        ),
+    )
+
+
+def parse_carbon_intensity(json_response: dict[str, Any]) -> OVOCarbonIntensity:
+    """Parse a carbon intensity response."""
+    return OVOCarbonIntensity(
+        forecast=[
+            OVOCarbonIntensityForecast(
+                time_from=forecast["from"],
+                intensity=forecast["intensity"],
+                level=forecast["level"],
+                colour=forecast["colour"],
+                colour_v2=forecast["colourV2"],
+            )
+            for forecast in json_response["forecast"]
+        ],
+        current=json_response["current"],
+        greentime=json_response["greentime"],
+    )
+
+
+class OVODecoder:
+    """Decode response bodies with the standard library json module."""
+
+    name: DecoderName = "json"
+
+    def __init__(
+        self,
+        intervals: OVOIntervalParser = DEFAULT_INTERVAL_PARSER,
+    ) -> None:
+        """Initialize."""
+        self.intervals = intervals
+
+    def loads(self, data: bytes) -> Any:
+        """Decode a JSON body."""
+        return json.loads(data)
+
+    def decode_daily_usage(self, data: bytes) -> OVODailyUsage:
+        """Decode a daily usage body."""
+        return parse_daily_usage(self.loads(data), self.intervals)
+
+    def decode_half_hourly_usage(self, data: bytes) -> OVOHalfHourUsage:
+        """Decode a half hourly usage body."""
+        return parse_half_hourly_usage(self.loads(data), self.intervals)
+
+    def decode_half_hourly_series(self, data: bytes) -> OVOHalfHourSeriesUsage:
+        """Decode a half hourly usage body into columnar series."""
+        return parse_half_hourly_series(self.loads(data), self.intervals)
+
+
+class OVOOrjsonDecoder(OVODecoder):
+    """Decode response bodies with orjson."""
+
+    name: DecoderName = "orjson"
+
+    def __init__(
+        self,
+        intervals: OVOIntervalParser = DEFAULT_INTERVAL_PARSER,
+    ) -> None:
+        """Initialize."""
+        if orjson is None:
+            raise ImportError("orjson is required for OVOOrjsonDecoder")
+
+        super().__init__(intervals)
+
+    def loads(self, data: bytes) -> Any:
+        """Decode a JSON body."""
+        return orjson.loads(data)
+
+
+class OVOMsgspecDecoder(OVODecoder):
+    """Decode response bodies with msgspec.
+
+    Usage bodies are decoded in one pass into typed structs, keeping only
+    the fields the models need, and the models are built straight from
+    them. Intervals still go through the interval parser, so the models
+    match the other decoders.
+    """
+
+    name: DecoderName = "msgspec"
+
+    def __init__(
+        self,
+        intervals: OVOIntervalParser = DEFAULT_INTERVAL_PARSER,
+    ) -> None:
+        """Initialize."""
+        if msgspec is None:
+            raise ImportError("msgspec is required for OVOMsgspecDecoder")
+
+        super().__init__(intervals)
+
+        # pylint: disable-next=import-outside-toplevel
+        from .models.payloads import DailyPayload, HalfHourPayload  # noqa: PLC0415
+
+        self._decoder = msgspec.json.Decoder()
+        self._daily_decoder = msgspec.json.Decoder(type=DailyPayload)
+        self._half_hourly_decoder = msgspec.json.Decoder(type=HalfHourPayload)
+
+    def loads(self, data: bytes) -> Any:
+        """Decode a JSON body."""
+        return self._decoder.decode(data)
+
+    def _interval(self, interval: "Interval | None") -> OVOInterval | None:
+        """Build an interval model."""
+        if interval is None:
+            return None
+        return OVOInterval(
+            start=self.intervals.parse_datetime(interval.start),
+            end=self.intervals.parse_datetime(interval.end),
+        )
+
+    def _daily_electricity(self, row: "DailyRow") -> OVODailyElectricity:
+        """Build a daily electricity model."""
+        return OVODailyElectricity(
+            consumption=row.consumption,
+            interval=self._interval(row.interval),
+            meter_readings=_meter_readings(row.meter_readings),
+            has_half_hour_data=row.has_half_hour_data,
+            cost=_cost(row.cost),
+            rates=_rates(row.rates),
+        )
+
+    def _daily_gas(self, row: "DailyRow") -> OVODailyGas:
+        """Build a daily gas model."""
+        return OVODailyGas(
+            consumption=row.consumption,
+            volume=row.volume,
+            interval=self._interval(row.interval),
+            meter_readings=_meter_readings(row.meter_readings),
+            has_half_hour_data=row.has_half_hour_data,
+            cost=_cost(row.cost),
+            rates=_rates(row.rates),
+        )
+
+    def decode_daily_usage(self, data: bytes) -> OVODailyUsage:
+        """Decode a daily usage body."""
+        try:
+            payload = self._daily_decoder.decode(data)
+        except msgspec.ValidationError as exception:
+            # Rows of an unexpected shape may still be accepted by the generic
+            # parser, so fall back to it.
+            _LOGGER.debug("Falling back to generic daily decode: %s", exception)
+            return super().decode_daily_usage(data)
+
+        electricity = _struct_data(payload.electricity)
+        gas = _struct_data(payload.gas)
+
+        return OVODailyUsage(
+            electricity=(
+                [self._daily_electricity(row) for row in electricity if row is not None]
+                if electricity is not None
+                else None
+            ),
+            gas=(
+                [self._daily_gas(row) for row in gas if row is not None]
+                if gas is not None
+                else None
+            ),
+        )
+
+    def _half_hours(self, fuel: "HalfHourFuel | None") -> list[OVOHalfHour] | None:
+        """Build the half hour models for a fuel."""
+        if (rows := _struct_data(fuel)) is None:
+            return None
+        parse_start = self.intervals.parse_half_hour_start
+        return [
+            OVOHalfHour(
+                consumption=row.consumption,
+                interval=parse_start(row.interval.start),
+                unit=row.unit,
+            )
+            for row in rows
+            if row is not None
+        ]
+
+    def decode_half_hourly_usage(self, data: bytes) -> OVOHalfHourUsage:
+        """Decode a half hourly usage body."""
+        try:
+            payload = self._half_hourly_decoder.decode(data)
+        except msgspec.ValidationError as exception:
+            _LOGGER.debug("Falling back to generic half hourly decode: %s", exception)
+            return super().decode_half_hourly_usage(data)
+
+        return OVOHalfHourUsage(
+            electricity=self._half_hours(payload.electricity),
+            gas=self._half_hours(payload.gas),
+        )
+
+
+def _struct_data(fuel: Any) -> list[Any] | None:
+    """Return the data rows of a decoded fuel struct, or None if it has none."""
+    return fuel.data if fuel is not None else None
+
+
+def _meter_readings(readings: "MeterReadings | None") -> OVOMeterReadings | None:
+    """Build a meter readings model from a decoded struct."""
+    if readings is None:
+        return None
+    return OVOMeterReadings(start=readings.start, end=readings.end)
+
+
+def _cost(cost: "Cost | None") -> OVOCost | None:
+    """Build a cost model from a decoded struct."""
+    if cost is None:
+        return None
+    return OVOCost(amount=cost.amount, currency_unit=cost.currency_unit)
+
+
+def _rates(rates: "Rates | None") -> OVORates | None:
+    """Build a rates model from a decoded struct."""
+    if rates is None:
+        return None
+    return OVORates(anytime=rates.anytime, standing=rates.standing)
+
+
+_DECODERS: dict[DecoderName, type[OVODecoder]] = {
+    "json": OVODecoder,
+    "msgspec": OVOMsgspecDecoder,
+    "orjson": OVOOrjsonDecoder,
+}
+
+
+def get_decoder(name: DecoderName | None = None) -> OVODecoder:
+    """Return a decoder by name, or the fastest one available."""
+    if name is not None:
+        return _DECODERS[name]()
+    if msgspec is not None:
+        return OVOMsgspecDecoder()
+    if orjson is not None:
+        return OVOOrjsonDecoder()
+    return OVODecoder()
@@ -33,3 +33,11 @@ class OVOEnergyAPINoCookies(OVOEnergyAPIException):
 
 class OVOEnergyNoCustomer(OVOEnergyException):
     """Exception for no customer found."""
+
+
+class OVOEnergyAPIRateLimited(OVOEnergyAPIException):
+    """Exception for API rate limiting (429) after all retries."""
+
+
+class OVOEnergyAPIServerError(OVOEnergyAPIException):
+    """Exception for API server errors (5xx) after all retries."""
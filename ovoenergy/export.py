@@ -0,0 +1,118 @@
+"""Flat row export of usage history."""
+
+from collections.abc import Iterator
+import csv
+from datetime import date
+import json
+from typing import Any, Literal, TextIO
+
+from .models import OVODailyElectricity, OVODailyGas, OVODailyUsage, OVOHalfHourUsage
+
+ExportFormat = Literal["csv", "ndjson"]
+ExportFuel = Literal["electricity", "gas"]
+
+HALF_HOURLY_FIELDS = ("fuel", "start", "end", "consumption", "unit")
+DAILY_FIELDS = (
+    "fuel",
+    "start",
+    "end",
+    "consumption",
+    "volume",
+    "meter_readings_start",
+    "meter_readings_end",
+    "has_half_hour_data",
+    "cost_amount",
+    "cost_currency_unit",
+    "rates_anytime",
+    "rates_standing",
+)
+
+
+def half_hourly_rows(
+    usage: OVOHalfHourUsage,
+    fuel: ExportFuel,
+) -> Iterator[dict[str, Any]]:
+    """Yield flat rows for one fuel of a half hourly usage response."""
+    for half_hour in getattr(usage, fuel) or []:
+        yield {
+            "fuel": fuel,
+            "start": half_hour.interval.start.isoformat(),
+            "end": half_hour.interval.end.isoformat(),
+            "consumption": half_hour.consumption,
+            "unit": half_hour.unit,
+        }
+
+
+def daily_rows(
+    usage: OVODailyUsage,
+    fuel: ExportFuel,
+    start: date | None = None,
+    end: date | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield flat rows for one fuel of a daily usage response.
+
+    Responses cover a whole month, so rows outside start and end
+    (inclusive) are skipped. Rows without an interval are always skipped.
+    """
+    rows: list[OVODailyElectricity] | list[OVODailyGas] = getattr(usage, fuel) or []
+    for row in rows:
+        if row.interval is None:
+            continue
+        day = row.interval.start.date()
+        if (start is not None and day < start) or (end is not None and day > end):
+            continue
+
+        yield {
+            "fuel": fuel,
+            "start": row.interval.start.isoformat(),
+            "end": row.interval.end.isoformat(),
+            "consumption": row.consumption,
+            "volume": row.volume if isinstance(row, OVODailyGas) else None,
+            "meter_readings_start": (
+                row.meter_readings.start if row.meter_readings else None
+            ),
+            "meter_readings_end": row.meter_readings.end
+            if row.meter_readings
+            else None,
+            "has_half_hour_data": row.has_half_hour_data,
+            "cost_amount": row.cost.amount if row.cost else None,
+            "cost_currency_unit": row.cost.currency_unit if row.cost else None,
+            "rates_anytime": row.rates.anytime if row.rates else None,
+            "rates_standing": row.rates.standing if row.rates else None,
+        }
+
+
+class OVORowWriter:
+    """Write flat rows to a text stream as NDJSON or CSV.
+
+    Rows are written as they are given, so nothing is held in memory
+    beyond the current batch.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        export_format: ExportFormat,
+        fields: tuple[str, ...],
+    ) -> None:
+        """Initialize."""
+        self._stream = stream
+        self._format = export_format
+        self._csv: csv.DictWriter | None = None
+        if export_format == "csv":
+            self._csv = csv.DictWriter(stream, fieldnames=fields, lineterminator="\n")
+            self._csv.writeheader()
+
+    def write(self, rows: Iterator[dict[str, Any]]) -> int:
+        """Write rows and flush the stream, returning the number written."""
+        count = 0
+        for row in rows:
+            if self._csv is not None:
+                self._csv.writerow(row)
+            else:
+                self._stream.write(json.dumps(row, separators=(",", ":")))
+                self._stream.write("\n")
+            count += 1
+
+        self._stream.flush()
+        return count
@@ -0,0 +1,236 @@
+"""Drive many OVO Energy logins over one shared session."""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import timedelta
+import logging
+import time
+from types import TracebackType
+from typing import Self, TypeVar
+
+import aiohttp
+
+from . import OVOEnergy
+from .cache import OVOCacheBackend
+from .exceptions import OVOEnergyAPINotAuthorized, OVOEnergyException
+from .metrics import OVOMetrics, trace_config
+from .models.fleet import OVOFleetResult
+from .retry import OVOTokenBucket, create_rate_limiters
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_FLEET_CONCURRENCY = 50
+DEFAULT_CONNECTION_LIMIT = 100
+DEFAULT_CONNECTION_LIMIT_PER_HOST = 30
+
+_T = TypeVar("_T")
+
+
+@dataclass(slots=True)
+class _FleetMember:
+    """A login managed by the fleet."""
+
+    username: str
+    password: str
+    account_id: int | None
+    client: OVOEnergy | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class OVOEnergyFleet:
+    """Manage many OVOEnergy clients sharing one session and connector.
+
+    Logins authenticate lazily on first use, and the shared session and
+    each login's client are created then too, so a fleet can be set up
+    before the event loop is running. Requests across the fleet are
+    capped globally by `concurrency`, and per host by the connector. Rate
+    limiters are shared, so the fleet as a whole stays within API limits.
+    """
+
+    def __init__(
+        self,
+        client_session: aiohttp.ClientSession | None = None,
+        *,
+        concurrency: int = DEFAULT_FLEET_CONCURRENCY,
+        connection_limit: int = DEFAULT_CONNECTION_LIMIT,
+        connection_limit_per_host: int = DEFAULT_CONNECTION_LIMIT_PER_HOST,
+        cache: OVOCacheBackend | None = None,
+        rate_limiters: dict[str, OVOTokenBucket] | None = None,
+        metrics: OVOMetrics | None = None,
+        persisted_queries: bool = False,
+    ) -> None:
+        """Initialize.
+
+        A cache, if given, is shared by every client, so a response fetched
+        for one login can serve the others. Metrics hooks are shared by every
+        client. If the fleet creates the session, connection setup is reported
+        to them too. With persisted queries, each login sends GraphQL queries
+        by hash.
+        """
+        self._client_session = client_session
+        self._owns_session = client_session is None
+        self._connection_limit = connection_limit
+        self._connection_limit_per_host = connection_limit_per_host
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._cache = cache
+        self._rate_limiters = (
+            rate_limiters if rate_limiters is not None else create_rate_limiters()
+        )
+        self._metrics = metrics
+        self._persisted_queries = persisted_queries
+        self._members: dict[str, _FleetMember] = {}
+
+    async def __aenter__(self) -> Self:
+        """Enter the fleet context, creating the shared session if needed."""
+        _ = self.client_session
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the fleet context."""
+        await self.close()
+
+    @property
+    def client_session(self) -> aiohttp.ClientSession:
+        """Return the shared client session, creating it if needed.
+
+        Must be called with the event loop running.
+        """
+        if self._client_session is None:
+            self._client_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._connection_limit,
+                    limit_per_host=self._connection_limit_per_host,
+                ),
+                trace_configs=(
+                    [trace_config(self._metrics)] if self._metrics is not None else None
+                ),
+            )
+        return self._client_session
+
+    @property
+    def clients(self) -> list[OVOEnergy]:
+        """Return the clients created so far, one per login used."""
+        return [
+            member.client
+            for member in self._members.values()
+            if member.client is not None
+        ]
+
+    async def close(self) -> None:
+        """Close the shared session if the fleet created it."""
+        if self._owns_session and self._client_session is not None:
+            await self._client_session.close()
+            self._client_session = None
+            # Clients are bound to the closed session, so start afresh
+            for member in self._members.values():
+                member.client = None
+
+    def add(
+        self,
+        username: str,
+        password: str,
+        account_id: int | None = None,
+    ) -> None:
+        """Add a login to the fleet. Its client is created on first use."""
+        self._members[username] = _FleetMember(
+            username=username,
+            password=password,
+            account_id=account_id,
+        )
+
+    def remove(self, username: str) -> None:
+        """Remove a login from the fleet."""
+        self._members.pop(username, None)
+
+    def _client(self, member: _FleetMember) -> OVOEnergy:
+        """Return a member's client, creating it on first use."""
+        if member.client is None:
+            member.client = OVOEnergy(
+                client_session=self.client_session,
+                cache=self._cache,
+                rate_limiters=self._rate_limiters,
+                metrics=self._metrics,
+                persisted_queries=self._persisted_queries,
+            )
+            if member.account_id is not None:
+                member.client.custom_account_id = member.account_id
+        return member.client
+
+    async def _authenticate(self, member: _FleetMember) -> OVOEnergy:
+        """Return a member's client, authenticating it if it is not already."""
+        async with member.lock:
+            client = self._client(member)
+            if client.oauth is not None:
+                return client
+
+            if not await client.authenticate(member.username, member.password):
+                raise OVOEnergyAPINotAuthorized(
+                    f"Authentication failed for {member.username}"
+                )
+            return client
+
+    async def _run(
+        self,
+        member: _FleetMember,
+        fetch: Callable[[OVOEnergy], Awaitable[_T]],
+    ) -> OVOFleetResult[_T]:
+        """Run a fetch for one member, capturing any error in the result."""
+        async with self._semaphore:
+            try:
+                client = await self._authenticate(member)
+                result = await fetch(client)
+                account_id = client.account_id
+            except (OVOEnergyException, aiohttp.ClientError, TimeoutError) as exception:
+                _LOGGER.debug(
+                    "Fleet fetch failed for %s: %s", member.username, exception
+                )
+                return OVOFleetResult(
+                    username=member.username,
+                    account_id=member.account_id,
+                    result=None,
+                    error=exception,
+                )
+
+        return OVOFleetResult(
+            username=member.username,
+            account_id=account_id,
+            result=result,
+            error=None,
+        )
+
+    async def gather(
+        self,
+        fetch: Callable[[OVOEnergy], Awaitable[_T]],
+    ) -> AsyncIterator[OVOFleetResult[_T]]:
+        """Run a fetch for every login, yielding results as they complete."""
+        tasks = [
+            asyncio.create_task(self._run(member, fetch))
+            for member in list(self._members.values())
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def poll(
+        self,
+        fetch: Callable[[OVOEnergy], Awaitable[_T]],
+        interval: timedelta,
+    ) -> AsyncIterator[OVOFleetResult[_T]]:
+        """Run a fetch for every login once per interval, yielding results."""
+        while True:
+            started = time.monotonic()
+            async for result in self.gather(fetch):
+                yield result
+
+            await asyncio.sleep(
+                max(0.0, interval.total_seconds() - (time.monotonic() - started))
+            )
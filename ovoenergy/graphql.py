@@ -0,0 +1,120 @@
+"""GraphQL query building and automatic persisted queries."""
+
+from collections.abc import Iterable
+from functools import cache
+import hashlib
+from typing import Any, Literal
+
+BootstrapField = Literal["fuel", "start", "meter", "address"]
+BOOTSTRAP_FIELDS: tuple[BootstrapField, ...] = ("fuel", "start", "meter", "address")
+
+PersistedQueryError = Literal["not_found", "not_supported"]
+
+# A selection is a field name, or a field name and its own selections
+_Selection = str | tuple[str, "list[_Selection]"]
+
+_SUPPLY_POINT_SELECTIONS: dict[BootstrapField, _Selection] = {
+    "fuel": "fuelType",
+    "meter": ("meterTechnicalDetails", ["meterSerialNumber", "type", "status"]),
+    "address": ("address", ["addressLines", "postCode"]),
+}
+
+# Fields selected on the supply point, rather than the account supply point
+SUPPLY_POINT_FIELDS = frozenset(_SUPPLY_POINT_SELECTIONS)
+
+_PERSISTED_QUERY_ERRORS: dict[str, PersistedQueryError] = {
+    "PersistedQueryNotFound": "not_found",
+    "PERSISTED_QUERY_NOT_FOUND": "not_found",
+    "PersistedQueryNotSupported": "not_supported",
+    "PERSISTED_QUERY_NOT_SUPPORTED": "not_supported",
+}
+
+
+def _render(selections: list[_Selection], depth: int) -> list[str]:
+    """Render selections as indented lines."""
+    indent = "  " * depth
+    lines: list[str] = []
+    for selection in selections:
+        if isinstance(selection, str):
+            lines.append(f"{indent}{selection}")
+        else:
+            name, children = selection
+            lines.append(f"{indent}{name} {{")
+            lines.extend(_render(children, depth + 1))
+            lines.append(f"{indent}}}")
+    return lines
+
+
+@cache
+def _bootstrap_query(fields: frozenset[BootstrapField]) -> str:
+    """Build and cache the bootstrap query for a field selection."""
+    supply_point: list[_Selection] = [
+        selection
+        for field, selection in _SUPPLY_POINT_SELECTIONS.items()
+        if field in fields
+    ]
+    account_supply_point: list[_Selection] = []
+    if "start" in fields:
+        account_supply_point.append("startDate")
+    if supply_point:
+        account_supply_point.append(("supplyPoint", supply_point))
+
+    account: list[_Selection] = ["id"]
+    if account_supply_point:
+        account.append(("accountSupplyPoints", account_supply_point))
+
+    customer: list[_Selection] = [
+        "id",
+        (
+            "customerAccountRelationships",
+            [("edges", [("node", [("account", account)])])],
+        ),
+    ]
+    return "\n".join(
+        [
+            "query Bootstrap($customerId: ID!) {",
+            *_render([("customer_nextV1(id: $customerId)", customer)], 1),
+            "}",
+        ]
+    )
+
+
+def build_bootstrap_query(fields: Iterable[BootstrapField] | None = None) -> str:
+    """Return a bootstrap query selecting only what the parser reads.
+
+    With no fields, everything the Supply model holds is selected. Account
+    ids are always selected, and no __typename or other unused fields are
+    requested. This is also the full query sent when a persisted query is
+    not found.
+    """
+    selected = frozenset(BOOTSTRAP_FIELDS if fields is None else fields)
+    if unknown := selected - set(BOOTSTRAP_FIELDS):
+        raise ValueError(f"Unknown bootstrap fields: {', '.join(sorted(unknown))}")
+    return _bootstrap_query(selected)
+
+
+@cache
+def query_hash(query: str) -> str:
+    """Return the SHA-256 hash identifying a persisted query."""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def persisted_query_extensions(query: str) -> dict[str, Any]:
+    """Return the extensions sending a query by its hash."""
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash(query)}}
+
+
+def persisted_query_error(json_response: Any) -> PersistedQueryError | None:
+    """Return why a persisted query was rejected, if it was."""
+    if not isinstance(json_response, dict):
+        return None
+    for error in json_response.get("errors") or []:
+        if not isinstance(error, dict):
+            continue
+        for reason in (
+            error.get("message"),
+            (error.get("extensions") or {}).get("code"),
+        ):
+            if (result := _PERSISTED_QUERY_ERRORS.get(reason)) is not None:
+                return result
+    return None
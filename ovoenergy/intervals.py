@@ -0,0 +1,99 @@
+"""Interval parsing for usage responses."""
+
+from array import array
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from functools import cache, lru_cache
+from types import ModuleType
+from typing import Any
+
+from .models import OVOInterval
+
+DEFAULT_CACHE_SIZE = 4096
+HALF_HOUR = timedelta(minutes=30)
+
+
+@cache
+def numpy_or_none() -> ModuleType | None:
+    """Return NumPy if installed, importing it on first use as it is slow to load.
+
+    Callers look this up through the module, so patching it here switches
+    every vectorised path to its pure Python fallback.
+    """
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        import numpy as np  # noqa: PLC0415
+    except ImportError:  # pragma: no cover
+        return None
+    return np
+
+
+def _strip_utc(value: str) -> str | None:
+    """Return a UTC timestamp without its designator, or None if not UTC."""
+    if value.endswith("Z"):
+        return value[:-1]
+    if value.endswith("+00:00"):
+        return value[:-6]
+    return None
+
+
+class OVOIntervalParser:
+    """Parse ISO 8601 interval timestamps.
+
+    The same start and end strings repeat across meters and days, so parsed
+    values are memoised in a bounded LRU cache.
+    """
+
+    def __init__(
+        self,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """Initialize."""
+        self._datetime = lru_cache(maxsize=cache_size)(datetime.fromisoformat)
+        self._epoch = lru_cache(maxsize=cache_size)(self._to_epoch)
+
+    def _to_epoch(self, value: str) -> int:
+        """Convert a timestamp to epoch seconds."""
+        return int(self._datetime(value).timestamp())
+
+    def cache_clear(self) -> None:
+        """Clear the parsed timestamp caches."""
+        self._datetime.cache_clear()
+        self._epoch.cache_clear()
+
+    def parse_datetime(self, value: str) -> datetime:
+        """Parse a timestamp."""
+        return self._datetime(value)
+
+    def parse_interval(self, interval: dict[str, Any]) -> OVOInterval:
+        """Parse an interval with explicit start and end timestamps."""
+        return OVOInterval(
+            start=self._datetime(interval["start"]),
+            end=self._datetime(interval["end"]),
+        )
+
+    def parse_half_hour_interval(self, interval: dict[str, Any]) -> OVOInterval:
+        """Parse a half hour interval, inferring the end from the start."""
+        return self.parse_half_hour_start(interval["start"])
+
+    def parse_half_hour_start(self, value: str) -> OVOInterval:
+        """Return the half hour interval starting at a timestamp."""
+        start = self._datetime(value)
+        return OVOInterval(start=start, end=start + HALF_HOUR)
+
+    def to_epochs(self, rows: Iterable[dict[str, Any]]) -> array:
+        """Convert the interval starts of a whole data array to epoch seconds."""
+        starts = [row["interval"]["start"] for row in rows]
+
+        if starts and (np := numpy_or_none()) is not None:
+            # NumPy parses naive ISO 8601 strings in C, so strip the UTC
+            # designator and convert the whole column at once.
+            naive = [_strip_utc(start) for start in starts]
+            if None not in naive:
+                epochs = np.array(naive, dtype="datetime64[s]").astype(np.int64)
+                return array("q", epochs.tobytes())
+
+        return array("q", [self._epoch(start) for start in starts])
+
+
+DEFAULT_INTERVAL_PARSER = OVOIntervalParser()
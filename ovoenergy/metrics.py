@@ -0,0 +1,333 @@
+"""Request timing and metrics hooks."""
+
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass, field
+import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Literal
+
+from .const import (
+    AUTH_LOGIN_URL,
+    AUTH_TOKEN_URL,
+    BOOTSTRAP_GRAPHQL_URL,
+    CARBON_FOOTPRINT_URL,
+    CARBON_INTENSITY_URL,
+    PLANS_URL,
+    USAGE_DAILY_URL,
+    USAGE_HALF_HOURLY_URL,
+)
+
+if TYPE_CHECKING:
+    import aiohttp
+
+ConnectionPhase = Literal["dns", "connect", "queued"]
+
+# Longest prefixes first, so half hourly is not mistaken for daily etc.
+_ENDPOINTS: tuple[tuple[str, str], ...] = tuple(
+    sorted(
+        (
+            (AUTH_LOGIN_URL, "auth_login"),
+            (AUTH_TOKEN_URL, "auth_token"),
+            (BOOTSTRAP_GRAPHQL_URL, "bootstrap"),
+            (CARBON_FOOTPRINT_URL, "carbon_footprint"),
+            (CARBON_INTENSITY_URL, "carbon_intensity"),
+            (PLANS_URL, "plans"),
+            (USAGE_DAILY_URL, "usage_daily"),
+            (USAGE_HALF_HOURLY_URL, "usage_half_hourly"),
+        ),
+        key=lambda endpoint: len(endpoint[0]),
+        reverse=True,
+    )
+)
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def endpoint_name(url: str) -> str:
+    """Return a low cardinality name for a request URL."""
+    for prefix, name in _ENDPOINTS:
+        if url.startswith(prefix):
+            return name
+    return "other"
+
+
+class OVOMetrics:
+    """Instrumentation hooks. Every hook does nothing by default.
+
+    Subclass and override the hooks you need, or use OVOMetricsCollector.
+    Hooks are called inline on the event loop, so they must not block.
+    """
+
+    def request(
+        self,
+        endpoint: str,
+        method: str,
+        status: int | None,
+        duration: float,
+        bytes_received: int,
+    ) -> None:
+        """Record one HTTP attempt. Status is None if it failed to connect."""
+
+    def retry(self, endpoint: str, reason: str) -> None:
+        """Record a retry, with the status code or exception that caused it."""
+
+    def token_refresh(self, success: bool, duration: float) -> None:
+        """Record an OAuth token refresh."""
+
+    def parse(self, endpoint: str, duration: float) -> None:
+        """Record time spent decoding a response body, separate from network."""
+
+    def connection(self, phase: ConnectionPhase, duration: float) -> None:
+        """Record connection pool, DNS and connect time (see `trace_config`)."""
+
+
+@dataclass(slots=True)
+class _Histogram:
+    """Cumulative histogram of durations."""
+
+    buckets: tuple[float, ...]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        """Initialize the bucket counts."""
+        self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+def _labels(**labels: object) -> str:
+    """Format Prometheus labels."""
+    return ",".join(f'{name}="{_escape(str(value))}"' for name, value in labels.items())
+
+
+def _escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class OVOMetricsCollector(OVOMetrics):
+    """Collect metrics in memory and export them in Prometheus text format."""
+
+    def __init__(
+        self,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialize."""
+        self._buckets = buckets
+        self.requests: defaultdict[tuple[str, str, str], int] = defaultdict(int)
+        self.bytes_received: defaultdict[str, int] = defaultdict(int)
+        self.retries: defaultdict[tuple[str, str], int] = defaultdict(int)
+        self.token_refreshes: defaultdict[bool, int] = defaultdict(int)
+        self.request_durations: dict[str, _Histogram] = {}
+        self.parse_durations: dict[str, _Histogram] = {}
+        self.connection_durations: dict[str, _Histogram] = {}
+        self.token_refresh_durations = _Histogram(buckets)
+
+    def _observe(
+        self, histograms: dict[str, _Histogram], key: str, value: float
+    ) -> None:
+        """Record a value in a keyed histogram."""
+        if (histogram := histograms.get(key)) is None:
+            histogram = histograms[key] = _Histogram(self._buckets)
+        histogram.observe(value)
+
+    def request(
+        self,
+        endpoint: str,
+        method: str,
+        status: int | None,
+        duration: float,
+        bytes_received: int,
+    ) -> None:
+        """Record one HTTP attempt."""
+        self.requests[(endpoint, method, str(status or "error"))] += 1
+        self.bytes_received[endpoint] += bytes_received
+        self._observe(self.request_durations, endpoint, duration)
+
+    def retry(self, endpoint: str, reason: str) -> None:
+        """Record a retry."""
+        self.retries[(endpoint, reason)] += 1
+
+    def token_refresh(self, success: bool, duration: float) -> None:
+        """Record an OAuth token refresh."""
+        self.token_refreshes[success] += 1
+        self.token_refresh_durations.observe(duration)
+
+    def parse(self, endpoint: str, duration: float) -> None:
+        """Record time spent decoding a response body."""
+        self._observe(self.parse_durations, endpoint, duration)
+
+    def connection(self, phase: ConnectionPhase, duration: float) -> None:
+        """Record connection pool, DNS and connect time."""
+        self._observe(self.connection_durations, phase, duration)
+
+    def _histogram_lines(
+        self,
+        name: str,
+        histogram: _Histogram,
+        **labels: object,
+    ) -> list[str]:
+        """Format a histogram in Prometheus text format."""
+        lines = []
+        cumulative = 0
+        for bound, count in zip(
+            (*(str(bucket) for bucket in self._buckets), "+Inf"),
+            histogram.counts,
+            strict=True,
+        ):
+            cumulative += count
+            lines.append(f"{name}_bucket{{{_labels(**labels, le=bound)}}} {cumulative}")
+        label_text = f"{{{_labels(**labels)}}}" if labels else ""
+        lines.append(f"{name}_sum{label_text} {histogram.total}")
+        lines.append(f"{name}_count{label_text} {histogram.count}")
+        return lines
+
+    def export_prometheus(self) -> str:
+        """Return all metrics in Prometheus text exposition format."""
+        lines = [
+            "# HELP ovoenergy_requests_total HTTP requests by endpoint and status.",
+            "# TYPE ovoenergy_requests_total counter",
+        ]
+        lines.extend(
+            f"ovoenergy_requests_total{{{_labels(endpoint=endpoint, method=method, status=status)}}} {count}"
+            for (endpoint, method, status), count in sorted(self.requests.items())
+        )
+
+        lines += [
+            "# HELP ovoenergy_request_duration_seconds HTTP request latency.",
+            "# TYPE ovoenergy_request_duration_seconds histogram",
+        ]
+        for endpoint, histogram in sorted(self.request_durations.items()):
+            lines += self._histogram_lines(
+                "ovoenergy_request_duration_seconds", histogram, endpoint=endpoint
+            )
+
+        lines += [
+            "# HELP ovoenergy_response_bytes_total Response body bytes received.",
+            "# TYPE ovoenergy_response_bytes_total counter",
+        ]
+        lines.extend(
+            f"ovoenergy_response_bytes_total{{{_labels(endpoint=endpoint)}}} {count}"
+            for endpoint, count in sorted(self.bytes_received.items())
+        )
+
+        lines += [
+            "# HELP ovoenergy_retries_total Retried requests by reason.",
+            "# TYPE ovoenergy_retries_total counter",
+        ]
+        lines.extend(
+            f"ovoenergy_retries_total{{{_labels(endpoint=endpoint, reason=reason)}}} {count}"
+            for (endpoint, reason), count in sorted(self.retries.items())
+        )
+
+        lines += [
+            "# HELP ovoenergy_token_refreshes_total OAuth token refreshes.",
+            "# TYPE ovoenergy_token_refreshes_total counter",
+        ]
+        lines.extend(
+            f"ovoenergy_token_refreshes_total{{{_labels(result='success' if success else 'failure')}}} {count}"
+            for success, count in sorted(self.token_refreshes.items())
+        )
+        lines += [
+            "# HELP ovoenergy_token_refresh_duration_seconds OAuth token refresh time.",
+            "# TYPE ovoenergy_token_refresh_duration_seconds histogram",
+            *self._histogram_lines(
+                "ovoenergy_token_refresh_duration_seconds",
+                self.token_refresh_durations,
+            ),
+        ]
+
+        lines += [
+            "# HELP ovoenergy_parse_duration_seconds Response decoding time.",
+            "# TYPE ovoenergy_parse_duration_seconds histogram",
+        ]
+        for endpoint, histogram in sorted(self.parse_durations.items()):
+            lines += self._histogram_lines(
+                "ovoenergy_parse_duration_seconds", histogram, endpoint=endpoint
+            )
+
+        lines += [
+            "# HELP ovoenergy_connection_duration_seconds Connection setup time.",
+            "# TYPE ovoenergy_connection_duration_seconds histogram",
+        ]
+        for phase, histogram in sorted(self.connection_durations.items()):
+            lines += self._histogram_lines(
+                "ovoenergy_connection_duration_seconds", histogram, phase=phase
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def trace_config(metrics: OVOMetrics) -> "aiohttp.TraceConfig":
+    """Return an aiohttp TraceConfig reporting connection setup to metrics.
+
+    Pass it to the session, e.g. `ClientSession(trace_configs=[...])`, to
+    see time spent waiting for a pooled connection, resolving DNS and
+    connecting, which the request hooks alone cannot separate.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    import aiohttp  # noqa: PLC0415
+
+    config = aiohttp.TraceConfig()
+
+    def _phase(
+        phase: ConnectionPhase,
+    ) -> tuple:
+        """Return start and end callbacks timing a phase."""
+        attribute = f"{phase}_started"
+
+        async def on_start(
+            _session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            _params: object,
+        ) -> None:
+            setattr(context, attribute, time.perf_counter())
+
+        async def on_end(
+            _session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            _params: object,
+        ) -> None:
+            if (started := getattr(context, attribute, None)) is not None:
+                metrics.connection(phase, time.perf_counter() - started)
+
+        return (on_start, on_end)
+
+    for phase, (starts, ends) in (
+        (
+            "queued",
+            (config.on_connection_queued_start, config.on_connection_queued_end),
+        ),
+        (
+            "connect",
+            (config.on_connection_create_start, config.on_connection_create_end),
+        ),
+        (
+            "dns",
+            (config.on_dns_resolvehost_start, config.on_dns_resolvehost_end),
+        ),
+    ):
+        on_start, on_end = _phase(phase)
+        starts.append(on_start)
+        ends.append(on_end)
+
+    return config
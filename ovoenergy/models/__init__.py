@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOInterval:
     """Interval model."""
 
@@ -12,7 +12,7 @@ class OVOInterval:
     end: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOMeterReadings:
     """Meter readings model."""
 
@@ -20,7 +20,7 @@ class OVOMeterReadings:
     end: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOCost:
     """Cost model."""
 
@@ -28,7 +28,7 @@ class OVOCost:
     currency_unit: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class OVORates:
     """Rates model."""
 
@@ -36,7 +36,7 @@ class OVORates:
     standing: float | None
 
 
-@dataclass
+@dataclass(slots=True)
 class OVODailyElectricity:
     """Daily electricity model."""
 
@@ -48,7 +48,7 @@ class OVODailyElectricity:
     rates: OVORates | None
 
 
-@dataclass
+@dataclass(slots=True)
 class OVODailyGas:
     """Daily gas model."""
 
@@ -61,16 +61,16 @@ class OVODailyGas:
     rates: OVORates | None
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOHalfHour:
     """Half hour model."""
 
-    consumption: float
+    consumption: float | None
     interval: OVOInterval
     unit: str
 
 
-@dataclass
+@dataclass(slots=True)
 class OVODailyUsage:
     """Daily usage model."""
 
@@ -78,7 +78,7 @@ class OVODailyUsage:
     gas: list[OVODailyGas] | None
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOHalfHourUsage:
     """Half hour usage model."""
 
@@ -86,7 +86,7 @@ class OVOHalfHourUsage:
     gas: list[OVOHalfHour] | None
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOPlan:
     """Plan model."""
 
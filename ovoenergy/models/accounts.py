@@ -6,7 +6,7 @@ from typing import Literal
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class SupplyPointInfo:
     """Supply point info model."""
 
@@ -15,7 +15,7 @@ class SupplyPointInfo:
     address: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Supply:
     """Supply model."""
 
@@ -27,7 +27,7 @@ class Supply:
     supply_point_info: SupplyPointInfo | None
 
 
-@dataclass
+@dataclass(slots=True)
 class Account:
     """Account model."""
 
@@ -37,7 +37,7 @@ class Account:
     supplies: list[Supply] | None
 
 
-@dataclass
+@dataclass(slots=True)
 class BootstrapAccounts:
     """Bootstrap Accounts model."""
 
@@ -0,0 +1,21 @@
+"""Aggregation Models."""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Literal
+
+RollupPeriod = Literal["hour", "day", "week", "month"]
+
+
+@dataclass(slots=True)
+class OVOUsageRollup:
+    """Usage rollup model.
+
+    Keys are the local start of each period: a datetime for hours, and a
+    date for days, ISO weeks (the Monday) and months (the first).
+    """
+
+    period: RollupPeriod
+    unit: str | None
+    totals: dict[date | datetime, float]
+    counts: dict[date | datetime, int]
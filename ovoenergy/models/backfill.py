@@ -0,0 +1,24 @@
+"""Backfill Models."""
+
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(slots=True, frozen=True)
+class OVOHalfHourGap:
+    """Half hourly data missing from a store for an account, fuel and day.
+
+    `expected` is the number of half hours in the day's daily interval, and
+    `stored` how many of them the store holds.
+    """
+
+    account_id: int
+    fuel: str
+    day: date
+    expected: int
+    stored: int
+
+    @property
+    def missing(self) -> int:
+        """Return the number of half hours missing."""
+        return self.expected - self.stored
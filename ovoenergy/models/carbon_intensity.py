@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOCarbonIntensityForecast:
     """Carbon intensity forecast model."""
 
@@ -15,7 +15,7 @@ class OVOCarbonIntensityForecast:
     colour_v2: str
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOCarbonIntensity:
     """Carbon intensity model."""
 
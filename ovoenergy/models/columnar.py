@@ -0,0 +1,144 @@
+"""Columnar Models."""
+
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+import math
+from typing import TYPE_CHECKING, Self, overload
+
+from . import OVOHalfHour, OVOHalfHourUsage, OVOInterval
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+HALF_HOUR = timedelta(minutes=30)
+HALF_HOUR_SECONDS = 1800
+
+
+@dataclass(slots=True)
+class OVOHalfHourSeries:
+    """Half hour series model.
+
+    Stores interval starts as int64 epoch seconds and consumption as float64
+    in contiguous buffers. Interval ends are always start plus 30 minutes.
+    Rows are only turned into `OVOHalfHour` objects when accessed.
+    """
+
+    unit: str | None = None
+    starts: array = field(default_factory=lambda: array("q"))
+    consumption: array = field(default_factory=lambda: array("d"))
+
+    @classmethod
+    def from_half_hours(cls, half_hours: Iterable[OVOHalfHour]) -> Self:
+        """Create a series from half hour models."""
+        series = cls()
+        for half_hour in half_hours:
+            series.append(
+                half_hour.interval.start,
+                half_hour.consumption,
+                half_hour.unit,
+            )
+        return series
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[OVOHalfHour]:
+        """Iterate over rows as half hour models."""
+        for index in range(len(self.starts)):
+            yield self._half_hour(index)
+
+    @overload
+    def __getitem__(self, index: int) -> OVOHalfHour: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[OVOHalfHour]: ...
+
+    def __getitem__(self, index: int | slice) -> OVOHalfHour | list[OVOHalfHour]:
+        """Return a row, or a list of rows, as half hour models."""
+        if isinstance(index, slice):
+            return [self._half_hour(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Series index out of range")
+        return self._half_hour(index)
+
+    def _half_hour(self, index: int) -> OVOHalfHour:
+        """Build the half hour model for a row, with NaN read back as None."""
+        start = datetime.fromtimestamp(self.starts[index], UTC)
+        consumption = self.consumption[index]
+        return OVOHalfHour(
+            consumption=None if math.isnan(consumption) else consumption,
+            interval=OVOInterval(start=start, end=start + HALF_HOUR),
+            unit=self.unit,
+        )
+
+    def _check_unit(self, unit: str | None) -> None:
+        """Set the unit from the first row, and check later rows match."""
+        if unit is None:
+            return
+        if self.unit is None:
+            self.unit = unit
+        elif unit != self.unit:
+            raise ValueError(f"Unit {unit} does not match series unit {self.unit}")
+
+    def append(
+        self,
+        start: datetime | int,
+        consumption: float | None,
+        unit: str | None = None,
+    ) -> None:
+        """Append a row. Missing consumption is stored as NaN."""
+        self._check_unit(unit)
+        self.starts.append(start if isinstance(start, int) else int(start.timestamp()))
+        self.consumption.append(math.nan if consumption is None else consumption)
+
+    def extend(self, other: Self) -> None:
+        """Append all rows from another series."""
+        self._check_unit(other.unit)
+        self.starts.extend(other.starts)
+        self.consumption.extend(other.consumption)
+
+    def to_half_hours(self) -> list[OVOHalfHour]:
+        """Return all rows as half hour models."""
+        return list(self)
+
+    def as_numpy(self) -> tuple["npt.NDArray[np.int64]", "npt.NDArray[np.float64]"]:
+        """Return zero-copy NumPy views of the starts and consumption buffers.
+
+        The views share memory with the series, which cannot grow while any
+        view is still alive.
+        """
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            import numpy as np  # noqa: PLC0415
+        except ImportError as exception:
+            raise ImportError("NumPy is required for as_numpy()") from exception
+
+        return (
+            np.frombuffer(self.starts, dtype=np.int64),
+            np.frombuffer(self.consumption, dtype=np.float64),
+        )
+
+
+@dataclass(slots=True)
+class OVOHalfHourSeriesUsage:
+    """Half hour series usage model."""
+
+    electricity: OVOHalfHourSeries | None
+    gas: OVOHalfHourSeries | None
+
+    def to_half_hour_usage(self) -> OVOHalfHourUsage:
+        """Return the usage as an `OVOHalfHourUsage` model."""
+        return OVOHalfHourUsage(
+            electricity=(
+                self.electricity.to_half_hours()
+                if self.electricity is not None
+                else None
+            ),
+            gas=self.gas.to_half_hours() if self.gas is not None else None,
+        )
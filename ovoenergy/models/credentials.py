@@ -0,0 +1,18 @@
+"""Credential Models."""
+
+from dataclasses import dataclass
+from http.cookies import SimpleCookie
+from uuid import UUID
+
+from .oauth import OAuth
+
+
+@dataclass(slots=True)
+class OVOCredentials:
+    """Session credentials model, restorable without logging in again."""
+
+    username: str
+    cookies: SimpleCookie
+    oauth: OAuth
+    customer_id: UUID | None
+    account_ids: list[int] | None
@@ -0,0 +1,16 @@
+"""Fleet Models."""
+
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+
+@dataclass(slots=True)
+class OVOFleetResult(Generic[_T]):
+    """Fleet result model."""
+
+    username: str
+    account_id: int | None
+    result: _T | None
+    error: Exception | None
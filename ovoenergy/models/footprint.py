@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOFootprintElectricity:
     """Electricity footprint model."""
 
@@ -13,7 +13,7 @@ class OVOFootprintElectricity:
     k_wh: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOFootprintGas:
     """Gas footprint model."""
 
@@ -22,7 +22,7 @@ class OVOFootprintGas:
     k_wh: float
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOFootprintBreakdown:
     """Footprint breakdown model."""
 
@@ -30,7 +30,7 @@ class OVOFootprintBreakdown:
     gas: OVOFootprintGas
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOCarbonFootprint:
     """Carbon footprint model."""
 
@@ -40,7 +40,7 @@ class OVOCarbonFootprint:
     breakdown: OVOFootprintBreakdown
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOFootprint:
     """Footprint model."""
 
@@ -0,0 +1,89 @@
+"""Usage response payloads, for decoding with msgspec in one pass.
+
+Only fields the models need are declared, so msgspec skips the rest. This
+module needs msgspec and is only imported by the msgspec decoder.
+"""
+
+from typing import Any
+
+from msgspec import Struct
+
+
+class Interval(Struct):
+    """Interval payload."""
+
+    start: str
+    end: str
+
+
+class HalfHourInterval(Struct):
+    """Half hour interval payload. The end is always inferred from the start."""
+
+    start: str
+
+
+class HalfHourRow(Struct):
+    """Half hour row payload."""
+
+    consumption: float | None
+    interval: HalfHourInterval
+    unit: str
+
+
+class HalfHourFuel(Struct):
+    """Half hourly fuel payload."""
+
+    data: list[HalfHourRow | None] | None = None
+
+
+class HalfHourPayload(Struct):
+    """Half hourly usage payload."""
+
+    electricity: HalfHourFuel | None = None
+    gas: HalfHourFuel | None = None
+
+
+class MeterReadings(Struct):
+    """Meter readings payload. Readings are passed through as sent."""
+
+    start: Any
+    end: Any
+
+
+class Cost(Struct, rename="camel"):
+    """Cost payload. Amounts are passed through as sent."""
+
+    amount: Any
+    currency_unit: Any
+
+
+class Rates(Struct):
+    """Rates payload."""
+
+    anytime: float | None = None
+    standing: float | None = None
+
+
+class DailyRow(Struct, rename="camel"):
+    """Daily electricity or gas row payload."""
+
+    consumption: float | None = None
+    volume: float | None = None
+    interval: Interval | None = None
+    meter_readings: MeterReadings | None = None
+    has_half_hour_data: bool | None = None
+    cost: Cost | None = None
+    rates: Rates | None = None
+
+
+class DailyFuel(Struct):
+    """Daily fuel payload."""
+
+    data: list[DailyRow | None] | None = None
+
+
+class DailyPayload(Struct):
+    """Daily usage payload."""
+
+    electricity: DailyFuel | None = None
+    gas: DailyFuel | None = None
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOPlanRate:
     """Plan rate model."""
 
@@ -12,7 +12,7 @@ class OVOPlanRate:
     currency_unit: str
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOPlanStatus:
     """Plan status model."""
 
@@ -23,7 +23,7 @@ class OVOPlanStatus:
     has_future_contracts: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOPlanUnitRate:
     """Unit rate model."""
 
@@ -31,7 +31,7 @@ class OVOPlanUnitRate:
     unit_rate: OVOPlanRate
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOPlanElectricity:
     """Plan electricity model."""
 
@@ -49,7 +49,7 @@ class OVOPlanElectricity:
     unit_rates: list[OVOPlanUnitRate]
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOPlanGas:
     """Plan gas model."""
 
@@ -67,7 +67,7 @@ class OVOPlanGas:
     unit_rates: list[OVOPlanUnitRate]
 
 
-@dataclass
+@dataclass(slots=True)
 class OVOPlans:
     """Plan model."""
 
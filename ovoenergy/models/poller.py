@@ -0,0 +1,15 @@
+"""Poller Models."""
+
+from dataclasses import dataclass
+from typing import Literal
+
+from . import OVOHalfHour
+
+
+@dataclass(slots=True)
+class OVOHalfHourUpdate:
+    """New or changed half hour model."""
+
+    account_id: int
+    fuel: Literal["electricity", "gas"]
+    half_hour: OVOHalfHour
@@ -0,0 +1,35 @@
+"""Response Models."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from http.cookies import SimpleCookie
+from typing import Any
+
+
+@dataclass(slots=True)
+class OVOResponse:
+    """Response model.
+
+    The body has already been read and the connection released back to the
+    pool by the time this is returned.
+    """
+
+    status: int
+    headers: Mapping[str, str]
+    cookies: SimpleCookie
+    body: bytes
+    endpoint: str = "other"
+
+
+@dataclass(slots=True)
+class OVOConditionalEntry:
+    """Validators and parsed model of the last response from a URL.
+
+    `body_hash` lets an unchanged body be recognised when the API sent no
+    validators, so it need not be parsed again.
+    """
+
+    etag: str | None
+    last_modified: str | None
+    body_hash: bytes
+    value: Any
@@ -0,0 +1,38 @@
+"""Tariff Models."""
+
+from dataclasses import dataclass
+from datetime import date, datetime, time
+
+from .aggregation import RollupPeriod
+
+
+@dataclass(slots=True)
+class OVOTariff:
+    """Tariff model.
+
+    Rates are per unit of consumption and the standing charge is per day,
+    both in the currency unit. If an off peak rate is set, it applies
+    between the local off peak start and end times.
+    """
+
+    currency_unit: str
+    unit_rate: float
+    standing_charge: float
+    off_peak_rate: float | None = None
+    off_peak_start: time = time(0, 30)
+    off_peak_end: time = time(7, 30)
+
+
+@dataclass(slots=True)
+class OVOCostRollup:
+    """Cost rollup model.
+
+    Standing charges are added once per local day with any usage, so
+    hourly rollups only carry unit costs.
+    """
+
+    period: RollupPeriod
+    currency_unit: str
+    unit_costs: dict[date | datetime, float]
+    standing_charges: dict[date | datetime, float]
+    totals: dict[date | datetime, float]
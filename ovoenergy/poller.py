@@ -0,0 +1,177 @@
+"""Incremental polling of live half hourly usage."""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from datetime import date, datetime, timedelta
+import logging
+import random
+import time
+from typing import Literal
+
+import aiohttp
+
+from . import OVOEnergy
+from .exceptions import OVOEnergyAPIException, OVOEnergyNoAccount
+from .models import OVOHalfHour, OVOHalfHourUsage
+from .models.poller import OVOHalfHourUpdate
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = timedelta(minutes=5)
+DEFAULT_POLL_JITTER = timedelta(seconds=30)
+
+_FUELS: tuple[Literal["electricity", "gas"], ...] = ("electricity", "gas")
+
+
+class OVOHalfHourPoller:
+    """Poll half hourly usage, yielding only rows not seen before.
+
+    The poller remembers the consumption last emitted for each slot per
+    account and fuel, so a row is yielded when it first appears and again
+    only if its value is revised.
+    """
+
+    def __init__(
+        self,
+        client: OVOEnergy,
+        *,
+        interval: timedelta = DEFAULT_POLL_INTERVAL,
+        jitter: timedelta = DEFAULT_POLL_JITTER,
+    ) -> None:
+        """Initialize."""
+        if interval <= timedelta(0):
+            raise ValueError("Poll interval must be positive")
+        if jitter < timedelta(0):
+            raise ValueError("Poll jitter must not be negative")
+
+        self._client = client
+        self._interval = interval
+        self._jitter = jitter
+        self._day: date | None = None
+        self._seen: dict[tuple[int, str], dict[datetime, float | None]] = {}
+
+    def reset(self) -> None:
+        """Forget every row seen, so the next poll yields them all again."""
+        self._day = None
+        self._seen.clear()
+
+    def _diff(
+        self,
+        account_id: int,
+        fuel: Literal["electricity", "gas"],
+        half_hours: list[OVOHalfHour] | None,
+    ) -> list[OVOHalfHourUpdate]:
+        """Return updates for rows that are new or changed since last seen."""
+        if not half_hours:
+            return []
+
+        seen = self._seen.setdefault((account_id, fuel), {})
+        updates: list[OVOHalfHourUpdate] = []
+        for half_hour in sorted(half_hours, key=lambda row: row.interval.start):
+            start = half_hour.interval.start
+            # A missing consumption is still a row, so compare by presence
+            if start in seen and seen[start] == half_hour.consumption:
+                continue
+            seen[start] = half_hour.consumption
+            updates.append(OVOHalfHourUpdate(account_id, fuel, half_hour))
+        return updates
+
+    def _prune(self, day: date) -> None:
+        """Forget slots from before the day before, which will not be polled again."""
+        # Slots are in UTC and days are local, so keep a day's margin
+        cutoff = day - timedelta(days=1)
+        for seen in self._seen.values():
+            for start in [start for start in seen if start.date() < cutoff]:
+                del seen[start]
+
+    async def _fetch(
+        self,
+        day: date,
+        account_ids: list[int] | None,
+    ) -> dict[int, OVOHalfHourUsage]:
+        """Fetch a day's usage for the given accounts, or every account."""
+        if account_ids is None:
+            try:
+                return await self._client.get_half_hourly_usage_all_accounts(
+                    day.isoformat()
+                )
+            except OVOEnergyNoAccount:
+                return {}
+        return {
+            account_id: await self._client.get_half_hourly_usage(
+                day.isoformat(), account_id=account_id
+            )
+            for account_id in account_ids
+        }
+
+    async def poll_once(
+        self,
+        day: date | None = None,
+        *,
+        account_ids: Iterable[int] | None = None,
+    ) -> list[OVOHalfHourUpdate]:
+        """Poll a day (default: today) once, returning new or changed rows.
+
+        Every account is polled unless account ids are given. When the day
+        rolls over, the previous day is polled one last time first, so late
+        slots from just before midnight are not missed.
+        """
+        if day is None:
+            day = date.today()
+        if account_ids is not None:
+            account_ids = list(account_ids)
+
+        days = [day]
+        if self._day is not None and self._day < day:
+            days.insert(0, self._day)
+
+        updates: list[OVOHalfHourUpdate] = []
+        for poll_day in days:
+            usage = await self._fetch(poll_day, account_ids)
+            for account_id, account_usage in usage.items():
+                for fuel in _FUELS:
+                    updates.extend(
+                        self._diff(account_id, fuel, getattr(account_usage, fuel))
+                    )
+
+        if self._day != day:
+            self._prune(day)
+            self._day = day
+
+        return updates
+
+    def _delay(self, started: float) -> float:
+        """Return seconds until the next poll, with random jitter added."""
+        elapsed = time.monotonic() - started
+        jitter = random.uniform(0, self._jitter.total_seconds())
+        return max(0.0, self._interval.total_seconds() - elapsed + jitter)
+
+    async def poll(
+        self,
+        *,
+        account_ids: Iterable[int] | None = None,
+    ) -> AsyncIterator[OVOHalfHourUpdate]:
+        """Poll today's usage forever, yielding rows as they appear or change.
+
+        Every account is polled unless account ids are given. API errors are
+        logged and the poll retried at the next interval.
+        """
+        if account_ids is not None:
+            account_ids = list(account_ids)
+
+        while True:
+            started = time.monotonic()
+            try:
+                updates = await self.poll_once(account_ids=account_ids)
+            except (
+                OVOEnergyAPIException,
+                aiohttp.ClientError,
+                TimeoutError,
+            ) as exception:
+                _LOGGER.warning("Half hourly poll failed: %s", exception)
+                updates = []
+
+            for update in updates:
+                yield update
+
+            await asyncio.sleep(self._delay(started))
@@ -0,0 +1,127 @@
+"""Retry and rate limiting for API requests."""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+import random
+import time
+from typing import NamedTuple
+
+from .const import AUTH_BASE_URL, KALUZA_BASE_URL, SMARTPAY_BASE_URL
+
+
+class OVORateLimit(NamedTuple):
+    """Requests per second and burst size for an API."""
+
+    rate: float
+    burst: int
+
+
+DEFAULT_RATE_LIMITS: dict[str, OVORateLimit] = {
+    AUTH_BASE_URL: OVORateLimit(2.0, 5),
+    KALUZA_BASE_URL: OVORateLimit(5.0, 10),
+    SMARTPAY_BASE_URL: OVORateLimit(10.0, 20),
+}
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header, in seconds or as an HTTP date."""
+    if value is None:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    # The email package is slow to import and HTTP dates are rare here
+    # pylint: disable-next=import-outside-toplevel
+    from email.utils import parsedate_to_datetime  # noqa: PLC0415
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+@dataclass(slots=True)
+class OVORetryPolicy:
+    """Retry policy model.
+
+    Retries use exponential backoff with full jitter, unless the response
+    says how long to wait with a Retry-After header. That wait is always
+    honoured in full, so if it is longer than `retry_after_max` the request
+    is not retried at all.
+    """
+
+    retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_after_max: float = 60.0
+    retry_statuses: frozenset[int] = field(
+        default_factory=lambda: frozenset({429, 500, 502, 503, 504})
+    )
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float | None:
+        """Return how long to wait before retrying after an attempt.
+
+        Returns None if the server asked for a longer wait than allowed.
+        """
+        if (seconds := parse_retry_after(retry_after)) is not None:
+            return seconds if seconds <= self.retry_after_max else None
+
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+
+class OVOTokenBucket:
+    """Client-side token bucket rate limiter."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+    ) -> None:
+        """Initialize."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for a while, e.g. after a 429."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if self._paused_until > now:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+def create_rate_limiters(
+    rate_limits: dict[str, OVORateLimit] | None = None,
+) -> dict[str, OVOTokenBucket]:
+    """Create a token bucket for each API base URL."""
+    return {
+        base_url: OVOTokenBucket(rate, burst)
+        for base_url, (rate, burst) in (rate_limits or DEFAULT_RATE_LIMITS).items()
+    }
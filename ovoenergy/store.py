@@ -0,0 +1,370 @@
+"""Local SQLite storage for usage data."""
+
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, timedelta
+import json
+import os
+import sqlite3
+from typing import Literal, Self
+
+from .models import (
+    OVOCost,
+    OVODailyElectricity,
+    OVODailyGas,
+    OVODailyUsage,
+    OVOHalfHour,
+    OVOHalfHourUsage,
+    OVOInterval,
+    OVOMeterReadings,
+    OVORates,
+)
+from .models.backfill import OVOHalfHourGap
+
+FetchKind = Literal["daily", "half_hourly"]
+Fuel = Literal["electricity", "gas"]
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_HALF_HOUR_MICROSECONDS = 30 * 60 * 1_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS half_hourly (
+    account_id INTEGER NOT NULL,
+    fuel TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    "end" INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    consumption,
+    unit,
+    PRIMARY KEY (account_id, fuel, start)
+);
+CREATE INDEX IF NOT EXISTS half_hourly_day ON half_hourly (account_id, day);
+CREATE TABLE IF NOT EXISTS daily (
+    account_id INTEGER NOT NULL,
+    fuel TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    "end" INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    consumption,
+    volume,
+    meter_readings_start,
+    meter_readings_end,
+    has_half_hour_data,
+    cost_amount,
+    cost_currency_unit,
+    rates_anytime,
+    rates_standing,
+    PRIMARY KEY (account_id, fuel, start)
+);
+CREATE INDEX IF NOT EXISTS daily_day ON daily (account_id, day);
+CREATE TABLE IF NOT EXISTS fetches (
+    account_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    period TEXT NOT NULL,
+    fetched_at INTEGER NOT NULL,
+    PRIMARY KEY (account_id, kind, period)
+);
+"""
+
+
+def _to_timestamp(value: datetime) -> int:
+    """Convert a datetime to integer microseconds since the epoch."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _from_timestamp(value: int) -> datetime:
+    """Convert integer microseconds since the epoch to a UTC datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+class OVOUsageStore:
+    """Store usage rows in a local SQLite database.
+
+    Rows are keyed by account, fuel and interval start, so writing the same
+    interval again replaces the previous values.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] = ":memory:",
+    ) -> None:
+        """Initialize."""
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> Self:
+        """Enter the store context."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Exit the store context."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def write_half_hourly_usage(
+        self,
+        account_id: int,
+        day: date,
+        usage: OVOHalfHourUsage,
+    ) -> None:
+        """Write half hourly usage fetched for a day."""
+        rows = [
+            (
+                account_id,
+                fuel,
+                _to_timestamp(half_hour.interval.start),
+                _to_timestamp(half_hour.interval.end),
+                day.isoformat(),
+                half_hour.consumption,
+                half_hour.unit,
+            )
+            for fuel, half_hours in (
+                ("electricity", usage.electricity),
+                ("gas", usage.gas),
+            )
+            for half_hour in half_hours or []
+        ]
+
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO half_hourly VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def write_daily_usage(
+        self,
+        account_id: int,
+        usage: OVODailyUsage,
+    ) -> None:
+        """Write daily usage.
+
+        Rows without an interval cannot be keyed and are skipped.
+        """
+        rows = [
+            (
+                account_id,
+                fuel,
+                _to_timestamp(daily.interval.start),
+                _to_timestamp(daily.interval.end),
+                daily.interval.start.date().isoformat(),
+                daily.consumption,
+                daily.volume if isinstance(daily, OVODailyGas) else None,
+                daily.meter_readings.start if daily.meter_readings else None,
+                daily.meter_readings.end if daily.meter_readings else None,
+                daily.has_half_hour_data,
+                daily.cost.amount if daily.cost else None,
+                daily.cost.currency_unit if daily.cost else None,
+                daily.rates.anytime if daily.rates else None,
+                daily.rates.standing if daily.rates else None,
+            )
+            for fuel, dailies in (
+                ("electricity", usage.electricity),
+                ("gas", usage.gas),
+            )
+            for daily in dailies or []
+            if daily.interval is not None
+        ]
+
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO daily VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def mark_fetched(
+        self,
+        account_id: int,
+        kind: FetchKind,
+        period: str,
+        fetched_at: datetime,
+    ) -> None:
+        """Record that a period has been fetched from the API."""
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO fetches VALUES (?, ?, ?, ?)",
+                (account_id, kind, period, _to_timestamp(fetched_at)),
+            )
+
+    def get_fetched(
+        self,
+        account_id: int,
+        kind: FetchKind,
+    ) -> dict[str, datetime]:
+        """Return when each period of a kind was last fetched."""
+        return {
+            period: _from_timestamp(fetched_at)
+            for period, fetched_at in self._connection.execute(
+                "SELECT period, fetched_at FROM fetches "
+                "WHERE account_id = ? AND kind = ?",
+                (account_id, kind),
+            )
+        }
+
+    def get_half_hourly_gaps(
+        self,
+        account_ids: Iterable[int],
+        start: date,
+        end: date,
+    ) -> list[OVOHalfHourGap]:
+        """Return days from start to end (inclusive) missing half hourly rows.
+
+        A fuel's day has a gap if its daily row says half hourly data is
+        available, but fewer half hours are stored than its interval spans.
+        Gaps are ordered by priority: newest day first, then by how much is
+        missing.
+        """
+        return [
+            OVOHalfHourGap(
+                account_id=account_id,
+                fuel=fuel,
+                day=date.fromisoformat(day),
+                expected=expected,
+                stored=stored,
+            )
+            for account_id, fuel, day, expected, stored in self._connection.execute(
+                "SELECT daily.account_id, daily.fuel, daily.day, "
+                'CAST(ROUND((daily."end" - daily.start) / ?) AS INTEGER) AS expected, '
+                "COUNT(half_hourly.start) AS stored FROM daily "
+                "LEFT JOIN half_hourly ON half_hourly.account_id = daily.account_id "
+                "AND half_hourly.fuel = daily.fuel AND half_hourly.day = daily.day "
+                "WHERE daily.account_id IN (SELECT value FROM json_each(?)) "
+                "AND daily.day BETWEEN ? AND ? AND daily.has_half_hour_data "
+                "GROUP BY daily.account_id, daily.fuel, daily.day "
+                "HAVING stored < expected "
+                "ORDER BY daily.day DESC, expected - stored DESC, "
+                "daily.account_id, daily.fuel",
+                (
+                    float(_HALF_HOUR_MICROSECONDS),
+                    json.dumps(list(account_ids)),
+                    start.isoformat(),
+                    end.isoformat(),
+                ),
+            )
+        ]
+
+    def get_half_hourly_usage(
+        self,
+        account_id: int,
+        start: date,
+        end: date,
+    ) -> OVOHalfHourUsage:
+        """Get stored half hourly usage for days from start to end (inclusive)."""
+        ovo_usage = OVOHalfHourUsage(
+            electricity=None,
+            gas=None,
+        )
+
+        for fuel, row_start, row_end, consumption, unit in self._connection.execute(
+            'SELECT fuel, start, "end", consumption, unit FROM half_hourly '
+            "WHERE account_id = ? AND day BETWEEN ? AND ? ORDER BY fuel, start",
+            (account_id, start.isoformat(), end.isoformat()),
+        ):
+            half_hour = OVOHalfHour(
+                consumption=consumption,
+                interval=OVOInterval(
+                    start=_from_timestamp(row_start),
+                    end=_from_timestamp(row_end),
+                ),
+                unit=unit,
+            )
+            if fuel == "electricity":
+                if ovo_usage.electricity is None:
+                    ovo_usage.electricity = []
+                ovo_usage.electricity.append(half_hour)
+            else:
+                if ovo_usage.gas is None:
+                    ovo_usage.gas = []
+                ovo_usage.gas.append(half_hour)
+
+        return ovo_usage
+
+    def get_daily_usage(
+        self,
+        account_id: int,
+        start: date,
+        end: date,
+    ) -> OVODailyUsage:
+        """Get stored daily usage for days from start to end (inclusive)."""
+        ovo_usage = OVODailyUsage(
+            electricity=None,
+            gas=None,
+        )
+
+        for (
+            fuel,
+            row_start,
+            row_end,
+            consumption,
+            volume,
+            meter_readings_start,
+            meter_readings_end,
+            has_half_hour_data,
+            cost_amount,
+            cost_currency_unit,
+            rates_anytime,
+            rates_standing,
+        ) in self._connection.execute(
+            'SELECT fuel, start, "end", consumption, volume, meter_readings_start, '
+            "meter_readings_end, has_half_hour_data, cost_amount, "
+            "cost_currency_unit, rates_anytime, rates_standing FROM daily "
+            "WHERE account_id = ? AND day BETWEEN ? AND ? ORDER BY fuel, start",
+            (account_id, start.isoformat(), end.isoformat()),
+        ):
+            interval = OVOInterval(
+                start=_from_timestamp(row_start),
+                end=_from_timestamp(row_end),
+            )
+            meter_readings = (
+                OVOMeterReadings(start=meter_readings_start, end=meter_readings_end)
+                if meter_readings_start is not None or meter_readings_end is not None
+                else None
+            )
+            cost = (
+                OVOCost(amount=cost_amount, currency_unit=cost_currency_unit)
+                if cost_amount is not None or cost_currency_unit is not None
+                else None
+            )
+            rates = (
+                OVORates(anytime=rates_anytime, standing=rates_standing)
+                if rates_anytime is not None or rates_standing is not None
+                else None
+            )
+            has_half_hour_data = (
+                bool(has_half_hour_data) if has_half_hour_data is not None else None
+            )
+
+            if fuel == "electricity":
+                if ovo_usage.electricity is None:
+                    ovo_usage.electricity = []
+                ovo_usage.electricity.append(
+                    OVODailyElectricity(
+                        consumption=consumption,
+                        interval=interval,
+                        meter_readings=meter_readings,
+                        has_half_hour_data=has_half_hour_data,
+                        cost=cost,
+                        rates=rates,
+                    )
+                )
+            else:
+                if ovo_usage.gas is None:
+                    ovo_usage.gas = []
+                ovo_usage.gas.append(
+                    OVODailyGas(
+                        consumption=consumption,
+                        volume=volume,
+                        interval=interval,
+                        meter_readings=meter_readings,
+                        has_half_hour_data=has_half_hour_data,
+                        cost=cost,
+                        rates=rates,
+                    )
+                )
+
+        return ovo_usage
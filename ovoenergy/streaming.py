@@ -0,0 +1,181 @@
+"""Incremental parsing of usage rows from a streamed response body."""
+
+import codecs
+from collections.abc import Iterable
+import json
+import re
+from typing import Any, Literal
+
+from .exceptions import OVOEnergyAPIInvalidResponse
+
+UsageFuel = Literal["electricity", "gas"]
+USAGE_FUELS: tuple[UsageFuel, ...] = ("electricity", "gas")
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Where the parser is in `{"<fuel>": {"data": [<row>, ...], ...}, ...}`
+_State = Literal[
+    "start",
+    "top_key",
+    "top_value",
+    "top_next",
+    "fuel_key",
+    "fuel_value",
+    "fuel_next",
+    "row",
+    "row_next",
+    "end",
+]
+
+
+class _Incomplete(Exception):
+    """More input is needed before the next token can be parsed."""
+
+
+class OVOUsageRowParser:
+    """Parse `<fuel>.data` rows out of a usage body as it arrives.
+
+    Feed it chunks of the body and it returns each row completed so far,
+    decoded to a dict. Only the unparsed tail of the body and the current
+    row are held in memory, so memory stays bounded however large the
+    response is. Anything outside the data arrays is skipped.
+    """
+
+    def __init__(self, fuels: Iterable[str] = USAGE_FUELS) -> None:
+        """Initialize."""
+        self._fuels = frozenset(fuels)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._final = False
+        self._state: _State = "start"
+        self._key: str | None = None
+        self._fuel: str | None = None
+
+    @property
+    def done(self) -> bool:
+        """Return whether the whole body has been parsed."""
+        return self._state == "end"
+
+    def feed(self, chunk: bytes) -> list[tuple[str, dict[str, Any]]]:
+        """Parse a chunk, returning the (fuel, row) pairs it completed."""
+        self._buffer = self._buffer[self._position :] + self._text.decode(chunk)
+        self._position = 0
+        return self._parse()
+
+    def close(self) -> list[tuple[str, dict[str, Any]]]:
+        """Parse what is left at the end of the body."""
+        self._buffer = self._buffer[self._position :] + self._text.decode(
+            b"", final=True
+        )
+        self._position = 0
+        self._final = True
+        rows = self._parse()
+        if not self.done:
+            raise OVOEnergyAPIInvalidResponse("Usage response ended early")
+        return rows
+
+    def _skip_whitespace(self) -> str:
+        """Skip whitespace, returning the next character."""
+        self._position = _WHITESPACE.match(self._buffer, self._position).end()
+        if self._position >= len(self._buffer):
+            raise _Incomplete
+        return self._buffer[self._position]
+
+    def _expect(self, *characters: str) -> str:
+        """Consume one of the expected structural characters."""
+        if (character := self._skip_whitespace()) not in characters:
+            raise OVOEnergyAPIInvalidResponse(
+                f"Unexpected {character!r} at {self._position} in usage response"
+            )
+        self._position += 1
+        return character
+
+    def _value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self._skip_whitespace()
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError as exception:
+            if self._final:
+                raise OVOEnergyAPIInvalidResponse(
+                    f"Invalid usage response: {exception}"
+                ) from exception
+            raise _Incomplete from exception
+        # A number at the end of the buffer may continue in the next chunk
+        if end >= len(self._buffer) and not self._final:
+            raise _Incomplete
+        self._position = end
+        return value
+
+    def _key_name(self, next_state: _State, close_state: _State) -> None:
+        """Read an object key and its colon, or the end of the object."""
+        if self._expect('"', "}") == "}":
+            self._state = close_state
+            return
+        self._position -= 1
+        key = self._value()
+        self._expect(":")
+        self._key = key
+        self._state = next_state
+
+    def _parse(self) -> list[tuple[str, dict[str, Any]]]:
+        """Parse as far as the buffer allows."""
+        rows: list[tuple[str, dict[str, Any]]] = []
+        start = self._position
+        try:
+            while self._state != "end":
+                start = self._position
+                self._step(rows)
+        except _Incomplete:
+            # Steps only change state once complete, so just rewind
+            self._position = start
+            if self._final:
+                raise OVOEnergyAPIInvalidResponse(
+                    "Usage response ended early"
+                ) from None
+        return rows
+
+    def _step(self, rows: list[tuple[str, dict[str, Any]]]) -> None:
+        """Parse one token, changing state only once it is complete."""
+        state = self._state
+        if state == "start":
+            self._expect("{")
+            self._state = "top_key"
+        elif state == "top_key":
+            self._key_name("top_value", "end")
+        elif state == "top_value":
+            if self._key in self._fuels and self._skip_whitespace() == "{":
+                self._position += 1
+                self._fuel = self._key
+                self._state = "fuel_key"
+            else:
+                self._value()
+                self._state = "top_next"
+        elif state == "top_next":
+            self._state = "top_key" if self._expect(",", "}") == "," else "end"
+        elif state == "fuel_key":
+            self._key_name("fuel_value", "top_next")
+        elif state == "fuel_value":
+            if self._key == "data" and self._skip_whitespace() == "[":
+                self._position += 1
+                self._state = "row"
+            else:
+                self._value()
+                self._state = "fuel_next"
+        elif state == "fuel_next":
+            self._state = "fuel_key" if self._expect(",", "}") == "," else "top_next"
+        elif state == "row":
+            if self._skip_whitespace() == "]":
+                # Empty data array
+                self._position += 1
+                self._state = "fuel_next"
+            else:
+                if (row := self._value()) is not None:
+                    rows.append((self._fuel, row))
+                self._state = "row_next"
+        elif state == "row_next":
+            self._state = "row" if self._expect(",", "]") == "," else "fuel_next"
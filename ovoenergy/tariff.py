@@ -0,0 +1,166 @@
+"""Cost of half hourly usage from plan unit rates and standing charges."""
+
+from array import array
+from datetime import date, datetime, time, tzinfo
+
+from . import intervals
+from .aggregation import (
+    DEFAULT_TIMEZONE,
+    OVOUsageAggregator,
+    local_epochs,
+    period_start,
+)
+from .models.aggregation import RollupPeriod
+from .models.columnar import OVOHalfHourSeries
+from .models.plan import OVOPlanElectricity, OVOPlanGas
+from .models.tariff import OVOCostRollup, OVOTariff
+
+_DAY_SECONDS = 86400
+
+# Unit rate names that apply overnight on multi-rate (e.g. Economy 7) plans
+OFF_PEAK_RATE_NAMES = frozenset({"night", "off peak", "off-peak", "offpeak"})
+
+# Gas meters measure volume, which is billed in kWh using the calorific
+# value (MJ/m³) on the bill and the standard volume correction factor
+GAS_VOLUME_UNITS = frozenset({"m³", "m3"})
+GAS_VOLUME_CORRECTION = 1.02264
+MJ_PER_KWH = 3.6
+
+
+def tariff_from_plan(plan: OVOPlanElectricity | OVOPlanGas) -> OVOTariff:
+    """Create a tariff from a plan's unit rates and standing charge."""
+    if not plan.unit_rates:
+        raise ValueError(f"Plan {plan.name} has no unit rates")
+
+    peak = [
+        rate for rate in plan.unit_rates if rate.name.lower() not in OFF_PEAK_RATE_NAMES
+    ]
+    off_peak = [
+        rate for rate in plan.unit_rates if rate.name.lower() in OFF_PEAK_RATE_NAMES
+    ]
+    unit_rate = (peak or off_peak)[0].unit_rate
+
+    return OVOTariff(
+        currency_unit=unit_rate.currency_unit,
+        unit_rate=unit_rate.amount,
+        standing_charge=plan.standing_charge.amount,
+        off_peak_rate=off_peak[0].unit_rate.amount if peak and off_peak else None,
+    )
+
+
+def _seconds(value: time) -> int:
+    """Return seconds since midnight."""
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def kwh_factor(unit: str | None, calorific_value: float | None = None) -> float:
+    """Return the factor converting consumption in a unit to kWh.
+
+    Plan unit rates are per kWh, so gas volumes need the calorific value in
+    MJ/m³ to be costed. Any other unit raises ValueError.
+    """
+    if unit is not None and unit.lower() == "kwh":
+        return 1.0
+    if unit in GAS_VOLUME_UNITS:
+        if calorific_value is None:
+            raise ValueError(
+                f"Consumption in {unit} needs a calorific value to convert to kWh"
+            )
+        return GAS_VOLUME_CORRECTION * calorific_value / MJ_PER_KWH
+    raise ValueError(f"Cannot cost consumption in {unit!r}, rates are per kWh")
+
+
+def slot_costs(
+    series: OVOHalfHourSeries,
+    tariff: OVOTariff,
+    tz: str | tzinfo = DEFAULT_TIMEZONE,
+    *,
+    calorific_value: float | None = None,
+) -> array:
+    """Return the unit cost of each slot. Missing consumption costs NaN.
+
+    Series in m³ are converted to kWh with `calorific_value`, see kwh_factor.
+    With NumPy, the rate lookup and multiplication are one vectorised pass.
+    """
+    if not series.starts:
+        return array("d")
+
+    factor = kwh_factor(series.unit, calorific_value)
+    unit_rate = tariff.unit_rate * factor
+
+    if tariff.off_peak_rate is None:
+        if (np := intervals.numpy_or_none()) is not None:
+            costs = np.frombuffer(series.consumption, dtype=np.float64) * unit_rate
+            return array("d", costs.tobytes())
+        return array("d", [value * unit_rate for value in series.consumption])
+
+    off_peak_rate = tariff.off_peak_rate * factor
+
+    # Off peak windows follow the local clock, so they shift with DST
+    start = _seconds(tariff.off_peak_start)
+    end = _seconds(tariff.off_peak_end)
+    local = local_epochs(series.starts, tz)
+
+    if (np := intervals.numpy_or_none()) is not None:
+        seconds = np.frombuffer(local, dtype=np.int64) % _DAY_SECONDS
+        off_peak = (
+            (seconds >= start) & (seconds < end)
+            if start <= end
+            else (seconds >= start) | (seconds < end)
+        )
+        rates = np.where(off_peak, off_peak_rate, unit_rate)
+        costs = np.frombuffer(series.consumption, dtype=np.float64) * rates
+        return array("d", costs.tobytes())
+
+    costs = array("d")
+    for epoch, value in zip(local, series.consumption, strict=True):
+        seconds = epoch % _DAY_SECONDS
+        is_off_peak = (
+            start <= seconds < end
+            if start <= end
+            else seconds >= start or seconds < end
+        )
+        costs.append(value * (off_peak_rate if is_off_peak else unit_rate))
+    return costs
+
+
+def cost_rollup(
+    series: OVOHalfHourSeries,
+    tariff: OVOTariff,
+    period: RollupPeriod,
+    tz: str | tzinfo = DEFAULT_TIMEZONE,
+    *,
+    calorific_value: float | None = None,
+) -> OVOCostRollup:
+    """Return unit costs, standing charges and totals of a series for a period.
+
+    Gas series in m³ need `calorific_value`, as for slot_costs.
+    """
+    aggregator = OVOUsageAggregator(tz)
+    aggregator.add(
+        OVOHalfHourSeries(
+            unit=tariff.currency_unit,
+            starts=series.starts,
+            consumption=slot_costs(series, tariff, tz, calorific_value=calorific_value),
+        )
+    )
+    unit_costs = aggregator.rollup(period).totals
+
+    standing_charges: dict[date | datetime, float] = {}
+    if period != "hour":
+        for day in aggregator.rollup("day").totals:
+            key = period_start(day, period)
+            standing_charges[key] = (
+                standing_charges.get(key, 0.0) + tariff.standing_charge
+            )
+
+    return OVOCostRollup(
+        period=period,
+        currency_unit=tariff.currency_unit,
+        unit_costs=unit_costs,
+        standing_charges=standing_charges,
+        totals={
+            key: unit_costs.get(key, 0.0) + standing_charges.get(key, 0.0)
+            for key in sorted(unit_costs.keys() | standing_charges.keys())
+        },
+    )
@@ -20,7 +20,13 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/timmo001/ovoenergy",
     install_requires=requirements,
-    packages=find_packages(exclude=["tests", "generator"]),
+    extras_require={
+        "cryptography": ["cryptography>=42.0.0"],
+        "msgspec": ["msgspec>=0.18.0"],
+        "numpy": ["numpy>=1.26.0"],
+        "orjson": ["orjson>=3.9.0"],
+    },
+    packages=find_packages(exclude=["benchmarks", "tests", "generator"]),
     python_requires=">=3.11",
     version="3.0.3.dev0",
 )
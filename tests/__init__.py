@@ -6,6 +6,7 @@ USERNAME: Final[str] = "test"
 PASSWORD: Final[str] = "test"
 ACCOUNT: Final[int] = 123456789
 ACCOUNT_BAD: Final[int] = 654321789
+ACCOUNT_OTHER: Final[int] = 987654321
 
 RESPONSE_JSON_BASIC: Final[dict] = {"test": "test"}
 
@@ -174,6 +175,55 @@ RESPONSE_JSON_HALF_HOURLY_USAGE: Final[dict] = {
     },
 }
 
+RESPONSE_JSON_PLANS: Final[dict] = {
+    "electricity": [
+        {
+            "name": "Simpler Energy",
+            "exitFee": {"amount": 0.0, "currencyUnit": "GBP"},
+            "contractStartDate": "2024-01-01",
+            "contractEndDate": None,
+            "contractType": "variable",
+            "isInRenewal": False,
+            "hasFutureContracts": False,
+            "mpxn": "1234567890123",
+            "msn": "E12345",
+            "personalProjection": 2700.0,
+            "standingCharge": {"amount": 0.5, "currencyUnit": "GBP"},
+            "unitRates": [
+                {
+                    "name": "Day",
+                    "unitRate": {"amount": 0.3, "currencyUnit": "GBP"},
+                },
+                {
+                    "name": "Night",
+                    "unitRate": {"amount": 0.15, "currencyUnit": "GBP"},
+                },
+            ],
+        }
+    ],
+    "gas": [
+        {
+            "name": "Simpler Energy",
+            "exitFee": {"amount": 0.0, "currencyUnit": "GBP"},
+            "contractStartDate": "2024-01-01",
+            "contractEndDate": None,
+            "contractType": "variable",
+            "isInRenewal": False,
+            "hasFutureContracts": False,
+            "mpxn": "1234567890",
+            "msn": "G12345",
+            "personalProjection": 11500.0,
+            "standingCharge": {"amount": 0.3, "currencyUnit": "GBP"},
+            "unitRates": [
+                {
+                    "name": "Anytime",
+                    "unitRate": {"amount": 0.07, "currencyUnit": "GBP"},
+                },
+            ],
+        }
+    ],
+}
+
 RESPONSE_JSON_FOOTPRINT: Final[dict] = {
     "from": "2024-01-01T00:00:00Z",
     "to": "2024-01-01T23:59:59.999000Z",
@@ -6,13 +6,15 @@ from aiohttp import ClientSession
 from aioresponses import aioresponses
 import pytest
 
-from ovoenergy import OVOEnergy
+from ovoenergy import OVOEnergy, intervals
+from ovoenergy.cache import OVOMemoryCache
 from ovoenergy.const import (
     AUTH_LOGIN_URL,
     AUTH_TOKEN_URL,
     BOOTSTRAP_GRAPHQL_URL,
     CARBON_FOOTPRINT_URL,
     CARBON_INTENSITY_URL,
+    PLANS_URL,
     USAGE_DAILY_URL,
     USAGE_HALF_HOURLY_URL,
 )
@@ -26,6 +28,7 @@ from . import (
     RESPONSE_JSON_FOOTPRINT,
     RESPONSE_JSON_HALF_HOURLY_USAGE,
     RESPONSE_JSON_INTENSITY,
+    RESPONSE_JSON_PLANS,
     RESPONSE_JSON_TOKEN,
 )
 
@@ -70,6 +73,12 @@ def mock_aioresponse():
             status=200,
             repeat=True,
         )
+        mocker.get(
+            f"{PLANS_URL}/{ACCOUNT}",
+            payload=RESPONSE_JSON_PLANS,
+            status=200,
+            repeat=True,
+        )
         mocker.get(
             f"{USAGE_DAILY_URL}/{ACCOUNT_BAD}?date=2024-01",
             status=404,
@@ -85,8 +94,24 @@ def mock_aioresponse():
         yield mocker
 
 
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def with_numpy(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Run a test with and without NumPy."""
+    if request.param:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(intervals, "numpy_or_none", lambda: None)
+
+
 @pytest.fixture
 async def ovoenergy_client() -> AsyncGenerator[OVOEnergy, None]:
     """Return a OVOEnergy client."""
     async with ClientSession() as session:
         yield OVOEnergy(client_session=session)
+
+
+@pytest.fixture
+async def cached_client() -> AsyncGenerator[OVOEnergy, None]:
+    """Return a OVOEnergy client caching responses in memory."""
+    async with ClientSession() as session:
+        yield OVOEnergy(client_session=session, cache=OVOMemoryCache())
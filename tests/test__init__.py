@@ -1,13 +1,25 @@
 """Tests for the client module."""
 
-from datetime import datetime, timedelta
+import asyncio
+from copy import deepcopy
+from datetime import date, datetime, timedelta
 
+from aiohttp import ClientSession, TCPConnector, web
 from aioresponses import aioresponses
 import pytest
 from syrupy.assertion import SnapshotAssertion
+from yarl import URL
 
 from ovoenergy import OVOEnergy
-from ovoenergy.const import AUTH_LOGIN_URL, AUTH_TOKEN_URL, USAGE_DAILY_URL
+from ovoenergy.const import (
+    AUTH_LOGIN_URL,
+    AUTH_TOKEN_URL,
+    BOOTSTRAP_GRAPHQL_URL,
+    CARBON_FOOTPRINT_URL,
+    PLANS_URL,
+    USAGE_DAILY_URL,
+    USAGE_HALF_HOURLY_URL,
+)
 from ovoenergy.exceptions import (
     OVOEnergyAPINoCookies,
     OVOEnergyAPINotAuthorized,
@@ -15,7 +27,17 @@ from ovoenergy.exceptions import (
     OVOEnergyNoAccount,
 )
 
-from . import ACCOUNT, ACCOUNT_BAD, PASSWORD, RESPONSE_JSON_AUTH, USERNAME
+from . import (
+    ACCOUNT,
+    ACCOUNT_BAD,
+    ACCOUNT_OTHER,
+    PASSWORD,
+    RESPONSE_JSON_AUTH,
+    RESPONSE_JSON_BOOTSTRAP_ACCOUNTS,
+    RESPONSE_JSON_DAILY_USAGE,
+    RESPONSE_JSON_FOOTPRINT,
+    USERNAME,
+)
 
 
 @pytest.mark.asyncio
@@ -125,6 +147,27 @@ async def test_get_footprint(
     )
 
 
+@pytest.mark.asyncio
+async def test_get_plans(
+    cached_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+    snapshot: SnapshotAssertion,
+) -> None:
+    """Test get plans."""
+    with pytest.raises(OVOEnergyNoAccount):
+        await cached_client.get_plans()
+
+    await cached_client.authenticate(USERNAME, PASSWORD)
+
+    await cached_client.bootstrap_accounts()
+
+    assert await cached_client.get_plans() == snapshot(
+        name="plans",
+    )
+    assert await cached_client.get_plans() is await cached_client.get_plans()
+    assert len(mock_aioresponse.requests[("GET", URL(f"{PLANS_URL}/{ACCOUNT}"))]) == 1
+
+
 @pytest.mark.asyncio
 async def test_get_carbon_intensity(
     ovoenergy_client: OVOEnergy,
@@ -173,6 +216,72 @@ async def test_bad_account(
         await ovoenergy_client.get_daily_usage("2024-01")
 
 
+@pytest.mark.asyncio
+async def test_explicit_account_id(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test account scoped methods take an account id without changing the default."""
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+    await ovoenergy_client.bootstrap_accounts()
+
+    mock_aioresponse.get(
+        f"{USAGE_DAILY_URL}/{ACCOUNT_OTHER}?date=2024-01",
+        payload=RESPONSE_JSON_DAILY_USAGE,
+    )
+
+    assert await ovoenergy_client.get_daily_usage(
+        "2024-01", account_id=ACCOUNT_OTHER
+    ) == await ovoenergy_client.get_daily_usage("2024-01")
+    assert ovoenergy_client.account_id == ACCOUNT
+
+    with pytest.raises(OVOEnergyAPINotFound):
+        await ovoenergy_client.get_daily_usage("2024-01", account_id=ACCOUNT_BAD)
+
+
+@pytest.mark.asyncio
+async def test_all_accounts(
+    cached_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test all accounts variants fetch every bootstrapped account."""
+    bootstrap = deepcopy(RESPONSE_JSON_BOOTSTRAP_ACCOUNTS)
+    edges = bootstrap["data"]["customer_nextV1"]["customerAccountRelationships"][
+        "edges"
+    ]
+    other = deepcopy(edges[0])
+    other["node"]["account"]["id"] = ACCOUNT_OTHER
+    other["node"]["account"]["accountNo"] = str(ACCOUNT_OTHER)
+    edges.append(other)
+
+    await cached_client.authenticate(USERNAME, PASSWORD)
+
+    mock_aioresponse.clear()
+    mock_aioresponse.post(BOOTSTRAP_GRAPHQL_URL, payload=bootstrap)
+    for account in (ACCOUNT, ACCOUNT_OTHER):
+        mock_aioresponse.get(
+            f"{USAGE_DAILY_URL}/{account}?date=2024-01",
+            payload=RESPONSE_JSON_DAILY_USAGE,
+        )
+        mock_aioresponse.get(
+            f"{CARBON_FOOTPRINT_URL}/{account}/footprint",
+            payload=RESPONSE_JSON_FOOTPRINT,
+        )
+    await cached_client.bootstrap_accounts()
+
+    daily_usage = await cached_client.get_daily_usage_all_accounts("2024-01")
+    footprints = await cached_client.get_footprint_all_accounts()
+
+    assert list(daily_usage) == [ACCOUNT, ACCOUNT_OTHER]
+    assert daily_usage[ACCOUNT] == daily_usage[ACCOUNT_OTHER]
+    assert list(footprints) == [ACCOUNT, ACCOUNT_OTHER]
+    # Footprints are cached per account
+    assert (
+        await cached_client.get_footprint(account_id=ACCOUNT_OTHER)
+        is (footprints[ACCOUNT_OTHER])
+    )
+
+
 # pylint: disable=protected-access
 @pytest.mark.asyncio
 async def test_no_cookies(
@@ -331,3 +440,236 @@ async def test_auth_token_not_found(
 
     with pytest.raises(OVOEnergyAPINotFound):
         await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+
+# pylint: disable=protected-access
+@pytest.mark.asyncio
+async def test_oauth_expired_single_refresh(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test concurrent requests share a single token refresh."""
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    await ovoenergy_client.bootstrap_accounts()
+
+    assert ovoenergy_client._oauth is not None
+
+    ovoenergy_client._oauth.expires_at = datetime.now() - timedelta(hours=1)
+
+    await asyncio.gather(
+        *(ovoenergy_client.get_daily_usage("2024-01") for _ in range(10))
+    )
+
+    assert not ovoenergy_client.oauth_expired
+    # One request from authenticate, one from the shared refresh
+    assert len(mock_aioresponse.requests[("GET", URL(AUTH_TOKEN_URL))]) == 2
+
+
+# pylint: disable=protected-access
+@pytest.mark.asyncio
+async def test_oauth_expiring_refreshes_in_background(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test a token about to expire is refreshed without blocking the request."""
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    await ovoenergy_client.bootstrap_accounts()
+
+    assert ovoenergy_client._oauth is not None
+
+    expires_at = datetime.now() + timedelta(minutes=1)
+    ovoenergy_client._oauth.expires_at = expires_at
+
+    assert not ovoenergy_client.oauth_expired
+    assert ovoenergy_client.oauth_expiring
+
+    await ovoenergy_client.get_daily_usage("2024-01")
+
+    assert ovoenergy_client._token_refresh_task is not None
+    await ovoenergy_client._token_refresh_task
+
+    assert not ovoenergy_client.oauth_expiring
+    assert ovoenergy_client._oauth.expires_at > expires_at
+
+
+@pytest.mark.asyncio
+async def test_get_daily_usage_range(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test get daily usage range only returns the days asked for."""
+
+    def _month(month: int, days: list[int]) -> dict:
+        """Return a daily usage payload with a row for each day of a month."""
+        row = RESPONSE_JSON_DAILY_USAGE["electricity"]["data"][0]
+        return {
+            fuel: {
+                "data": [
+                    {
+                        **row,
+                        "interval": {
+                            "start": f"2024-{month:02d}-{day:02d}T00:00:00Z",
+                            "end": f"2024-{month:02d}-{day:02d}T23:59:59.999000Z",
+                        },
+                    }
+                    for day in days
+                ]
+            }
+            for fuel in ("electricity", "gas")
+        }
+
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    mock_aioresponse.clear()
+    mock_aioresponse.get(
+        f"{USAGE_DAILY_URL}/{ACCOUNT}?date=2024-01", payload=_month(1, [1, 14, 15, 31])
+    )
+    mock_aioresponse.get(
+        f"{USAGE_DAILY_URL}/{ACCOUNT}?date=2024-02", payload=_month(2, [1, 3, 4, 29])
+    )
+
+    ovo_usage = await ovoenergy_client.get_daily_usage_range(
+        date(2024, 1, 15),
+        date(2024, 2, 3),
+    )
+
+    expected = [
+        date(2024, 1, 15),
+        date(2024, 1, 31),
+        date(2024, 2, 1),
+        date(2024, 2, 3),
+    ]
+    assert ovo_usage.electricity is not None
+    assert ovo_usage.gas is not None
+    assert [row.interval.start.date() for row in ovo_usage.electricity] == expected
+    assert [row.interval.start.date() for row in ovo_usage.gas] == expected
+
+    with pytest.raises(ValueError):
+        await ovoenergy_client.get_daily_usage_range(
+            date(2024, 2, 1),
+            date(2024, 1, 1),
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_half_hourly_usage_range(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test get half hourly usage range."""
+    mock_aioresponse.get(
+        f"{USAGE_HALF_HOURLY_URL}/{ACCOUNT}?date=2024-01-02",
+        payload={
+            "electricity": {
+                "data": [
+                    {
+                        "consumption": 0.75,
+                        "interval": {
+                            "start": "2024-01-02T00:00:00Z",
+                            "end": "2024-01-02T00:30:00Z",
+                        },
+                        "unit": "kWh",
+                    }
+                ],
+            },
+            "gas": None,
+        },
+        status=200,
+        repeat=True,
+    )
+
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    await ovoenergy_client.bootstrap_accounts()
+
+    ovo_usage = await ovoenergy_client.get_half_hourly_usage_range(
+        date(2024, 1, 1),
+        date(2024, 1, 2),
+        concurrency=1,
+    )
+
+    assert ovo_usage.electricity is not None
+    assert [usage.consumption for usage in ovo_usage.electricity] == [0.5, 0.75]
+    assert ovo_usage.gas is not None
+    assert [usage.consumption for usage in ovo_usage.gas] == [0.2]
+
+    with pytest.raises(ValueError):
+        await ovoenergy_client.get_half_hourly_usage_range(
+            date(2024, 1, 1),
+            date(2024, 1, 2),
+            concurrency=0,
+        )
+
+
+@pytest.mark.asyncio
+async def test_iter_half_hourly_usage(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test iterating half hourly usage yields each day in order."""
+    mock_aioresponse.get(
+        f"{USAGE_HALF_HOURLY_URL}/{ACCOUNT}?date=2024-01-02",
+        payload={"electricity": None, "gas": None},
+        status=200,
+        repeat=True,
+    )
+
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    await ovoenergy_client.bootstrap_accounts()
+
+    days = [
+        (day, usage.electricity)
+        async for day, usage in ovoenergy_client.iter_half_hourly_usage(
+            date(2024, 1, 1),
+            date(2024, 1, 2),
+            concurrency=2,
+        )
+    ]
+
+    assert [day for day, _ in days] == [date(2024, 1, 1), date(2024, 1, 2)]
+    assert days[0][1] is not None
+    assert days[1][1] is None
+
+
+# pylint: disable=protected-access
+@pytest.mark.asyncio
+@pytest.mark.timeout(120)
+async def test_request_releases_connections(
+    aiohttp_server,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test requests release their connections back to the pool."""
+    mock_aioresponse.passthrough_unmatched = True
+
+    async def _handler(_: web.Request) -> web.Response:
+        return web.json_response(RESPONSE_JSON_DAILY_USAGE)
+
+    app = web.Application()
+    app.router.add_get("/usage", _handler)
+    server = await aiohttp_server(app)
+    url = str(server.make_url("/usage"))
+
+    connector = TCPConnector(limit=10)
+    async with ClientSession(connector=connector) as session:
+        client = OVOEnergy(client_session=session)
+
+        for _ in range(100):
+            responses = await asyncio.gather(
+                *(
+                    client._request(
+                        url,
+                        "GET",
+                        with_cookies=False,
+                        with_authorization=False,
+                    )
+                    for _ in range(100)
+                )
+            )
+            assert all(response.body for response in responses)
+
+        assert not connector._acquired
+        # Every connection is back in the pool and reused, not leaked
+        assert sum(len(conns) for conns in connector._conns.values()) <= 10
@@ -0,0 +1,107 @@
+"""Tests for the command line interface."""
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from ovoenergy.__main__ import app
+
+from . import PASSWORD, USERNAME
+
+runner = CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def credentials(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Set the login credentials."""
+    monkeypatch.setenv("OVO_USERNAME", USERNAME)
+    monkeypatch.setenv("OVO_PASSWORD", PASSWORD)
+    monkeypatch.delenv("OVO_CREDENTIAL_CACHE", raising=False)
+
+
+def test_export_ndjson() -> None:
+    """Test exporting half hourly usage as NDJSON to stdout."""
+    result = runner.invoke(
+        app,
+        ["export", "--start", "2024-01-01", "--end", "2024-01-01"],
+    )
+
+    assert result.exit_code == 0, result.output
+    rows = [json.loads(line) for line in result.stdout.splitlines()]
+    assert rows == [
+        {
+            "fuel": "electricity",
+            "start": "2024-01-01T00:00:00+00:00",
+            "end": "2024-01-01T00:30:00+00:00",
+            "consumption": 0.5,
+            "unit": "kWh",
+        }
+    ]
+
+
+def test_export_csv_file(tmp_path: Path) -> None:
+    """Test exporting daily gas usage as CSV to a file."""
+    output = tmp_path / "gas.csv"
+
+    result = runner.invoke(
+        app,
+        [
+            "export",
+            "--start",
+            "2024-01-01",
+            "--end",
+            "2024-01-31",
+            "--interval",
+            "daily",
+            "--fuel",
+            "gas",
+            "--format",
+            "csv",
+            "--output",
+            str(output),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("fuel,start,end,consumption,volume")
+    assert len(lines) > 1
+    assert all(line.startswith("gas,") for line in lines[1:])
+
+
+def test_export_invalid_range() -> None:
+    """Test the end date must not be before the start date."""
+    result = runner.invoke(
+        app,
+        ["export", "--start", "2024-01-02", "--end", "2024-01-01"],
+    )
+
+    assert result.exit_code != 0
+
+
+def test_batch(tmp_path: Path) -> None:
+    """Test a batch file runs every operation and reports failures."""
+    operations = tmp_path / "operations.txt"
+    operations.write_text(
+        "daily --date 2024-01\ncarbon-intensity\nbogus\n", encoding="utf-8"
+    )
+
+    result = runner.invoke(app, ["batch", "--input", str(operations)])
+
+    assert result.exit_code == 1
+    results = {
+        output["line"]: output for output in map(json.loads, result.stdout.splitlines())
+    }
+    assert "result" in results[1]
+    assert "result" in results[2]
+    assert results[3]["error"] == "Unknown command: bogus"
+
+
+def test_batch_stdin() -> None:
+    """Test operations are read from stdin by default."""
+    result = runner.invoke(app, ["batch"], input="halfhourly --date 2024-01-01\n")
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.stdout)["result"]["electricity"] is not None
@@ -0,0 +1,137 @@
+"""Tests for the aggregation module."""
+
+from datetime import UTC, date, datetime, timedelta
+import math
+
+import pytest
+
+from ovoenergy.aggregation import OVOUsageAggregator, aggregate
+from ovoenergy.models.columnar import OVOHalfHourSeries
+
+
+def _series(start: datetime, end: datetime, value: float = 1.0) -> OVOHalfHourSeries:
+    """Return a series with one value per slot from start up to end."""
+    series = OVOHalfHourSeries()
+    while start < end:
+        series.append(start, value, "kWh")
+        start += timedelta(minutes=30)
+    return series
+
+
+@pytest.mark.usefixtures("with_numpy")
+def test_aggregate() -> None:
+    """Test rollups of a winter day."""
+    series = _series(
+        datetime(2024, 1, 15, tzinfo=UTC), datetime(2024, 1, 16, tzinfo=UTC)
+    )
+
+    hours = aggregate(series, "hour")
+    assert len(hours.totals) == 24
+    assert set(hours.totals.values()) == {2.0}
+    assert next(iter(hours.totals)) == datetime(2024, 1, 15, tzinfo=UTC)
+    assert hours.unit == "kWh"
+
+    assert aggregate(series, "day").totals == {date(2024, 1, 15): 48.0}
+    assert aggregate(series, "week").totals == {date(2024, 1, 15): 48.0}
+    assert aggregate(series, "month").totals == {date(2024, 1, 1): 48.0}
+    assert aggregate(series, "month").counts == {date(2024, 1, 1): 48}
+
+
+@pytest.mark.usefixtures("with_numpy")
+def test_aggregate_dst() -> None:
+    """Test local days are 23 and 25 hours long across DST changes."""
+    spring = aggregate(
+        _series(datetime(2024, 3, 30, tzinfo=UTC), datetime(2024, 4, 2, tzinfo=UTC)),
+        "day",
+    )
+    assert spring.totals[date(2024, 3, 30)] == 48.0
+    assert spring.totals[date(2024, 3, 31)] == 46.0
+    assert spring.totals[date(2024, 4, 1)] == 48.0
+
+    autumn = _series(
+        datetime(2024, 10, 26, 23, tzinfo=UTC), datetime(2024, 10, 28, tzinfo=UTC)
+    )
+    assert aggregate(autumn, "day").totals[date(2024, 10, 27)] == 50.0
+
+    hours = aggregate(autumn, "hour").totals
+    repeated = [hour for hour in hours if hour.date() == date(2024, 10, 27)]
+    assert len(repeated) == 25
+    assert [hour.hour for hour in repeated].count(1) == 2
+
+
+@pytest.mark.usefixtures("with_numpy")
+def test_aggregator_incremental() -> None:
+    """Test adding days and revising slots only applies the difference."""
+    aggregator = OVOUsageAggregator()
+    aggregator.add(
+        _series(datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 2, tzinfo=UTC))
+    )
+    aggregator.add(
+        _series(datetime(2024, 1, 2, tzinfo=UTC), datetime(2024, 1, 3, tzinfo=UTC))
+    )
+    assert aggregator.total("month", date(2024, 1, 1)) == 96.0
+    assert len(aggregator) == 96
+
+    revised = OVOHalfHourSeries()
+    revised.append(datetime(2024, 1, 1, tzinfo=UTC), 3.0, "kWh")
+    revised.append(datetime(2024, 1, 2, tzinfo=UTC), None, "kWh")
+    aggregator.add(revised)
+
+    assert aggregator.total("day", date(2024, 1, 1)) == 50.0
+    assert aggregator.total("day", date(2024, 1, 2)) == 47.0
+    assert aggregator.total("month", date(2024, 1, 1)) == 97.0
+    assert aggregator.rollup("day").counts == {
+        date(2024, 1, 1): 48,
+        date(2024, 1, 2): 47,
+    }
+    assert aggregator.total("hour", datetime(2024, 1, 1, tzinfo=UTC)) == 4.0
+
+    # Re-adding the same data changes nothing
+    aggregator.add(revised)
+    assert aggregator.total("month", date(2024, 1, 1)) == 97.0
+    assert math.isclose(aggregator.total("week", date(2024, 1, 1)), 97.0)
+
+
+@pytest.mark.usefixtures("with_numpy")
+def test_aggregator_history() -> None:
+    """Test slots before the history window are forgotten and closed."""
+    aggregator = OVOUsageAggregator("UTC", history=timedelta(days=1))
+    for day in (1, 2, 3):
+        aggregator.add(
+            _series(
+                datetime(2024, 1, day, tzinfo=UTC),
+                datetime(2024, 1, day + 1, tzinfo=UTC),
+            )
+        )
+
+    # Only the newest day and the one before it are remembered
+    assert len(aggregator) == 96
+    assert aggregator.total("month", date(2024, 1, 1)) == 144.0
+
+    revised = OVOHalfHourSeries()
+    revised.append(datetime(2024, 1, 1, tzinfo=UTC), 5.0, "kWh")
+    revised.append(datetime(2024, 1, 2, tzinfo=UTC), 5.0, "kWh")
+    # Given out of order, and twice, the last row for a slot wins
+    revised.append(datetime(2024, 1, 3, 1, tzinfo=UTC), 9.0, "kWh")
+    revised.append(datetime(2024, 1, 3, tzinfo=UTC), 2.0, "kWh")
+    revised.append(datetime(2024, 1, 3, 1, tzinfo=UTC), 3.0, "kWh")
+    aggregator.add(revised)
+
+    # The closed day ignores its revision, the open days take theirs
+    assert aggregator.total("day", date(2024, 1, 1)) == 48.0
+    assert aggregator.total("day", date(2024, 1, 2)) == 52.0
+    assert aggregator.total("day", date(2024, 1, 3)) == 51.0
+    assert len(aggregator) == 96
+
+
+def test_aggregator_unit_mismatch() -> None:
+    """Test series with a different unit are rejected."""
+    aggregator = OVOUsageAggregator()
+    aggregator.add(
+        _series(datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 1, 1, tzinfo=UTC))
+    )
+
+    gas = OVOHalfHourSeries()
+    gas.append(datetime(2024, 1, 1, tzinfo=UTC), 1.0, "m³")
+    with pytest.raises(ValueError):
+        aggregator.add(gas)
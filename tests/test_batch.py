@@ -0,0 +1,89 @@
+"""Tests for the batch module."""
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from ovoenergy import OVOEnergy
+from ovoenergy.batch import parse_batch, parse_batch_line, run_batch
+from ovoenergy.const import AUTH_LOGIN_URL, BOOTSTRAP_GRAPHQL_URL
+
+from . import PASSWORD, USERNAME
+
+
+def test_parse_batch_line() -> None:
+    """Test parsing batch lines."""
+    assert parse_batch_line(1, "  # comment") is None
+    assert parse_batch_line(1, "") is None
+
+    operation = parse_batch_line(2, "daily --date 2024-01")
+    assert operation is not None
+    assert (operation.line, operation.command, operation.date) == (
+        2,
+        "daily",
+        "2024-01",
+    )
+    assert operation.error is None
+
+    operation = parse_batch_line(3, "halfhourly --date=2024-01-01")
+    assert operation is not None
+    assert operation.date == "2024-01-01"
+
+    operation = parse_batch_line(4, "monthly")
+    assert operation is not None
+    assert operation.error == "Unknown command: monthly"
+
+    operation = parse_batch_line(5, "daily --fuel gas")
+    assert operation is not None
+    assert operation.error == "Unexpected argument: --fuel"
+
+    operation = parse_batch_line(6, 'daily --date "2024-01')
+    assert operation is not None
+    assert operation.error is not None
+
+
+@pytest.mark.asyncio
+async def test_run_batch(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test a batch runs every operation on one authenticated client."""
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+    await ovoenergy_client.bootstrap_accounts()
+
+    operations = parse_batch(
+        [
+            "daily --date 2024-01\n",
+            "halfhourly --date 2024-01-01\n",
+            "# footprint next\n",
+            "carbon-footprint\n",
+            "carbon-intensity\n",
+            "bogus\n",
+        ]
+    )
+
+    results = {
+        result["line"]: result
+        async for result in run_batch(ovoenergy_client, operations, concurrency=2)
+    }
+
+    assert sorted(results) == [1, 2, 4, 5, 6]
+    assert results[1]["result"]["electricity"] is not None
+    assert results[2]["result"]["electricity"] is not None
+    assert "result" in results[4]
+    assert "result" in results[5]
+    assert results[6]["error"] == "Unknown command: bogus"
+
+    assert len(mock_aioresponse.requests[("POST", URL(AUTH_LOGIN_URL))]) == 1
+    assert len(mock_aioresponse.requests[("POST", URL(BOOTSTRAP_GRAPHQL_URL))]) == 1
+
+
+@pytest.mark.asyncio
+async def test_run_batch_invalid_concurrency() -> None:
+    """Test a batch needs a concurrency of at least one."""
+    async with ClientSession() as session:
+        client = OVOEnergy(client_session=session)
+        with pytest.raises(ValueError):
+            async for _ in run_batch(client, [], concurrency=0):
+                pass
@@ -0,0 +1,287 @@
+"""Tests for the cache module."""
+
+from datetime import timedelta
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+import ovoenergy
+from ovoenergy import OVOEnergy
+from ovoenergy.cache import OVOMemoryCache
+from ovoenergy.const import (
+    BOOTSTRAP_GRAPHQL_URL,
+    CARBON_FOOTPRINT_URL,
+    CARBON_INTENSITY_URL,
+    PLANS_URL,
+    USAGE_DAILY_URL,
+)
+from ovoenergy.decoders import parse_carbon_intensity
+
+from . import (
+    ACCOUNT,
+    PASSWORD,
+    RESPONSE_JSON_DAILY_USAGE,
+    RESPONSE_JSON_FOOTPRINT,
+    RESPONSE_JSON_INTENSITY,
+    USERNAME,
+)
+
+
+def _sent_headers(mock_aioresponse: aioresponses, url: URL) -> list[dict | None]:
+    """Return the extra headers sent with each GET of a URL."""
+    return [
+        call.kwargs.get("headers") for call in mock_aioresponse.requests[("GET", url)]
+    ]
+
+
+def test_memory_cache() -> None:
+    """Test the memory cache expires and evicts entries."""
+    cache = OVOMemoryCache(max_size=2)
+
+    cache.set("a", 1, timedelta(minutes=1))
+    cache.set("b", 2, timedelta(minutes=1))
+    assert cache.get("a") == 1
+
+    # "b" is now the least recently used entry
+    cache.set("c", 3, timedelta(minutes=1))
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    cache.set("a", 1, timedelta(0))
+    assert cache.get("a") is None
+
+    cache.delete("c")
+    assert cache.get("c") is None
+
+    cache.set("d", 4, timedelta(minutes=1))
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_client_cache(
+    cached_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test responses are cached until invalidated."""
+    bootstrap_url = URL(BOOTSTRAP_GRAPHQL_URL)
+    footprint_url = URL(f"{CARBON_FOOTPRINT_URL}/{ACCOUNT}/footprint")
+
+    await cached_client.authenticate(USERNAME, PASSWORD)
+
+    first = await cached_client.bootstrap_accounts()
+    assert await cached_client.bootstrap_accounts() is first
+    assert len(mock_aioresponse.requests[("POST", bootstrap_url)]) == 1
+
+    cached_client.invalidate_cache("bootstrap_accounts")
+
+    assert await cached_client.bootstrap_accounts() == first
+    assert len(mock_aioresponse.requests[("POST", bootstrap_url)]) == 2
+
+    await cached_client.get_footprint()
+    await cached_client.get_footprint()
+    assert len(mock_aioresponse.requests[("GET", footprint_url)]) == 1
+
+    cached_client.invalidate_cache()
+    await cached_client.get_footprint()
+    assert len(mock_aioresponse.requests[("GET", footprint_url)]) == 2
+    await cached_client.bootstrap_accounts()
+
+    assert len(mock_aioresponse.requests[("POST", bootstrap_url)]) == 3
+
+
+@pytest.mark.asyncio
+async def test_client_cache_opt_in(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test responses are not cached unless a cache is given."""
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    await ovoenergy_client.get_plans()
+    await ovoenergy_client.get_plans()
+
+    assert len(mock_aioresponse.requests[("GET", URL(f"{PLANS_URL}/{ACCOUNT}"))]) == 2
+
+
+@pytest.mark.asyncio
+async def test_client_cache_shared(
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test a cache backend can be shared between clients."""
+    cache = OVOMemoryCache()
+
+    async with ClientSession() as session:
+        clients = [
+            OVOEnergy(client_session=session, cache=cache),
+            OVOEnergy(client_session=session, cache=cache),
+        ]
+        for client in clients:
+            await client.authenticate(USERNAME, PASSWORD)
+            await client.get_carbon_intensity()
+
+        uncached = OVOEnergy(
+            client_session=session,
+            cache=cache,
+            cache_ttls={"carbon_intensity": timedelta(0)},
+        )
+        await uncached.authenticate(USERNAME, PASSWORD)
+        uncached.invalidate_cache("carbon_intensity")
+        await uncached.get_carbon_intensity()
+        await uncached.get_carbon_intensity()
+
+    assert len(mock_aioresponse.requests[("GET", URL(CARBON_INTENSITY_URL))]) == 3
+
+
+@pytest.mark.asyncio
+async def test_conditional_etag(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test an ETag is sent back and a 304 reuses the parsed model."""
+    daily_url = URL(f"{USAGE_DAILY_URL}/{ACCOUNT}?date=2024-01")
+
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    mock_aioresponse.clear()
+    mock_aioresponse.get(
+        str(daily_url), payload=RESPONSE_JSON_DAILY_USAGE, headers={"ETag": '"v1"'}
+    )
+    mock_aioresponse.get(str(daily_url), status=304)
+
+    first = await ovoenergy_client.get_daily_usage("2024-01")
+    assert await ovoenergy_client.get_daily_usage("2024-01") is first
+
+    first_headers, second_headers = _sent_headers(mock_aioresponse, daily_url)
+    assert "If-None-Match" not in first_headers
+    assert second_headers["If-None-Match"] == '"v1"'
+    assert second_headers["Authorization"].startswith("Bearer ")
+
+
+@pytest.mark.asyncio
+async def test_conditional_last_modified(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test Last-Modified is sent back as If-Modified-Since."""
+    footprint_url = URL(f"{CARBON_FOOTPRINT_URL}/{ACCOUNT}/footprint")
+    last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    mock_aioresponse.clear()
+    mock_aioresponse.get(
+        str(footprint_url),
+        payload=RESPONSE_JSON_FOOTPRINT,
+        headers={"Last-Modified": last_modified},
+    )
+    mock_aioresponse.get(str(footprint_url), status=304)
+
+    first = await ovoenergy_client.get_footprint()
+    ovoenergy_client.invalidate_cache("footprint")
+
+    assert await ovoenergy_client.get_footprint() == first
+    _, headers = _sent_headers(mock_aioresponse, footprint_url)
+    assert headers["If-Modified-Since"] == last_modified
+    assert "If-None-Match" not in headers
+
+
+@pytest.mark.asyncio
+async def test_conditional_content_hash(
+    mock_aioresponse: aioresponses,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test unchanged bodies without validators are not parsed again."""
+    parsed = []
+    monkeypatch.setattr(
+        ovoenergy,
+        "parse_carbon_intensity",
+        lambda json: parsed.append(json) or parse_carbon_intensity(json),
+    )
+    intensity_url = URL(CARBON_INTENSITY_URL)
+    changed = {**RESPONSE_JSON_INTENSITY, "current": "high"}
+
+    async with ClientSession() as session:
+        client = OVOEnergy(
+            client_session=session,
+            cache_ttls={"carbon_intensity": timedelta(0)},
+        )
+        await client.authenticate(USERNAME, PASSWORD)
+
+        mock_aioresponse.clear()
+        mock_aioresponse.get(str(intensity_url), payload=RESPONSE_JSON_INTENSITY)
+        mock_aioresponse.get(str(intensity_url), payload=RESPONSE_JSON_INTENSITY)
+        mock_aioresponse.get(str(intensity_url), payload=changed)
+
+        first = await client.get_carbon_intensity()
+        assert await client.get_carbon_intensity() == first
+        third = await client.get_carbon_intensity()
+
+    assert len(parsed) == 2
+    assert third.current == "high"
+    # Without validators there is nothing to send back
+    assert _sent_headers(mock_aioresponse, intensity_url)[1].keys() == {"Authorization"}
+
+
+@pytest.mark.asyncio
+async def test_conditional_disabled(
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test conditional requests can be turned off with their cache size."""
+    daily_url = URL(f"{USAGE_DAILY_URL}/{ACCOUNT}?date=2024-01")
+
+    async with ClientSession() as session:
+        client = OVOEnergy(
+            client_session=session,
+            conditional_cache_size=0,
+        )
+        await client.authenticate(USERNAME, PASSWORD)
+
+        mock_aioresponse.clear()
+        mock_aioresponse.get(
+            str(daily_url),
+            payload=RESPONSE_JSON_DAILY_USAGE,
+            headers={"ETag": '"v1"'},
+            repeat=True,
+        )
+
+        first = await client.get_daily_usage("2024-01")
+        second = await client.get_daily_usage("2024-01")
+
+    assert second == first
+    assert second is not first
+    assert all(
+        "If-None-Match" not in headers
+        for headers in _sent_headers(mock_aioresponse, daily_url)
+    )
+
+
+@pytest.mark.asyncio
+async def test_conditional_invalidate(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test invalidating every endpoint forgets conditional validators."""
+    daily_url = URL(f"{USAGE_DAILY_URL}/{ACCOUNT}?date=2024-01")
+
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    mock_aioresponse.clear()
+    mock_aioresponse.get(
+        str(daily_url),
+        payload=RESPONSE_JSON_DAILY_USAGE,
+        headers={"ETag": '"v1"'},
+        repeat=True,
+    )
+
+    await ovoenergy_client.get_daily_usage("2024-01")
+    ovoenergy_client.invalidate_cache()
+    await ovoenergy_client.get_daily_usage("2024-01")
+
+    assert all(
+        "If-None-Match" not in headers
+        for headers in _sent_headers(mock_aioresponse, daily_url)
+    )
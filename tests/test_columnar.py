@@ -0,0 +1,98 @@
+"""Tests for the columnar models."""
+
+from datetime import UTC, date, datetime
+import math
+
+from aioresponses import aioresponses
+import pytest
+
+from ovoenergy import OVOEnergy
+from ovoenergy.models import OVOHalfHour, OVOInterval
+from ovoenergy.models.columnar import OVOHalfHourSeries
+
+from . import PASSWORD, USERNAME
+
+
+@pytest.mark.asyncio
+async def test_get_half_hourly_series(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test half hourly series convert back to the existing models."""
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    await ovoenergy_client.bootstrap_accounts()
+
+    ovo_usage = await ovoenergy_client.get_half_hourly_usage("2024-01-01")
+    ovo_series = await ovoenergy_client.get_half_hourly_series("2024-01-01")
+
+    assert ovo_series.electricity is not None
+    assert ovo_series.electricity.unit == "kWh"
+    assert ovo_series.electricity.starts.tolist() == [1704067200]
+    assert ovo_series.electricity.consumption.tolist() == [0.5]
+    assert ovo_series.to_half_hour_usage() == ovo_usage
+
+    ovo_series_range = await ovoenergy_client.get_half_hourly_series_range(
+        date(2024, 1, 1),
+        date(2024, 1, 1),
+    )
+
+    assert ovo_series_range == ovo_series
+
+
+def test_half_hour_series() -> None:
+    """Test half hour series access."""
+    series = OVOHalfHourSeries()
+    series.append(1704067200, 0.5, "kWh")
+    series.append(1704069000, None, "kWh")
+
+    other = OVOHalfHourSeries()
+    other.append(1704070800, 1.5)
+    series.extend(other)
+
+    assert len(series) == 3
+    assert series[-1].consumption == 1.5
+    assert [half_hour.interval.start.hour for half_hour in series[1:]] == [0, 1]
+    assert OVOHalfHourSeries.from_half_hours(series).starts == series.starts
+
+    with pytest.raises(IndexError):
+        series[3]  # pylint: disable=pointless-statement
+
+    with pytest.raises(ValueError):
+        series.append(1704072600, 0.1, "m³")
+
+
+def test_half_hour_series_missing_consumption() -> None:
+    """Test missing consumption is stored as NaN and read back as None."""
+    half_hours = [
+        OVOHalfHour(
+            consumption=None,
+            interval=OVOInterval(
+                start=datetime(2024, 1, 1, tzinfo=UTC),
+                end=datetime(2024, 1, 1, 0, 30, tzinfo=UTC),
+            ),
+            unit="kWh",
+        )
+    ]
+
+    series = OVOHalfHourSeries.from_half_hours(half_hours)
+
+    assert math.isnan(series.consumption[0])
+    assert series.to_half_hours() == half_hours
+
+
+def test_half_hour_series_numpy() -> None:
+    """Test half hour series NumPy views share memory with the buffers."""
+    np = pytest.importorskip("numpy")
+
+    series = OVOHalfHourSeries()
+    series.append(1704067200, 0.5, "kWh")
+
+    starts, consumption = series.as_numpy()
+
+    assert starts.dtype == np.int64
+    assert consumption.dtype == np.float64
+
+    series.consumption[0] = 0.75
+
+    assert consumption[0] == 0.75
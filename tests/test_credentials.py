@@ -0,0 +1,118 @@
+"""Tests for the credentials module."""
+
+from datetime import datetime, timedelta
+from http.cookies import SimpleCookie
+from pathlib import Path
+import stat
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from ovoenergy import OVOEnergy
+from ovoenergy.const import AUTH_LOGIN_URL, AUTH_TOKEN_URL
+from ovoenergy.credentials import OVOCredentialCache, generate_credential_key
+from ovoenergy.models.credentials import OVOCredentials
+from ovoenergy.models.oauth import OAuth
+
+from . import ACCOUNT, PASSWORD, USERNAME
+
+
+def _credentials() -> OVOCredentials:
+    """Return credentials."""
+    cookies: SimpleCookie = SimpleCookie()
+    cookies["session"] = "abc"
+    cookies["session"]["path"] = "/"
+    return OVOCredentials(
+        username=USERNAME,
+        cookies=cookies,
+        oauth=OAuth(
+            access_token="token",
+            expires_in=60,
+            refresh_expires_in=0,
+            expires_at=datetime(2024, 1, 1, 12, 0),
+        ),
+        customer_id=None,
+        account_ids=[ACCOUNT],
+    )
+
+
+def test_credential_cache(tmp_path: Path) -> None:
+    """Test credentials round trip through an owner only file."""
+    cache = OVOCredentialCache(tmp_path / "credentials.json")
+    assert cache.load(USERNAME) is None
+
+    cache.save(_credentials())
+
+    assert stat.S_IMODE(cache.path.stat().st_mode) == 0o600
+    credentials = cache.load(USERNAME)
+    assert credentials is not None
+    assert credentials.oauth == _credentials().oauth
+    assert credentials.cookies["session"].value == "abc"
+    assert credentials.cookies["session"]["path"] == "/"
+    assert credentials.account_ids == [ACCOUNT]
+    assert cache.load("someone-else") is None
+
+    cache.clear()
+    assert cache.load(USERNAME) is None
+
+
+def test_credential_cache_encrypted(tmp_path: Path) -> None:
+    """Test credentials are encrypted at rest with a key."""
+    pytest.importorskip("cryptography")
+    path = tmp_path / "credentials"
+    cache = OVOCredentialCache(path, key=generate_credential_key())
+
+    cache.save(_credentials())
+
+    assert b"token" not in path.read_bytes()
+    assert cache.load(USERNAME) is not None
+    assert (
+        OVOCredentialCache(path, key=generate_credential_key()).load(USERNAME) is None
+    )
+    assert OVOCredentialCache(path).load(USERNAME) is None
+
+
+@pytest.mark.asyncio
+async def test_authenticate_restores_cached_credentials(
+    tmp_path: Path,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test a second client restores the session without logging in."""
+    cache = OVOCredentialCache(tmp_path / "credentials.json")
+
+    async with ClientSession() as session:
+        assert await OVOEnergy(session, credential_cache=cache).authenticate(
+            USERNAME, PASSWORD
+        )
+
+        client = OVOEnergy(session, credential_cache=cache)
+        assert await client.authenticate(USERNAME, PASSWORD)
+        assert client.account_id == ACCOUNT
+        assert client.username == USERNAME
+
+    assert len(mock_aioresponse.requests[("POST", URL(AUTH_LOGIN_URL))]) == 1
+    assert len(mock_aioresponse.requests[("GET", URL(AUTH_TOKEN_URL))]) == 1
+
+
+@pytest.mark.asyncio
+async def test_authenticate_refreshes_expired_cached_token(
+    tmp_path: Path,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test an expired cached token is renewed with the cached cookies."""
+    cache = OVOCredentialCache(tmp_path / "credentials.json")
+    credentials = _credentials()
+    credentials.oauth.expires_at = datetime.now() - timedelta(minutes=1)
+    cache.save(credentials)
+
+    async with ClientSession() as session:
+        client = OVOEnergy(session, credential_cache=cache)
+        assert await client.authenticate(USERNAME, PASSWORD)
+
+    assert not mock_aioresponse.requests.get(("POST", URL(AUTH_LOGIN_URL)))
+    assert len(mock_aioresponse.requests[("GET", URL(AUTH_TOKEN_URL))]) == 1
+    cached = cache.load(USERNAME)
+    assert cached is not None
+    assert cached.oauth.expires_at > datetime.now()
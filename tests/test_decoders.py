@@ -0,0 +1,131 @@
+"""Tests for the decoders module."""
+
+from datetime import UTC, datetime
+import json
+
+import pytest
+
+from ovoenergy import decoders
+from ovoenergy.decoders import (
+    DecoderName,
+    OVODecoder,
+    get_decoder,
+    parse_daily_usage,
+    parse_half_hourly_usage,
+)
+from ovoenergy.models import OVODailyUsage
+
+from . import RESPONSE_JSON_DAILY_USAGE, RESPONSE_JSON_HALF_HOURLY_USAGE
+
+DECODERS: list[DecoderName] = ["json", "msgspec", "orjson"]
+
+
+def _decoder(name: DecoderName) -> OVODecoder:
+    """Return a decoder, skipping if its library is not installed."""
+    if name != "json":
+        pytest.importorskip(name)
+    return get_decoder(name)
+
+
+@pytest.mark.parametrize("name", DECODERS)
+def test_decoders_match(name: DecoderName) -> None:
+    """Test every decoder produces the same models."""
+    decoder = _decoder(name)
+
+    daily_body = json.dumps(RESPONSE_JSON_DAILY_USAGE).encode()
+    half_hourly_body = json.dumps(RESPONSE_JSON_HALF_HOURLY_USAGE).encode()
+
+    assert decoder.loads(daily_body) == RESPONSE_JSON_DAILY_USAGE
+    assert decoder.decode_daily_usage(daily_body) == parse_daily_usage(
+        RESPONSE_JSON_DAILY_USAGE
+    )
+    assert decoder.decode_half_hourly_usage(
+        half_hourly_body
+    ) == parse_half_hourly_usage(RESPONSE_JSON_HALF_HOURLY_USAGE)
+
+
+@pytest.mark.parametrize("name", DECODERS)
+def test_decoders_half_hourly_missing_data(name: DecoderName) -> None:
+    """Test every decoder handles missing fuels and null rows."""
+    decoder = _decoder(name)
+
+    ovo_usage = decoder.decode_half_hourly_usage(
+        json.dumps(
+            {
+                "electricity": {
+                    "data": [
+                        None,
+                        {
+                            "consumption": None,
+                            "interval": {
+                                "start": "2024-01-01T00:00:00Z",
+                                "end": "2024-01-01T00:30:00Z",
+                            },
+                            "unit": "kWh",
+                        },
+                    ]
+                },
+                "gas": None,
+            }
+        ).encode()
+    )
+
+    assert ovo_usage.electricity is not None
+    assert [usage.consumption for usage in ovo_usage.electricity] == [None]
+    assert ovo_usage.gas is None
+
+
+@pytest.mark.parametrize("name", DECODERS)
+def test_decoders_half_hourly_interval_end(name: DecoderName) -> None:
+    """Test every decoder infers the half hour end from the start."""
+    decoder = _decoder(name)
+    payload = {
+        "electricity": {
+            "data": [
+                {
+                    "consumption": 0.5,
+                    "interval": {
+                        "start": "2024-01-01T00:00:00Z",
+                        "end": "2024-01-01T00:29:59.999Z",
+                    },
+                    "unit": "kWh",
+                }
+            ]
+        },
+        "gas": {"data": []},
+    }
+
+    ovo_usage = decoder.decode_half_hourly_usage(json.dumps(payload).encode())
+
+    assert ovo_usage == parse_half_hourly_usage(payload)
+    assert ovo_usage.electricity is not None
+    assert ovo_usage.electricity[0].interval.end == datetime(
+        2024, 1, 1, 0, 30, tzinfo=UTC
+    )
+
+
+def test_msgspec_decoder_typed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test msgspec builds the models from typed structs, not the dict parser."""
+    decoder = _decoder("msgspec")
+    daily = parse_daily_usage(RESPONSE_JSON_DAILY_USAGE)
+    half_hourly = parse_half_hourly_usage(RESPONSE_JSON_HALF_HOURLY_USAGE)
+
+    def _not_called(*_: object) -> None:
+        raise AssertionError("Generic parser used")
+
+    for parser in ("parse_daily_usage", "parse_half_hourly_usage"):
+        monkeypatch.setattr(decoders, parser, _not_called)
+
+    assert (
+        decoder.decode_daily_usage(json.dumps(RESPONSE_JSON_DAILY_USAGE).encode())
+        == daily
+    )
+    assert (
+        decoder.decode_half_hourly_usage(
+            json.dumps(RESPONSE_JSON_HALF_HOURLY_USAGE).encode()
+        )
+        == half_hourly
+    )
+    assert decoder.decode_daily_usage(
+        json.dumps({"electricity": {"data": [None]}, "gas": None}).encode()
+    ) == OVODailyUsage(electricity=[], gas=None)
@@ -0,0 +1,117 @@
+"""Tests for the export module."""
+
+from datetime import UTC, date, datetime, timedelta
+import io
+
+from ovoenergy.export import (
+    DAILY_FIELDS,
+    HALF_HOURLY_FIELDS,
+    OVORowWriter,
+    daily_rows,
+    half_hourly_rows,
+)
+from ovoenergy.models import (
+    OVODailyGas,
+    OVODailyUsage,
+    OVOHalfHour,
+    OVOHalfHourUsage,
+    OVOInterval,
+    OVOMeterReadings,
+)
+
+
+def _interval(start: datetime, length: timedelta) -> OVOInterval:
+    """Return an interval."""
+    return OVOInterval(start=start, end=start + length)
+
+
+def test_half_hourly_rows() -> None:
+    """Test half hourly rows are flattened for the requested fuel."""
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    usage = OVOHalfHourUsage(
+        electricity=[
+            OVOHalfHour(
+                consumption=0.5,
+                interval=_interval(start, timedelta(minutes=30)),
+                unit="kWh",
+            )
+        ],
+        gas=None,
+    )
+
+    assert list(half_hourly_rows(usage, "electricity")) == [
+        {
+            "fuel": "electricity",
+            "start": "2024-01-01T00:00:00+00:00",
+            "end": "2024-01-01T00:30:00+00:00",
+            "consumption": 0.5,
+            "unit": "kWh",
+        }
+    ]
+    assert list(half_hourly_rows(usage, "gas")) == []
+
+
+def test_daily_rows_filters_range() -> None:
+    """Test daily rows outside the range or without an interval are skipped."""
+    usage = OVODailyUsage(
+        electricity=None,
+        gas=[
+            OVODailyGas(
+                consumption=consumption,
+                volume=1.0,
+                interval=_interval(
+                    datetime(2024, 1, day, tzinfo=UTC), timedelta(days=1)
+                ),
+                meter_readings=OVOMeterReadings(start=1.0, end=2.0),
+                has_half_hour_data=True,
+                cost=None,
+                rates=None,
+            )
+            for day, consumption in ((1, 1.5), (2, 2.5), (3, 3.5))
+        ]
+        + [
+            OVODailyGas(
+                consumption=None,
+                volume=None,
+                interval=None,
+                meter_readings=None,
+                has_half_hour_data=None,
+                cost=None,
+                rates=None,
+            )
+        ],
+    )
+
+    rows = list(daily_rows(usage, "gas", date(2024, 1, 2), date(2024, 1, 2)))
+
+    assert len(rows) == 1
+    assert rows[0]["consumption"] == 2.5
+    assert rows[0]["volume"] == 1.0
+    assert rows[0]["meter_readings_end"] == 2.0
+    assert rows[0]["cost_amount"] is None
+    assert tuple(rows[0]) == DAILY_FIELDS
+    assert list(daily_rows(usage, "electricity")) == []
+
+
+def test_row_writer_ndjson() -> None:
+    """Test rows are written as one JSON object per line."""
+    stream = io.StringIO()
+    writer = OVORowWriter(stream, "ndjson", HALF_HOURLY_FIELDS)
+
+    assert writer.write(iter([{"fuel": "gas", "consumption": 1.0}])) == 1
+    assert writer.write(iter([{"fuel": "gas", "consumption": None}])) == 1
+
+    assert stream.getvalue() == (
+        '{"fuel":"gas","consumption":1.0}\n{"fuel":"gas","consumption":null}\n'
+    )
+
+
+def test_row_writer_csv() -> None:
+    """Test rows are written as CSV with a single header."""
+    stream = io.StringIO()
+    writer = OVORowWriter(stream, "csv", ("fuel", "consumption"))
+
+    writer.write(iter([{"fuel": "gas", "consumption": 1.0}]))
+    writer.write(iter([{"fuel": "gas", "consumption": None}]))
+
+    assert stream.getvalue() == "fuel,consumption\ngas,1.0\ngas,\n"
@@ -0,0 +1,108 @@
+"""Tests for the fleet module."""
+
+import asyncio
+from contextlib import aclosing
+from datetime import timedelta
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from ovoenergy import OVOEnergy
+from ovoenergy.cache import OVOMemoryCache
+from ovoenergy.const import AUTH_LOGIN_URL, CARBON_INTENSITY_URL
+from ovoenergy.exceptions import OVOEnergyAPINotAuthorized
+from ovoenergy.fleet import OVOEnergyFleet
+
+from . import ACCOUNT, PASSWORD, USERNAME
+
+
+async def _daily_usage(client: OVOEnergy):
+    """Fetch daily usage for a fleet client."""
+    return await client.get_daily_usage("2024-01")
+
+
+@pytest.mark.asyncio
+async def test_fleet_gather(
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the fleet authenticates lazily and gathers every login."""
+    async with OVOEnergyFleet(concurrency=1, cache=OVOMemoryCache()) as fleet:
+        fleet.add(USERNAME, PASSWORD)
+        fleet.add(f"{USERNAME}2", PASSWORD, account_id=ACCOUNT)
+
+        # Nothing is created until first use
+        assert fleet.clients == []
+
+        results = [result async for result in fleet.gather(_daily_usage)]
+
+        assert sorted(result.username for result in results) == [
+            USERNAME,
+            f"{USERNAME}2",
+        ]
+        assert all(result.error is None for result in results)
+        assert all(result.account_id == ACCOUNT for result in results)
+        assert results[0].result == results[1].result
+
+        # Already authenticated, so no more logins
+        results = [result async for result in fleet.gather(_daily_usage)]
+        assert len(mock_aioresponse.requests[("POST", URL(AUTH_LOGIN_URL))]) == 2
+
+        # The shared cache serves every login
+        results = [
+            result
+            async for result in fleet.gather(
+                lambda client: client.get_carbon_intensity()
+            )
+        ]
+        assert len(results) == 2
+        assert len(mock_aioresponse.requests[("GET", URL(CARBON_INTENSITY_URL))]) == 1
+
+
+def test_fleet_outside_event_loop() -> None:
+    """Test a fleet can be set up before the event loop is running."""
+    fleet = OVOEnergyFleet()
+    fleet.add(USERNAME, PASSWORD)
+
+    async def _gather() -> list:
+        async with fleet:
+            return [result async for result in fleet.gather(_daily_usage)]
+
+    (result,) = asyncio.run(_gather())
+
+    assert result.error is None
+    assert result.result.electricity
+    assert fleet.clients == []
+
+
+@pytest.mark.asyncio
+async def test_fleet_poll_errors(
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test polling keeps going and reports errors per login."""
+    mock_aioresponse.clear()
+    mock_aioresponse.post(
+        AUTH_LOGIN_URL,
+        status=200,
+        payload={"code": "Unknown"},
+        repeat=True,
+    )
+
+    async with ClientSession() as session:
+        fleet = OVOEnergyFleet(client_session=session)
+        fleet.add(USERNAME, PASSWORD)
+
+        results = []
+        async with aclosing(fleet.poll(_daily_usage, timedelta(0))) as poll:
+            async for result in poll:
+                results.append(result)
+                if len(results) == 2:
+                    break
+
+        await fleet.close()
+        assert not session.closed
+
+    assert all(
+        isinstance(result.error, OVOEnergyAPINotAuthorized) for result in results
+    )
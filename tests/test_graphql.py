@@ -0,0 +1,207 @@
+"""Tests for the graphql module."""
+
+from copy import deepcopy
+
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from ovoenergy import OVOEnergy
+from ovoenergy.const import BOOTSTRAP_GRAPHQL_URL
+from ovoenergy.graphql import (
+    build_bootstrap_query,
+    persisted_query_error,
+    persisted_query_extensions,
+    query_hash,
+)
+
+from . import ACCOUNT, PASSWORD, RESPONSE_JSON_BOOTSTRAP_ACCOUNTS, USERNAME
+
+NOT_FOUND = {
+    "errors": [
+        {
+            "message": "PersistedQueryNotFound",
+            "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+        }
+    ]
+}
+
+
+def _bootstrap_requests(mock_aioresponse: aioresponses) -> list[dict]:
+    """Return the JSON bodies posted to the GraphQL endpoint."""
+    return [
+        call.kwargs["json"]
+        for call in mock_aioresponse.requests.get(
+            ("POST", URL(BOOTSTRAP_GRAPHQL_URL)), []
+        )
+    ]
+
+
+def test_build_bootstrap_query() -> None:
+    """Test only the selected fields are queried."""
+    query = build_bootstrap_query()
+    assert "__typename" not in query
+    assert "meterSerialNumber" in query
+    assert "startDate" in query
+
+    minimal = build_bootstrap_query([])
+    assert "accountSupplyPoints" not in minimal
+    assert "customer_nextV1(id: $customerId)" in minimal
+
+    fuel = build_bootstrap_query(["fuel"])
+    assert "fuelType" in fuel
+    assert "meterTechnicalDetails" not in fuel
+    assert "address" not in fuel
+
+    # Selections are cached regardless of their order
+    assert build_bootstrap_query(["meter", "fuel"]) is build_bootstrap_query(
+        ["fuel", "meter"]
+    )
+
+    with pytest.raises(ValueError, match="Unknown bootstrap fields: tariff"):
+        build_bootstrap_query(["tariff"])  # type: ignore[list-item]
+
+
+def test_persisted_query_error() -> None:
+    """Test persisted query errors are recognised by message or code."""
+    assert persisted_query_error(NOT_FOUND) == "not_found"
+    assert (
+        persisted_query_error(
+            {"errors": [{"extensions": {"code": "PERSISTED_QUERY_NOT_SUPPORTED"}}]}
+        )
+        == "not_supported"
+    )
+    assert persisted_query_error({"errors": [{"message": "Bad"}]}) is None
+    assert persisted_query_error(RESPONSE_JSON_BOOTSTRAP_ACCOUNTS) is None
+    assert persisted_query_extensions("query") == {
+        "persistedQuery": {"version": 1, "sha256Hash": query_hash("query")}
+    }
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_fields(
+    cached_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test a trimmed bootstrap only fills in what was selected."""
+    minimal_response = deepcopy(RESPONSE_JSON_BOOTSTRAP_ACCOUNTS)
+    for edge in minimal_response["data"]["customer_nextV1"][
+        "customerAccountRelationships"
+    ]["edges"]:
+        del edge["node"]["account"]["accountSupplyPoints"]
+
+    await cached_client.authenticate(USERNAME, PASSWORD)
+
+    mock_aioresponse.clear()
+    mock_aioresponse.post(BOOTSTRAP_GRAPHQL_URL, payload=minimal_response)
+    mock_aioresponse.post(
+        BOOTSTRAP_GRAPHQL_URL, payload=RESPONSE_JSON_BOOTSTRAP_ACCOUNTS
+    )
+
+    minimal = await cached_client.bootstrap_accounts([])
+    assert minimal.account_ids == [ACCOUNT]
+    assert minimal.accounts[0].supplies is None
+    fuels = await cached_client.bootstrap_accounts(["fuel"])
+    assert [supply.fuel for supply in fuels.accounts[0].supplies] == [
+        "gas",
+        "electricity",
+    ]
+
+    # Each selection is cached separately
+    assert await cached_client.bootstrap_accounts([]) is minimal
+    assert await cached_client.bootstrap_accounts(["fuel"]) is fuels
+    requests = _bootstrap_requests(mock_aioresponse)
+    assert [request["query"] for request in requests] == [
+        build_bootstrap_query([]),
+        build_bootstrap_query(["fuel"]),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_fields_invalidate(
+    cached_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test invalidating the bootstrap cache covers every field selection."""
+    await cached_client.authenticate(USERNAME, PASSWORD)
+
+    await cached_client.bootstrap_accounts(["fuel"])
+    await cached_client.bootstrap_accounts(["fuel"])
+    assert len(_bootstrap_requests(mock_aioresponse)) == 1
+
+    cached_client.invalidate_cache("bootstrap_accounts")
+    await cached_client.bootstrap_accounts(["fuel"])
+    assert len(_bootstrap_requests(mock_aioresponse)) == 2
+
+    cached_client.invalidate_cache()
+    await cached_client.bootstrap_accounts(["fuel"])
+    assert len(_bootstrap_requests(mock_aioresponse)) == 3
+
+
+# pylint: disable=protected-access
+@pytest.mark.asyncio
+async def test_persisted_query(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test known queries are sent by hash alone."""
+    ovoenergy_client._persisted_queries = True
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    accounts = await ovoenergy_client.bootstrap_accounts()
+
+    assert accounts.account_ids == [ACCOUNT]
+    (request,) = _bootstrap_requests(mock_aioresponse)
+    assert "query" not in request
+    assert request["extensions"] == persisted_query_extensions(build_bootstrap_query())
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_not_found(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test an unknown hash is registered by sending the full query."""
+    ovoenergy_client._persisted_queries = True
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    mock_aioresponse.clear()
+    mock_aioresponse.post(BOOTSTRAP_GRAPHQL_URL, payload=NOT_FOUND)
+    mock_aioresponse.post(
+        BOOTSTRAP_GRAPHQL_URL, payload=RESPONSE_JSON_BOOTSTRAP_ACCOUNTS
+    )
+
+    accounts = await ovoenergy_client.bootstrap_accounts()
+
+    assert accounts.account_ids == [ACCOUNT]
+    first, second = _bootstrap_requests(mock_aioresponse)
+    assert "query" not in first
+    assert second["query"] == build_bootstrap_query()
+    assert second["extensions"] == first["extensions"]
+    assert ovoenergy_client._persisted_queries
+
+
+@pytest.mark.asyncio
+async def test_persisted_query_not_supported(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test persisted queries are turned off if the server rejects them."""
+    ovoenergy_client._persisted_queries = True
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    mock_aioresponse.clear()
+    mock_aioresponse.post(
+        BOOTSTRAP_GRAPHQL_URL,
+        payload={"errors": [{"message": "PersistedQueryNotSupported"}]},
+    )
+    mock_aioresponse.post(
+        BOOTSTRAP_GRAPHQL_URL, payload=RESPONSE_JSON_BOOTSTRAP_ACCOUNTS
+    )
+
+    await ovoenergy_client.bootstrap_accounts()
+
+    _, second = _bootstrap_requests(mock_aioresponse)
+    assert "extensions" not in second
+    assert second["query"] == build_bootstrap_query()
+    assert not ovoenergy_client._persisted_queries
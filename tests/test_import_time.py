@@ -0,0 +1,53 @@
+"""Tests for import time."""
+
+import subprocess
+import sys
+
+import pytest
+
+import ovoenergy
+
+# Generous enough for slow CI runners, but catches a heavy import sneaking back
+IMPORT_TIME_BUDGET_US = 1_000_000
+
+DEFERRED_MODULES = {"aiohttp", "cryptography", "jwt", "numpy", "sqlite3"}
+
+
+def _import_times(*args: str) -> dict[str, int]:
+    """Return the cumulative import time in microseconds of each module loaded."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_time() -> None:
+    """Test importing the package does not load heavy dependencies."""
+    times = _import_times("-c", "import ovoenergy")
+
+    assert DEFERRED_MODULES.isdisjoint(times)
+    assert times["ovoenergy"] < IMPORT_TIME_BUDGET_US
+
+
+def test_cli_help_import_time() -> None:
+    """Test the CLI help does not load the HTTP client."""
+    times = _import_times("-m", "ovoenergy", "--help")
+
+    assert DEFERRED_MODULES.isdisjoint(times)
+
+
+def test_lazy_submodules() -> None:
+    """Test submodules load on first attribute access."""
+    assert ovoenergy.store.OVOUsageStore is not None
+
+    with pytest.raises(AttributeError):
+        _ = ovoenergy.missing
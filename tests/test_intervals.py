@@ -0,0 +1,36 @@
+"""Tests for the intervals module."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from ovoenergy.intervals import OVOIntervalParser
+
+ROWS = [
+    {"interval": {"start": "2024-01-01T00:00:00Z", "end": "2024-01-01T00:30:00Z"}},
+    {"interval": {"start": "2024-01-01T00:30:00Z", "end": "2024-01-01T01:00:00Z"}},
+]
+
+
+def test_parse_half_hour_interval() -> None:
+    """Test half hour intervals infer the end and reuse cached starts."""
+    parser = OVOIntervalParser(cache_size=2)
+
+    first = parser.parse_half_hour_interval(ROWS[0]["interval"])
+    second = parser.parse_half_hour_interval(ROWS[0]["interval"])
+
+    assert first == parser.parse_interval(ROWS[0]["interval"])
+    assert first.end == datetime(2024, 1, 1, 0, 30, tzinfo=UTC)
+    assert second.start is first.start
+
+
+@pytest.mark.usefixtures("with_numpy")
+def test_to_epochs() -> None:
+    """Test a data array converts to epoch seconds with and without NumPy."""
+    parser = OVOIntervalParser()
+
+    assert parser.to_epochs(ROWS).tolist() == [1704067200, 1704069000]
+    assert parser.to_epochs([]).tolist() == []
+    assert parser.to_epochs(
+        [{"interval": {"start": "2024-06-01T00:00:00+01:00"}}]
+    ).tolist() == [1717196400]
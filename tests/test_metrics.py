@@ -0,0 +1,125 @@
+"""Tests for the metrics module."""
+
+from types import SimpleNamespace
+
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+import pytest
+
+from ovoenergy import OVOEnergy
+from ovoenergy.const import (
+    AUTH_TOKEN_URL,
+    CARBON_INTENSITY_URL,
+    USAGE_DAILY_URL,
+    USAGE_HALF_HOURLY_URL,
+)
+from ovoenergy.metrics import OVOMetricsCollector, endpoint_name, trace_config
+from ovoenergy.retry import OVORetryPolicy
+
+from . import ACCOUNT, PASSWORD, RESPONSE_JSON_DAILY_USAGE, USERNAME
+
+DAILY_URL = f"{USAGE_DAILY_URL}/{ACCOUNT}?date=2024-01"
+
+
+def test_endpoint_name() -> None:
+    """Test URLs map to endpoint names, with half hourly not taken as daily."""
+    assert endpoint_name(DAILY_URL) == "usage_daily"
+    assert endpoint_name(f"{USAGE_HALF_HOURLY_URL}/{ACCOUNT}") == "usage_half_hourly"
+    assert endpoint_name(AUTH_TOKEN_URL) == "auth_token"
+    assert endpoint_name(CARBON_INTENSITY_URL) == "carbon_intensity"
+    assert endpoint_name("https://example.com") == "other"
+
+
+@pytest.mark.asyncio
+async def test_request_metrics(mock_aioresponse: aioresponses) -> None:
+    """Test requests, retries, bytes and parse time are reported."""
+    metrics = OVOMetricsCollector()
+    async with ClientSession() as session:
+        client = OVOEnergy(
+            client_session=session,
+            retry_policy=OVORetryPolicy(retries=2, backoff_base=0),
+            metrics=metrics,
+        )
+        await client.authenticate(USERNAME, PASSWORD)
+
+        mock_aioresponse.clear()
+        mock_aioresponse.get(DAILY_URL, status=503)
+        mock_aioresponse.get(DAILY_URL, payload=RESPONSE_JSON_DAILY_USAGE)
+        await client.get_daily_usage("2024-01")
+
+    assert metrics.requests[("auth_login", "POST", "200")] == 1
+    assert metrics.requests[("auth_token", "GET", "200")] == 1
+    assert metrics.requests[("usage_daily", "GET", "503")] == 1
+    assert metrics.requests[("usage_daily", "GET", "200")] == 1
+    assert metrics.retries == {("usage_daily", "503"): 1}
+    assert metrics.bytes_received["usage_daily"] > 0
+    assert metrics.request_durations["usage_daily"].count == 2
+    assert metrics.parse_durations["usage_daily"].count == 1
+
+
+@pytest.mark.asyncio
+async def test_token_refresh_metrics(ovoenergy_client: OVOEnergy) -> None:
+    """Test token refreshes are reported, but the first login token is not."""
+    metrics = OVOMetricsCollector()
+    ovoenergy_client._metrics = metrics
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+    assert not metrics.token_refreshes
+
+    await ovoenergy_client.refresh_token()
+    assert metrics.token_refreshes == {True: 1}
+    assert metrics.token_refresh_durations.count == 1
+
+
+def test_export_prometheus() -> None:
+    """Test the Prometheus text export."""
+    metrics = OVOMetricsCollector(buckets=(0.1, 1.0))
+    metrics.request("usage_daily", "GET", 200, 0.05, 100)
+    metrics.request("usage_daily", "GET", 200, 0.5, 50)
+    metrics.request("usage_daily", "GET", None, 2.0, 0)
+    metrics.retry("usage_daily", "ClientConnectionError")
+    metrics.token_refresh(False, 0.2)
+    metrics.parse("usage_daily", 0.01)
+
+    lines = metrics.export_prometheus().splitlines()
+
+    assert (
+        'ovoenergy_requests_total{endpoint="usage_daily",method="GET",status="200"} 2'
+        in lines
+    )
+    assert (
+        'ovoenergy_requests_total{endpoint="usage_daily",method="GET",status="error"} 1'
+        in lines
+    )
+    assert [
+        line
+        for line in lines
+        if line.startswith("ovoenergy_request_duration_seconds_bucket")
+    ] == [
+        'ovoenergy_request_duration_seconds_bucket{endpoint="usage_daily",le="0.1"} 1',
+        'ovoenergy_request_duration_seconds_bucket{endpoint="usage_daily",le="1.0"} 2',
+        'ovoenergy_request_duration_seconds_bucket{endpoint="usage_daily",le="+Inf"} 3',
+    ]
+    assert 'ovoenergy_request_duration_seconds_count{endpoint="usage_daily"} 3' in lines
+    assert 'ovoenergy_response_bytes_total{endpoint="usage_daily"} 150' in lines
+    assert (
+        'ovoenergy_retries_total{endpoint="usage_daily",reason="ClientConnectionError"} 1'
+        in lines
+    )
+    assert 'ovoenergy_token_refreshes_total{result="failure"} 1' in lines
+    assert 'ovoenergy_parse_duration_seconds_count{endpoint="usage_daily"} 1' in lines
+
+
+@pytest.mark.asyncio
+async def test_trace_config() -> None:
+    """Test connection phases are timed from aiohttp trace callbacks."""
+    metrics = OVOMetricsCollector()
+    config = trace_config(metrics)
+    context = SimpleNamespace()
+
+    await config.on_connection_create_start[0](None, context, None)
+    await config.on_connection_create_end[0](None, context, None)
+    # An end without a start is ignored
+    await config.on_dns_resolvehost_end[0](None, SimpleNamespace(), None)
+
+    assert metrics.connection_durations["connect"].count == 1
+    assert "dns" not in metrics.connection_durations
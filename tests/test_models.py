@@ -0,0 +1,38 @@
+"""Tests for the models."""
+
+from dataclasses import is_dataclass
+import inspect
+
+import pytest
+
+import ovoenergy.models
+from ovoenergy.models import (
+    accounts,
+    carbon_intensity,
+    columnar,
+    footprint,
+    oauth,
+    plan,
+)
+
+MODELS = [
+    model
+    for module in (
+        ovoenergy.models,
+        accounts,
+        carbon_intensity,
+        columnar,
+        footprint,
+        oauth,
+        plan,
+    )
+    for _, model in inspect.getmembers(module, inspect.isclass)
+    if is_dataclass(model) and model.__module__ == module.__name__
+]
+
+
+@pytest.mark.parametrize("model", MODELS, ids=lambda model: model.__name__)
+def test_models_are_slotted(model: type) -> None:
+    """Test models use slots instead of a per-instance __dict__."""
+    assert "__slots__" in model.__dict__
+    assert "__dict__" not in model.__dict__
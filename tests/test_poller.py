@@ -0,0 +1,200 @@
+"""Tests for the poller module."""
+
+from copy import deepcopy
+from datetime import date, timedelta
+
+from aioresponses import aioresponses
+import pytest
+
+from ovoenergy import OVOEnergy
+from ovoenergy.const import BOOTSTRAP_GRAPHQL_URL, USAGE_HALF_HOURLY_URL
+from ovoenergy.poller import OVOHalfHourPoller
+
+from . import (
+    ACCOUNT,
+    ACCOUNT_OTHER,
+    PASSWORD,
+    RESPONSE_JSON_BOOTSTRAP_ACCOUNTS,
+    USERNAME,
+)
+
+
+def _payload(day: date, consumption: list[float | None]) -> dict:
+    """Return a half hourly electricity payload for a day."""
+    return {
+        "electricity": {
+            "data": [
+                {
+                    "consumption": value,
+                    "interval": {
+                        "start": f"{day.isoformat()}T{slot // 2:02d}:{slot % 2 * 30:02d}:00Z",
+                        "end": "",
+                    },
+                    "unit": "kWh",
+                }
+                for slot, value in enumerate(consumption)
+            ],
+        },
+        "gas": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_poll_once(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test polling yields only new or changed rows."""
+    day = date(2024, 1, 2)
+    url = f"{USAGE_HALF_HOURLY_URL}/{ACCOUNT}?date={day.isoformat()}"
+    mock_aioresponse.get(url, payload=_payload(day, [0.1]))
+    mock_aioresponse.get(url, payload=_payload(day, [0.1]))
+    mock_aioresponse.get(url, payload=_payload(day, [0.1, 0.2, 0.3]))
+    mock_aioresponse.get(url, payload=_payload(day, [0.1, 0.25, 0.3]))
+
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+    await ovoenergy_client.bootstrap_accounts()
+
+    poller = OVOHalfHourPoller(ovoenergy_client)
+
+    updates = await poller.poll_once(day)
+    assert [(update.account_id, update.fuel) for update in updates] == [
+        (ACCOUNT, "electricity")
+    ]
+
+    assert await poller.poll_once(day) == []
+
+    updates = await poller.poll_once(day)
+    assert [update.half_hour.consumption for update in updates] == [0.2, 0.3]
+
+    updates = await poller.poll_once(day)
+    assert [update.half_hour.consumption for update in updates] == [0.25]
+
+
+@pytest.mark.asyncio
+async def test_poll_once_missing_consumption(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test a slot first seen without consumption is yielded, then its value."""
+    day = date(2024, 1, 2)
+    url = f"{USAGE_HALF_HOURLY_URL}/{ACCOUNT}?date={day.isoformat()}"
+    mock_aioresponse.get(url, payload=_payload(day, [None]))
+    mock_aioresponse.get(url, payload=_payload(day, [None]))
+    mock_aioresponse.get(url, payload=_payload(day, [0.1]))
+
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+    await ovoenergy_client.bootstrap_accounts()
+
+    poller = OVOHalfHourPoller(ovoenergy_client)
+
+    updates = await poller.poll_once(day)
+    assert [update.half_hour.consumption for update in updates] == [None]
+    assert await poller.poll_once(day) == []
+    updates = await poller.poll_once(day)
+    assert [update.half_hour.consumption for update in updates] == [0.1]
+
+
+@pytest.mark.asyncio
+async def test_poll_once_day_rollover(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the previous day is polled once more when the day rolls over."""
+    mock_aioresponse.get(
+        f"{USAGE_HALF_HOURLY_URL}/{ACCOUNT}?date=2024-01-02",
+        payload=_payload(date(2024, 1, 2), [0.4]),
+        repeat=True,
+    )
+
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+    await ovoenergy_client.bootstrap_accounts()
+
+    poller = OVOHalfHourPoller(ovoenergy_client)
+
+    assert len(await poller.poll_once(date(2024, 1, 1))) == 2
+    updates = await poller.poll_once(date(2024, 1, 2))
+    assert [update.half_hour.consumption for update in updates] == [0.4]
+    assert await poller.poll_once(date(2024, 1, 2)) == []
+
+    poller.reset()
+    assert len(await poller.poll_once(date(2024, 1, 2))) == 1
+
+
+@pytest.mark.asyncio
+async def test_poll_once_accounts(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test every account is polled unless account ids are given."""
+    day = date(2024, 1, 2)
+    bootstrap = deepcopy(RESPONSE_JSON_BOOTSTRAP_ACCOUNTS)
+    edges = bootstrap["data"]["customer_nextV1"]["customerAccountRelationships"][
+        "edges"
+    ]
+    other = deepcopy(edges[0])
+    other["node"]["account"]["id"] = ACCOUNT_OTHER
+    edges.append(other)
+
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    mock_aioresponse.clear()
+    mock_aioresponse.post(BOOTSTRAP_GRAPHQL_URL, payload=bootstrap)
+    for account, consumption in ((ACCOUNT, [0.1]), (ACCOUNT_OTHER, [0.2, 0.3])):
+        mock_aioresponse.get(
+            f"{USAGE_HALF_HOURLY_URL}/{account}?date={day.isoformat()}",
+            payload=_payload(day, consumption),
+            repeat=True,
+        )
+    await ovoenergy_client.bootstrap_accounts()
+
+    poller = OVOHalfHourPoller(ovoenergy_client)
+
+    updates = await poller.poll_once(day)
+    assert [
+        (update.account_id, update.half_hour.consumption) for update in updates
+    ] == [(ACCOUNT, 0.1), (ACCOUNT_OTHER, 0.2), (ACCOUNT_OTHER, 0.3)]
+    assert await poller.poll_once(day) == []
+
+    poller.reset()
+    updates = await poller.poll_once(day, account_ids=[ACCOUNT_OTHER])
+    assert {update.account_id for update in updates} == {ACCOUNT_OTHER}
+
+
+@pytest.mark.asyncio
+async def test_poll(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test the poll generator yields today's rows then waits for more."""
+    today = date.today()
+    mock_aioresponse.get(
+        f"{USAGE_HALF_HOURLY_URL}/{ACCOUNT}?date={today.isoformat()}",
+        payload=_payload(today, [0.1, 0.2]),
+        repeat=True,
+    )
+
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+    await ovoenergy_client.bootstrap_accounts()
+
+    poller = OVOHalfHourPoller(
+        ovoenergy_client,
+        interval=timedelta(milliseconds=1),
+        jitter=timedelta(0),
+    )
+
+    consumption = []
+    async for update in poller.poll():
+        consumption.append(update.half_hour.consumption)
+        if len(consumption) == 2:
+            break
+
+    assert consumption == [0.1, 0.2]
+
+
+def test_poller_invalid_interval(ovoenergy_client: OVOEnergy) -> None:
+    """Test the poll interval must be positive."""
+    with pytest.raises(ValueError):
+        OVOHalfHourPoller(ovoenergy_client, interval=timedelta(0))
+    with pytest.raises(ValueError):
+        OVOHalfHourPoller(ovoenergy_client, jitter=timedelta(seconds=-1))
@@ -0,0 +1,138 @@
+"""Tests for the retry module."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+import time
+
+import aiohttp
+from aiohttp import ClientSession
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from ovoenergy import OVOEnergy
+from ovoenergy.const import CARBON_INTENSITY_URL, USAGE_DAILY_URL
+from ovoenergy.exceptions import OVOEnergyAPIRateLimited, OVOEnergyAPIServerError
+from ovoenergy.retry import OVORetryPolicy, OVOTokenBucket, parse_retry_after
+
+from . import (
+    ACCOUNT,
+    PASSWORD,
+    RESPONSE_JSON_DAILY_USAGE,
+    RESPONSE_JSON_INTENSITY,
+    USERNAME,
+)
+
+DAILY_URL = f"{USAGE_DAILY_URL}/{ACCOUNT}?date=2024-01"
+
+
+@pytest.fixture
+async def retrying_client() -> OVOEnergy:
+    """Return a client that retries without waiting."""
+    async with ClientSession() as session:
+        yield OVOEnergy(
+            client_session=session,
+            retry_policy=OVORetryPolicy(retries=2, backoff_base=0),
+        )
+
+
+def test_parse_retry_after() -> None:
+    """Test Retry-After headers in seconds and as dates."""
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("5") == 5
+    assert parse_retry_after("soon") is None
+    assert (
+        0
+        < parse_retry_after(
+            format_datetime(datetime.now(UTC) + timedelta(minutes=1), usegmt=True)
+        )
+        <= 60
+    )
+
+    # Retry-After is waited in full, or not at all if it is too long
+    assert OVORetryPolicy(backoff_max=10).delay(0, "45") == 45
+    assert OVORetryPolicy(retry_after_max=60).delay(0, "120") is None
+    assert 0 <= OVORetryPolicy(backoff_base=1).delay(2) <= 4
+
+
+@pytest.mark.asyncio
+async def test_token_bucket() -> None:
+    """Test the token bucket allows a burst then limits the rate."""
+    bucket = OVOTokenBucket(rate=100, burst=2)
+
+    started = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+    assert time.monotonic() - started >= 0.015
+
+    bucket.pause(0.02)
+    started = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - started >= 0.015
+
+
+@pytest.mark.asyncio
+async def test_retry_rate_limited(
+    retrying_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test 429 responses are retried, then raised once retries run out."""
+    await retrying_client.authenticate(USERNAME, PASSWORD)
+
+    mock_aioresponse.clear()
+    mock_aioresponse.get(DAILY_URL, status=429, headers={"Retry-After": "0"})
+    mock_aioresponse.get(DAILY_URL, payload=RESPONSE_JSON_DAILY_USAGE)
+
+    assert (await retrying_client.get_daily_usage("2024-01")).electricity
+
+    mock_aioresponse.get(
+        DAILY_URL, status=429, headers={"Retry-After": "0"}, repeat=True
+    )
+
+    with pytest.raises(OVOEnergyAPIRateLimited):
+        await retrying_client.get_daily_usage("2024-01")
+
+    # One success after a retry, then the first try plus two retries
+    assert len(mock_aioresponse.requests[("GET", URL(DAILY_URL))]) == 5
+
+
+@pytest.mark.asyncio
+async def test_retry_after_too_long(
+    retrying_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test a Retry-After longer than allowed fails fast and blocks nothing."""
+    await retrying_client.authenticate(USERNAME, PASSWORD)
+
+    mock_aioresponse.clear()
+    mock_aioresponse.get(DAILY_URL, status=429, headers={"Retry-After": "3600"})
+    mock_aioresponse.get(CARBON_INTENSITY_URL, payload=RESPONSE_JSON_INTENSITY)
+
+    with pytest.raises(OVOEnergyAPIRateLimited):
+        await asyncio.wait_for(retrying_client.get_daily_usage("2024-01"), 1)
+
+    # The rate limiter shared by the API was not paused for the hour
+    assert (await asyncio.wait_for(retrying_client.get_carbon_intensity(), 1)).current
+    assert len(mock_aioresponse.requests[("GET", URL(DAILY_URL))]) == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_server_error(
+    retrying_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test 5xx responses and connection errors are retried."""
+    await retrying_client.authenticate(USERNAME, PASSWORD)
+
+    mock_aioresponse.clear()
+    mock_aioresponse.get(DAILY_URL, exception=aiohttp.ClientConnectionError())
+    mock_aioresponse.get(DAILY_URL, status=502)
+    mock_aioresponse.get(DAILY_URL, payload=RESPONSE_JSON_DAILY_USAGE)
+
+    assert (await retrying_client.get_daily_usage("2024-01")).electricity
+
+    mock_aioresponse.get(DAILY_URL, status=503, repeat=True)
+
+    with pytest.raises(OVOEnergyAPIServerError):
+        await retrying_client.get_daily_usage("2024-01")
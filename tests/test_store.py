@@ -0,0 +1,273 @@
+"""Tests for the store module."""
+
+from datetime import UTC, date, datetime, timedelta
+
+from aioresponses import aioresponses
+import pytest
+from yarl import URL
+
+from ovoenergy import OVOEnergy
+from ovoenergy.const import USAGE_DAILY_URL, USAGE_HALF_HOURLY_URL
+from ovoenergy.models import (
+    OVODailyElectricity,
+    OVODailyGas,
+    OVODailyUsage,
+    OVOHalfHour,
+    OVOHalfHourUsage,
+    OVOInterval,
+)
+from ovoenergy.models.backfill import OVOHalfHourGap
+from ovoenergy.store import OVOUsageStore
+
+from . import ACCOUNT, ACCOUNT_OTHER, PASSWORD, USERNAME
+
+
+def _interval(day: date) -> OVOInterval:
+    """Return the interval covering a whole day."""
+    start = datetime.combine(day, datetime.min.time(), UTC)
+    return OVOInterval(start=start, end=start + timedelta(days=1))
+
+
+def _half_hours(day: date, count: int) -> list[OVOHalfHour]:
+    """Return the first half hours of a day."""
+    start = _interval(day).start
+    return [
+        OVOHalfHour(
+            consumption=0.5,
+            interval=OVOInterval(
+                start=start + timedelta(minutes=30 * index),
+                end=start + timedelta(minutes=30 * (index + 1)),
+            ),
+            unit="kWh",
+        )
+        for index in range(count)
+    ]
+
+
+def _daily_electricity(
+    day: date, has_half_hour_data: bool | None
+) -> OVODailyElectricity:
+    """Return a daily electricity row."""
+    return OVODailyElectricity(
+        consumption=24.0,
+        interval=_interval(day),
+        meter_readings=None,
+        has_half_hour_data=has_half_hour_data,
+        cost=None,
+        rates=None,
+    )
+
+
+def _daily_gas(day: date, has_half_hour_data: bool | None) -> OVODailyGas:
+    """Return a daily gas row."""
+    return OVODailyGas(
+        consumption=12.0,
+        volume=None,
+        interval=_interval(day),
+        meter_readings=None,
+        has_half_hour_data=has_half_hour_data,
+        cost=None,
+        rates=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_store_round_trip(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test usage written to the store reads back unchanged."""
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    await ovoenergy_client.bootstrap_accounts()
+
+    daily_usage = await ovoenergy_client.get_daily_usage("2024-01")
+    half_hourly_usage = await ovoenergy_client.get_half_hourly_usage("2024-01-01")
+
+    with OVOUsageStore() as store:
+        store.write_daily_usage(ACCOUNT, daily_usage)
+        store.write_half_hourly_usage(ACCOUNT, date(2024, 1, 1), half_hourly_usage)
+
+        assert (
+            store.get_daily_usage(ACCOUNT, date(2024, 1, 1), date(2024, 1, 31))
+            == daily_usage
+        )
+        assert (
+            store.get_half_hourly_usage(ACCOUNT, date(2024, 1, 1), date(2024, 1, 1))
+            == half_hourly_usage
+        )
+        assert store.get_half_hourly_usage(
+            ACCOUNT, date(2024, 1, 2), date(2024, 1, 3)
+        ) == OVOHalfHourUsage(electricity=None, gas=None)
+
+
+@pytest.mark.asyncio
+async def test_sync(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test sync only fetches periods that are missing or may be revised."""
+    daily_url = URL(f"{USAGE_DAILY_URL}/{ACCOUNT}?date=2024-01")
+    half_hourly_url = URL(f"{USAGE_HALF_HOURLY_URL}/{ACCOUNT}?date=2024-01-01")
+
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    await ovoenergy_client.bootstrap_accounts()
+
+    with OVOUsageStore() as store:
+        await ovoenergy_client.sync(store, date(2024, 1, 1), date(2024, 1, 1))
+
+        assert len(mock_aioresponse.requests[("GET", daily_url)]) == 1
+        assert len(mock_aioresponse.requests[("GET", half_hourly_url)]) == 1
+
+        # Everything is settled, so nothing is fetched again
+        await ovoenergy_client.sync(store, date(2024, 1, 1), date(2024, 1, 1))
+
+        assert len(mock_aioresponse.requests[("GET", daily_url)]) == 1
+        assert len(mock_aioresponse.requests[("GET", half_hourly_url)]) == 1
+
+        # A fetch made before the revision window closed is fetched again
+        store.mark_fetched(
+            ACCOUNT,
+            "half_hourly",
+            "2024-01-01",
+            datetime(2024, 1, 2, tzinfo=UTC),
+        )
+        await ovoenergy_client.sync(
+            store,
+            date(2024, 1, 1),
+            date(2024, 1, 1),
+            revision_window=timedelta(days=1),
+        )
+
+        assert len(mock_aioresponse.requests[("GET", daily_url)]) == 1
+        assert len(mock_aioresponse.requests[("GET", half_hourly_url)]) == 2
+
+        assert store.get_half_hourly_usage(
+            ACCOUNT, date(2024, 1, 1), date(2024, 1, 1)
+        ) == await ovoenergy_client.get_half_hourly_usage("2024-01-01")
+
+
+def test_half_hourly_gaps() -> None:
+    """Test gaps are days with half hourly data available but not stored."""
+    with OVOUsageStore() as store:
+        store.write_daily_usage(
+            ACCOUNT,
+            OVODailyUsage(
+                electricity=[
+                    _daily_electricity(date(2024, 1, 1), True),
+                    _daily_electricity(date(2024, 1, 2), True),
+                    _daily_electricity(date(2024, 1, 3), False),
+                ],
+                gas=[
+                    _daily_gas(date(2024, 1, 1), True),
+                    _daily_gas(date(2024, 1, 2), None),
+                ],
+            ),
+        )
+        store.write_half_hourly_usage(
+            ACCOUNT,
+            date(2024, 1, 1),
+            OVOHalfHourUsage(electricity=_half_hours(date(2024, 1, 1), 48), gas=None),
+        )
+        store.write_half_hourly_usage(
+            ACCOUNT,
+            date(2024, 1, 2),
+            OVOHalfHourUsage(electricity=_half_hours(date(2024, 1, 2), 40), gas=None),
+        )
+
+        gaps = store.get_half_hourly_gaps(
+            [ACCOUNT, ACCOUNT_OTHER], date(2024, 1, 1), date(2024, 1, 3)
+        )
+
+        assert gaps == [
+            OVOHalfHourGap(ACCOUNT, "electricity", date(2024, 1, 2), 48, 40),
+            OVOHalfHourGap(ACCOUNT, "gas", date(2024, 1, 1), 48, 0),
+        ]
+        assert [gap.missing for gap in gaps] == [8, 48]
+        assert not store.get_half_hourly_gaps(
+            [ACCOUNT], date(2024, 1, 3), date(2024, 1, 3)
+        )
+        assert not store.get_half_hourly_gaps(
+            [ACCOUNT_OTHER], date(2024, 1, 1), date(2024, 1, 3)
+        )
+
+
+@pytest.mark.asyncio
+async def test_backfill_half_hourly(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test backfill only fetches days with gaps, newest first."""
+    filled_url = URL(f"{USAGE_HALF_HOURLY_URL}/{ACCOUNT}?date=2024-01-02")
+    late_url = URL(f"{USAGE_HALF_HOURLY_URL}/{ACCOUNT}?date=2024-01-03")
+
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    mock_aioresponse.get(
+        str(filled_url),
+        payload={
+            "electricity": {
+                "data": [
+                    {
+                        "consumption": half_hour.consumption,
+                        "interval": {
+                            "start": half_hour.interval.start.isoformat(),
+                            "end": half_hour.interval.end.isoformat(),
+                        },
+                        "unit": half_hour.unit,
+                    }
+                    for half_hour in _half_hours(date(2024, 1, 2), 48)
+                ]
+            },
+            "gas": None,
+        },
+        repeat=True,
+    )
+    # Not available from the API yet
+    mock_aioresponse.get(
+        str(late_url), payload={"electricity": {"data": []}}, repeat=True
+    )
+
+    with OVOUsageStore() as store:
+        store.write_daily_usage(
+            ACCOUNT,
+            OVODailyUsage(
+                electricity=[
+                    _daily_electricity(date(2024, 1, day), True) for day in (1, 2, 3)
+                ],
+                gas=None,
+            ),
+        )
+        store.write_half_hourly_usage(
+            ACCOUNT,
+            date(2024, 1, 1),
+            OVOHalfHourUsage(electricity=_half_hours(date(2024, 1, 1), 48), gas=None),
+        )
+
+        remaining = await ovoenergy_client.backfill_half_hourly(
+            store, date(2024, 1, 1), date(2024, 1, 3), limit=1
+        )
+
+        assert len(mock_aioresponse.requests[("GET", late_url)]) == 1
+        assert ("GET", filled_url) not in mock_aioresponse.requests
+        assert [gap.day for gap in remaining] == [date(2024, 1, 3), date(2024, 1, 2)]
+
+        remaining = await ovoenergy_client.backfill_half_hourly(
+            store, date(2024, 1, 1), date(2024, 1, 3)
+        )
+
+        assert len(mock_aioresponse.requests[("GET", late_url)]) == 2
+        assert len(mock_aioresponse.requests[("GET", filled_url)]) == 1
+        assert remaining == [
+            OVOHalfHourGap(ACCOUNT, "electricity", date(2024, 1, 3), 48, 0)
+        ]
+        # The day already stored is never requested
+        assert (
+            "GET",
+            URL(f"{USAGE_HALF_HOURLY_URL}/{ACCOUNT}?date=2024-01-01"),
+        ) not in mock_aioresponse.requests
+        assert store.get_fetched(ACCOUNT, "half_hourly").keys() == {
+            "2024-01-02",
+            "2024-01-03",
+        }
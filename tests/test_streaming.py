@@ -0,0 +1,140 @@
+"""Tests for the streaming module."""
+
+import json
+
+from aioresponses import aioresponses
+import pytest
+
+from ovoenergy import OVOEnergy
+from ovoenergy.const import USAGE_HALF_HOURLY_URL
+from ovoenergy.exceptions import OVOEnergyAPIInvalidResponse, OVOEnergyAPIServerError
+from ovoenergy.models import OVODailyElectricity, OVODailyGas, OVOHalfHour
+from ovoenergy.streaming import OVOUsageRowParser
+
+from . import (
+    ACCOUNT,
+    PASSWORD,
+    RESPONSE_JSON_DAILY_USAGE,
+    RESPONSE_JSON_HALF_HOURLY_USAGE,
+    USERNAME,
+)
+
+BODY = json.dumps(
+    {
+        "meta": {"cursor": ["}", "]"]},
+        "electricity": {
+            "prev": 12345,
+            "data": [{"consumption": 1.5, "unit": 'k"Wh]'}, None, {"n": 2}],
+            "next": None,
+        },
+        "gas": None,
+        "other": {"data": [{"skipped": True}]},
+        "count": 12345,
+    },
+    ensure_ascii=False,
+).encode()
+
+ROWS = [
+    ("electricity", {"consumption": 1.5, "unit": 'k"Wh]'}),
+    ("electricity", {"n": 2}),
+]
+
+
+def _parse(body: bytes, chunk_size: int) -> list:
+    """Feed a body to a parser in chunks."""
+    parser = OVOUsageRowParser()
+    rows = []
+    for index in range(0, len(body), chunk_size):
+        rows.extend(parser.feed(body[index : index + chunk_size]))
+    rows.extend(parser.close())
+    return rows
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+def test_parser_chunks(chunk_size: int) -> None:
+    """Test rows parse the same however the body is split."""
+    assert _parse(BODY, chunk_size) == ROWS
+
+
+def test_parser_multibyte() -> None:
+    """Test characters split across chunks are decoded."""
+    body = json.dumps({"gas": {"data": [{"unit": "m³"}]}}, ensure_ascii=False).encode()
+    assert _parse(body, 1) == [("gas", {"unit": "m³"})]
+
+
+def test_parser_yields_rows_early() -> None:
+    """Test rows are returned as soon as they are complete."""
+    parser = OVOUsageRowParser()
+    assert parser.feed(b'{"electricity": {"data": [{"a": 1}, {"a"') == [
+        ("electricity", {"a": 1})
+    ]
+    assert parser.feed(b": 2}]}}") == [("electricity", {"a": 2})]
+    assert parser.close() == []
+    assert parser.done
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b'{"electricity": {"data": [{"a": 1}', b"[]", b'{"gas": {"data": [1 2]}}'],
+)
+def test_parser_invalid(body: bytes) -> None:
+    """Test truncated and malformed bodies raise."""
+    with pytest.raises(OVOEnergyAPIInvalidResponse):
+        _parse(body, 4)
+
+
+@pytest.mark.asyncio
+async def test_stream_half_hourly_usage(ovoenergy_client: OVOEnergy) -> None:
+    """Test streamed half hourly rows match the buffered response."""
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    rows = [
+        row
+        async for row in ovoenergy_client.stream_half_hourly_usage(
+            "2024-01-01", chunk_size=16
+        )
+    ]
+    usage = await ovoenergy_client.get_half_hourly_usage("2024-01-01")
+
+    assert len(rows) == len(RESPONSE_JSON_HALF_HOURLY_USAGE["electricity"]["data"]) * 2
+    assert rows == [
+        *(("electricity", row) for row in usage.electricity),
+        *(("gas", row) for row in usage.gas),
+    ]
+    assert all(isinstance(row, OVOHalfHour) for _, row in rows)
+
+
+@pytest.mark.asyncio
+async def test_stream_daily_usage(ovoenergy_client: OVOEnergy) -> None:
+    """Test streamed daily rows are parsed with the model for their fuel."""
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+
+    rows = [row async for row in ovoenergy_client.stream_daily_usage("2024-01")]
+    usage = await ovoenergy_client.get_daily_usage("2024-01")
+
+    assert len(rows) == len(RESPONSE_JSON_DAILY_USAGE["electricity"]["data"]) * 2
+    assert rows == [
+        *(("electricity", row) for row in usage.electricity),
+        *(("gas", row) for row in usage.gas),
+    ]
+    assert isinstance(rows[0][1], OVODailyElectricity)
+    assert isinstance(rows[-1][1], OVODailyGas)
+
+
+@pytest.mark.asyncio
+async def test_stream_server_error(
+    ovoenergy_client: OVOEnergy,
+    mock_aioresponse: aioresponses,
+) -> None:
+    """Test error statuses raise before any rows are yielded."""
+    await ovoenergy_client.authenticate(USERNAME, PASSWORD)
+    ovoenergy_client._retry_policy.retries = 0
+
+    mock_aioresponse.clear()
+    mock_aioresponse.get(
+        f"{USAGE_HALF_HOURLY_URL}/{ACCOUNT}?date=2024-01-02", status=500
+    )
+
+    with pytest.raises(OVOEnergyAPIServerError):
+        async for _ in ovoenergy_client.stream_half_hourly_usage("2024-01-02"):
+            pass
@@ -0,0 +1,142 @@
+"""Tests for the tariff module."""
+
+from datetime import UTC, date, datetime, timedelta
+import math
+
+import pytest
+
+from ovoenergy.decoders import parse_plans
+from ovoenergy.models.columnar import OVOHalfHourSeries
+from ovoenergy.models.tariff import OVOTariff
+from ovoenergy.tariff import cost_rollup, slot_costs, tariff_from_plan
+
+from . import RESPONSE_JSON_PLANS
+
+ECONOMY_7 = OVOTariff(
+    currency_unit="GBP",
+    unit_rate=0.3,
+    standing_charge=0.5,
+    off_peak_rate=0.1,
+)
+
+
+def _series(
+    start: datetime,
+    slots: int,
+    value: float = 1.0,
+    unit: str = "kWh",
+) -> OVOHalfHourSeries:
+    """Return a series of slots with the same consumption."""
+    series = OVOHalfHourSeries()
+    for slot in range(slots):
+        series.append(start + timedelta(minutes=30 * slot), value, unit)
+    return series
+
+
+def test_tariff_from_plan() -> None:
+    """Test tariffs pick up peak and off peak rates from plans."""
+    plans = parse_plans(RESPONSE_JSON_PLANS)
+
+    electricity = tariff_from_plan(plans.electricity[0])
+    assert electricity == OVOTariff(
+        currency_unit="GBP",
+        unit_rate=0.3,
+        standing_charge=0.5,
+        off_peak_rate=0.15,
+    )
+
+    assert plans.gas is not None
+    gas = tariff_from_plan(plans.gas[0])
+    assert gas.unit_rate == 0.07
+    assert gas.off_peak_rate is None
+
+    plans.gas[0].unit_rates = []
+    with pytest.raises(ValueError):
+        tariff_from_plan(plans.gas[0])
+
+
+@pytest.mark.usefixtures("with_numpy")
+def test_slot_costs() -> None:
+    """Test off peak rates follow the local clock across DST."""
+    winter = _series(datetime(2024, 1, 1, 0, tzinfo=UTC), 2)
+    # 00:00 is peak and 00:30 off peak in GMT
+    assert slot_costs(winter, ECONOMY_7).tolist() == [0.3, 0.1]
+
+    summer = _series(datetime(2024, 6, 30, 23, tzinfo=UTC), 2)
+    # 23:00 UTC is 00:00 BST, so the same local slots apply
+    assert slot_costs(summer, ECONOMY_7).tolist() == [0.3, 0.1]
+
+    missing = OVOHalfHourSeries()
+    missing.append(datetime(2024, 1, 1, 12, tzinfo=UTC), None, "kWh")
+    assert math.isnan(slot_costs(missing, ECONOMY_7)[0])
+
+    flat = OVOTariff(currency_unit="GBP", unit_rate=0.25, standing_charge=0.4)
+    assert slot_costs(winter, flat).tolist() == [0.25, 0.25]
+
+
+@pytest.mark.usefixtures("with_numpy")
+def test_slot_costs_overnight_window() -> None:
+    """Test off peak windows that wrap past midnight."""
+    overnight = OVOTariff(
+        currency_unit="GBP",
+        unit_rate=0.3,
+        standing_charge=0.5,
+        off_peak_rate=0.1,
+        off_peak_start=datetime(2024, 1, 1, 23, 0).time(),
+        off_peak_end=datetime(2024, 1, 1, 1, 0).time(),
+    )
+    series = _series(datetime(2024, 1, 1, 22, 30, tzinfo=UTC), 6)
+
+    assert slot_costs(series, overnight).tolist() == [0.3, 0.1, 0.1, 0.1, 0.1, 0.3]
+
+
+@pytest.mark.usefixtures("with_numpy")
+def test_cost_rollup() -> None:
+    """Test unit costs and standing charges roll up by period."""
+    series = _series(datetime(2024, 1, 1, tzinfo=UTC), 96)
+
+    days = cost_rollup(series, ECONOMY_7, "day")
+    # 14 off peak slots (00:30-07:30) and 34 peak slots a day
+    assert days.unit_costs[date(2024, 1, 1)] == pytest.approx(14 * 0.1 + 34 * 0.3)
+    assert days.standing_charges == {date(2024, 1, 1): 0.5, date(2024, 1, 2): 0.5}
+    assert days.totals[date(2024, 1, 2)] == pytest.approx(12.1)
+
+    month = cost_rollup(series, ECONOMY_7, "month")
+    assert month.standing_charges == {date(2024, 1, 1): 1.0}
+    assert month.totals[date(2024, 1, 1)] == pytest.approx(24.2)
+    assert month.currency_unit == "GBP"
+
+    hours = cost_rollup(series, ECONOMY_7, "hour")
+    assert hours.standing_charges == {}
+    assert len(hours.totals) == 48
+
+
+@pytest.mark.usefixtures("with_numpy")
+def test_slot_costs_gas_volume() -> None:
+    """Test gas volumes are converted to kWh with a calorific value."""
+    flat = OVOTariff(currency_unit="GBP", unit_rate=0.07, standing_charge=0.3)
+    series = _series(datetime(2024, 1, 1, tzinfo=UTC), 2, 1.0, "m³")
+
+    # 1 m³ at 39.5 MJ/m³ is 1.02264 * 39.5 / 3.6 kWh
+    kwh = 1.02264 * 39.5 / 3.6
+    assert slot_costs(series, flat, calorific_value=39.5).tolist() == pytest.approx(
+        [kwh * 0.07] * 2
+    )
+    assert cost_rollup(
+        series, ECONOMY_7, "day", calorific_value=39.5
+    ).unit_costs == pytest.approx({date(2024, 1, 1): kwh * (0.3 + 0.1)})
+
+
+@pytest.mark.usefixtures("with_numpy")
+def test_slot_costs_unit_not_kwh() -> None:
+    """Test consumption not in kWh is never costed silently."""
+    flat = OVOTariff(currency_unit="GBP", unit_rate=0.07, standing_charge=0.3)
+
+    with pytest.raises(ValueError, match="calorific value"):
+        slot_costs(_series(datetime(2024, 1, 1, tzinfo=UTC), 2, 1.0, "m³"), flat)
+    with pytest.raises(ValueError, match="calorific value"):
+        cost_rollup(
+            _series(datetime(2024, 1, 1, tzinfo=UTC), 2, 1.0, "m³"), flat, "day"
+        )
+    with pytest.raises(ValueError, match="Cannot cost consumption in 'ft³'"):
+        slot_costs(_series(datetime(2024, 1, 1, tzinfo=UTC), 2, 1.0, "ft³"), flat)